@@ -0,0 +1,220 @@
+"""
+Gemini Agent Base - Shared plumbing for the LLM-backed agents
+Single place for client setup, response caching and concurrency limits
+"""
+
+import os
+import json
+import time
+import asyncio
+import threading
+import weakref
+import httpx
+from typing import Optional
+from google import genai
+from google.genai import types, errors
+from utils.logger import setup_logger
+from utils.llm_cache import LLMCache, get_llm_cache
+from utils.gemini_client import get_client
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser handles the same payloads
+    json_loads = json.loads
+
+logger = setup_logger('GeminiAgent')
+
+MAX_RETRIES = max(1, int(os.getenv('MAX_RETRIES', 3)))
+# Bounds in-flight async Gemini calls per agent to stay under rate limits
+GEMINI_CONCURRENCY = int(os.getenv('GEMINI_CONCURRENCY', 8))
+# Lifetime of the explicit Gemini context cache holding each agent's system instruction.
+# 0 disables explicit caching: the instruction is sent inline (implicit prefix caching still applies)
+CONTEXT_CACHE_TTL = int(os.getenv('CONTEXT_CACHE_TTL', 0))
+# Extend the context cache's TTL once it is this close to expiring
+_CONTEXT_CACHE_REFRESH_MARGIN = 300
+# Rate limiting (429) and transient server errors are worth retrying; other API errors are not
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed Gemini call should be retried"""
+    if isinstance(error, (TimeoutError, httpx.TimeoutException)):
+        return True
+    return isinstance(error, errors.APIError) and error.code in _RETRYABLE_STATUS_CODES
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff: 0.5s, 1s, 2s, ... capped at 8s"""
+    return min(0.5 * 2 ** attempt, 8.0)
+
+
+class GeminiAgentBase:
+    """
+    Base class for agents that call Gemini
+    Provides the shared client, model selection, LLM cache lookups and an
+    asyncio.Semaphore per event loop that bounds concurrent Gemini requests
+    """
+
+    # Static instructions shared by every call this agent makes; set by subclasses
+    system_instruction: Optional[str] = None
+
+    def __init__(self, name: str, model_name: str, client: Optional[genai.Client] = None):
+        """
+        Initialize the Gemini client and model settings
+
+        Args:
+            name: Display name of the agent
+            model_name: Gemini model this agent calls
+            client: Gemini client to use; defaults to the process-wide shared client
+        """
+        self.name = name
+
+        # Shared Gemini client (one connection pool for all agents)
+        self.client = client or get_client()
+        self.model_name = model_name
+
+        # A semaphore is bound to the loop it is first contended in, and each
+        # asyncio.run() in the orchestrator starts a new loop (see _loop_semaphore)
+        self._sems = weakref.WeakKeyDictionary()
+
+        # Explicit context cache for the system instruction (see _context_cache)
+        self._context_cache_name = None
+        self._context_cache_expires_at = 0.0
+        self._context_cache_disabled = CONTEXT_CACHE_TTL <= 0
+        self._context_cache_lock = threading.Lock()
+
+        logger.info(f"✅ {self.name} initialized with model: {self.model_name}")
+
+    def _generate_text(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Call Gemini for a prompt, serving repeated requests from the LLM cache"""
+        cache_key = self._llm_cache_key(prompt, config)
+        cached_text = get_llm_cache().get(cache_key)
+        if cached_text is not None:
+            logger.info("♻️ Using cached Gemini response")
+            return cached_text
+
+        config = self._with_system_instruction(config)
+        text = self._call_with_retries(prompt, config)
+        get_llm_cache().set(cache_key, text)
+        return text
+
+    async def _generate_text_async(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Async variant of _generate_text() using the Gemini async client"""
+        cache_key = self._llm_cache_key(prompt, config)
+        # SQLite lookups and stores run off the event loop so other companies aren't held up
+        cached_text = await asyncio.to_thread(get_llm_cache().get, cache_key)
+        if cached_text is not None:
+            logger.info("♻️ Using cached Gemini response")
+            return cached_text
+
+        # Only blocks when the context cache has to be created or refreshed
+        config = await asyncio.to_thread(self._with_system_instruction, config)
+        async with self._loop_semaphore():
+            text = await self._call_with_retries_async(prompt, config)
+        await asyncio.to_thread(get_llm_cache().set, cache_key, text)
+        return text
+
+    def _loop_semaphore(self) -> asyncio.Semaphore:
+        """The semaphore bounding this agent's Gemini calls in the running event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._sems.get(loop)
+        if semaphore is None:
+            semaphore = self._sems[loop] = asyncio.Semaphore(GEMINI_CONCURRENCY)
+        return semaphore
+
+    def _llm_cache_key(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """LLM cache key covering the system instruction as well as the prompt"""
+        return LLMCache.make_key(
+            self.model_name, prompt, config.temperature, config.max_output_tokens, self.system_instruction
+        )
+
+    def _with_system_instruction(self, config: types.GenerateContentConfig) -> types.GenerateContentConfig:
+        """Attach the system instruction, by context cache reference when one is available"""
+        if not self.system_instruction:
+            return config
+
+        cache_name = self._context_cache()
+        if cache_name:
+            return config.model_copy(update={'cached_content': cache_name})
+        return config.model_copy(update={'system_instruction': self.system_instruction})
+
+    def _context_cache(self) -> Optional[str]:
+        """
+        Return the name of the explicit context cache holding the system instruction
+        The cache is created on first use and its TTL is extended as it nears expiry.
+        Returns None (and stops trying) if caching is disabled or unavailable.
+        """
+        if self._context_cache_disabled:
+            return None
+
+        with self._context_cache_lock:
+            now = time.time()
+            if self._context_cache_name and now < self._context_cache_expires_at - _CONTEXT_CACHE_REFRESH_MARGIN:
+                return self._context_cache_name
+
+            ttl = f"{CONTEXT_CACHE_TTL}s"
+            try:
+                if self._context_cache_name:
+                    self.client.caches.update(
+                        name=self._context_cache_name,
+                        config=types.UpdateCachedContentConfig(ttl=ttl)
+                    )
+                else:
+                    cache = self.client.caches.create(
+                        model=self.model_name,
+                        config=types.CreateCachedContentConfig(system_instruction=self.system_instruction, ttl=ttl)
+                    )
+                    self._context_cache_name = cache.name
+                    logger.info(f"🧊 Created Gemini context cache for {self.name}: {cache.name}")
+            except Exception as e:
+                # e.g. the instruction is below the model's minimum cacheable size
+                logger.warning(f"⚠️ Context caching unavailable for {self.name} ({e}), sending instructions inline")
+                self._context_cache_name = None
+                self._context_cache_disabled = True
+                return None
+
+            self._context_cache_expires_at = now + CONTEXT_CACHE_TTL
+            return self._context_cache_name
+
+    def _call_with_retries(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Call Gemini, retrying timeouts and rate limits with exponential backoff"""
+        for attempt in range(MAX_RETRIES):
+            try:
+                return self._call_model(prompt, config)
+            except Exception as e:
+                if attempt == MAX_RETRIES - 1 or not _is_retryable(e):
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"⚠️ Gemini call failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    async def _call_with_retries_async(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Async variant of _call_with_retries()"""
+        for attempt in range(MAX_RETRIES):
+            try:
+                return await self._call_model_async(prompt, config)
+            except Exception as e:
+                if attempt == MAX_RETRIES - 1 or not _is_retryable(e):
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"⚠️ Gemini call failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    def _call_model(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Make the Gemini request and return the response text"""
+        response = self.client.models.generate_content(
+            model=self.model_name,
+            contents=prompt,
+            config=config
+        )
+        return response.text
+
+    async def _call_model_async(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Async variant of _call_model()"""
+        response = await self.client.aio.models.generate_content(
+            model=self.model_name,
+            contents=prompt,
+            config=config
+        )
+        return response.text
@@ -3,15 +3,69 @@ Analysis Agent - Analyzes company data to identify business challenges
 Uses Gemini LLM to perform deep analysis (Bonus points!)
 """
 
+import io
 import os
-from typing import Dict
+import re
+import json
+import bisect
+import asyncio
+from typing import Dict, Iterator, List, Optional, Tuple
 from google import genai
 from google.genai import types
 from utils.logger import setup_logger, log_agent_start, log_agent_complete, log_agent_error
+from utils.llm_cache import get_llm_cache
+from utils.memory import company_key
+from utils.types import AnalysisResult, ResearchResult
+from agents._gemini_base import GeminiAgentBase, json_loads
 
 logger = setup_logger('AnalysisAgent')
 
-class AnalysisAgent:
+# Structured extraction doesn't need the creative model - use the faster, cheaper one
+MODEL_NAME = os.getenv('MODEL_NAME_FAST', 'gemini-2.0-flash-lite')
+
+# Report sections: JSON key in the structured response -> display header
+_SECTIONS = {
+    'challenges': "KEY BUSINESS CHALLENGES",
+    'opportunities': "OPPORTUNITIES",
+    'approach': "RECOMMENDED SALES APPROACH",
+}
+# Used to report progress while the JSON analysis streams in
+_SECTION_KEY_RE = re.compile('|'.join(f'"{key}"' for key in _SECTIONS))
+_MAX_KEY_LEN = max(len(key) for key in _SECTIONS) + 2
+_SECTION_SCHEMA_PROPERTIES = {
+    'challenges': types.Schema(type=types.Type.ARRAY, items=types.Schema(type=types.Type.STRING)),
+    'opportunities': types.Schema(type=types.Type.ARRAY, items=types.Schema(type=types.Type.STRING)),
+    'approach': types.Schema(type=types.Type.STRING),
+}
+
+# Batched analysis: companies are binned so each prompt and response stays a manageable size
+MAX_BATCH_COMPANIES = 5
+MAX_BATCH_CONTEXT_CHARS = 12000
+# Upper bounds (estimated tokens) of the length classes companies are sorted into before
+# batching, so short contexts aren't held up behind long ones in the same call
+BATCH_TOKEN_BUCKETS = (500, 2000)
+
+DEFAULT_APPROACH = "Approach with value-focused messaging"
+
+# Industry-level analyses used instead of Gemini when a company's news is only boilerplate
+INDUSTRY_TEMPLATES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'configs', 'industry_analysis.json')
+# Minimum word overlap (Jaccard) for a news item to count as a known generic headline
+GENERIC_NEWS_SIMILARITY = 0.6
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Static part of every analysis prompt, sent as the system instruction
+SYSTEM_INSTRUCTION = """
+You are a business intelligence analyst helping a sales team understand potential clients.
+
+For each company you analyze, provide:
+- "challenges": 3-5 main business challenges this company likely faces
+- "opportunities": How our solutions could help address these challenges
+- "approach": A short paragraph on what angles to emphasize in outreach
+
+Be specific and actionable. Focus on insights that would help a sales team engage effectively.
+"""
+
+class AnalysisAgent(GeminiAgentBase):
     """
     Agent responsible for analyzing company data to identify:
     - Key business challenges
@@ -20,36 +74,33 @@ class AnalysisAgent:
     Uses Gemini LLM for intelligent analysis
     """
     
-    def __init__(self):
+    system_instruction = SYSTEM_INSTRUCTION
+    
+    def __init__(self, client: Optional[genai.Client] = None):
         """Initialize the analysis agent with Gemini client"""
-        self.name = "Analysis Agent"
-        
-        # Initialize Gemini client
-        api_key = os.getenv('GOOGLE_API_KEY')
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found in environment variables")
-        
-        self.client = genai.Client(api_key=api_key)
-        self.model_name = os.getenv('MODEL_NAME', 'gemini-2.0-flash-exp')
-        
-        logger.info(f"✅ {self.name} initialized with model: {self.model_name}")
+        super().__init__("Analysis Agent", MODEL_NAME, client)
+        self._industry_templates = self._load_industry_templates()
     
-    def execute(self, research_data: Dict) -> Dict:
+    def execute(self, research_data: ResearchResult) -> AnalysisResult:
         """
         Analyze company research data to identify business insights
         
         Args:
-            research_data: Dictionary containing company research from ResearchAgent
+            research_data: Company research from ResearchAgent
             
         Returns:
-            Dictionary containing analysis results
+            Analysis results
         """
-        log_agent_start(self.name, {'company': research_data.get('company_name')})
+        log_agent_start(self.name, {'company': research_data.company_name})
         
         try:
-            company_name = research_data.get('company_name')
-            company_info = research_data.get('company_info', {})
-            recent_news = research_data.get('recent_news', [])
+            company_name = research_data.company_name
+            company_info = research_data.company_info
+            recent_news = research_data.recent_news
+            
+            templated = self._templated_analysis(research_data)
+            if templated is not None:
+                return templated
             
             # Prepare context for LLM analysis
             context = self._prepare_analysis_context(company_name, company_info, recent_news)
@@ -60,45 +111,412 @@ class AnalysisAgent:
             # Call Gemini API for analysis
             logger.info(f"🤖 Calling Gemini API for analysis of {company_name}")
             
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.7,
-                    max_output_tokens=2000,
-                )
+            response_text = self._generate_text(prompt, self._generation_config())
+            
+            return self._build_analysis_data(company_name, json_loads(response_text))
+            
+        except Exception as e:
+            log_agent_error(self.name, e)
+            return AnalysisResult(research_data.company_name, analysis_status='failed', error=str(e))
+    
+    async def execute_async(self, research_data: ResearchResult) -> AnalysisResult:
+        """
+        Async variant of execute() using the Gemini async client
+        
+        Lets the orchestrator overlap this LLM call with other network-bound work.
+        
+        Args:
+            research_data: Company research from ResearchAgent
+            
+        Returns:
+            Analysis results
+        """
+        log_agent_start(self.name, {'company': research_data.company_name})
+        
+        try:
+            company_name = research_data.company_name
+            company_info = research_data.company_info
+            recent_news = research_data.recent_news
+            
+            templated = self._templated_analysis(research_data)
+            if templated is not None:
+                return templated
+            
+            context = self._prepare_analysis_context(company_name, company_info, recent_news)
+            prompt = self._create_analysis_prompt(context)
+            
+            logger.info(f"🤖 Calling Gemini API (async) for analysis of {company_name}")
+            
+            response_text = await self._generate_text_async(prompt, self._generation_config())
+            
+            return self._build_analysis_data(company_name, json_loads(response_text))
+            
+        except Exception as e:
+            log_agent_error(self.name, e)
+            return AnalysisResult(research_data.company_name, analysis_status='failed', error=str(e))
+    
+    def execute_stream(self, research_data: ResearchResult) -> Iterator[Tuple[str, object]]:
+        """
+        Streaming variant of execute() for callers that report partial progress
+        
+        Yields ('section', header) as each report section starts streaming in,
+        then a final ('result', analysis_data). Cached and templated analyses
+        yield only the result. Streamed calls are not retried, since partial
+        output has already been yielded.
+        
+        Args:
+            research_data: Company research from ResearchAgent
+        """
+        log_agent_start(self.name, {'company': research_data.company_name})
+        
+        try:
+            company_name = research_data.company_name
+            
+            templated = self._templated_analysis(research_data)
+            if templated is not None:
+                yield 'result', templated
+                return
+            
+            context = self._prepare_analysis_context(
+                company_name,
+                research_data.company_info,
+                research_data.recent_news
             )
+            prompt = self._create_analysis_prompt(context)
+            config = self._generation_config()
             
-            # Extract analysis from response
-            analysis_text = response.text
-            
-            # Structure the analysis results
-            analysis_data = {
-                'company_name': company_name,
-                'analysis': analysis_text,
-                'key_challenges': self._extract_challenges(analysis_text),
-                'opportunities': self._extract_opportunities(analysis_text),
-                'recommended_approach': self._extract_approach(analysis_text),
-                'analysis_status': 'completed'
-            }
-            
-            log_agent_complete(
-                self.name,
-                f"Completed analysis for {company_name} - found {len(analysis_data['key_challenges'])} challenges"
+            cache_key = self._llm_cache_key(prompt, config)
+            response_text = get_llm_cache().get(cache_key)
+            if response_text is None:
+                logger.info(f"🤖 Streaming Gemini analysis of {company_name}")
+                buffer, seen_sections, tail = io.StringIO(), set(), ''
+                for text in self._stream_chunks(prompt, self._with_system_instruction(config)):
+                    buffer.write(text)
+                    new_sections, tail = self._note_sections(tail + text, seen_sections)
+                    for header in new_sections:
+                        yield 'section', header
+                
+                response_text = buffer.getvalue()
+                get_llm_cache().set(cache_key, response_text)
+            
+            yield 'result', self._build_analysis_data(company_name, json_loads(response_text))
+            
+        except Exception as e:
+            log_agent_error(self.name, e)
+            yield 'result', AnalysisResult(research_data.company_name, analysis_status='failed', error=str(e))
+    
+    async def execute_batch_async(self, research_list: List[ResearchResult]) -> List[AnalysisResult]:
+        """
+        Analyze several companies with one Gemini call per bin of companies
+        
+        Companies are grouped by prompt size (see _batch_bins) and each bin is
+        analyzed in a single request, amortizing the per-call overhead.
+        
+        Args:
+            research_list: Research results from ResearchAgent, one per company
+            
+        Returns:
+            Analysis results in the same order as research_list
+        """
+        # Companies covered by an industry template never reach Gemini
+        results = [self._templated_analysis(research_data) for research_data in research_list]
+        remaining = [i for i, analysis_data in enumerate(results) if analysis_data is None]
+        if not remaining:
+            return results
+        
+        contexts = [
+            self._prepare_analysis_context(
+                research_list[i].company_name,
+                research_list[i].company_info,
+                research_list[i].recent_news
             )
+            for i in remaining
+        ]
+        
+        bins = self._batch_bins(contexts)
+        logger.info(f"🤖 Analyzing {len(remaining)} companies in {len(bins)} batched Gemini call(s)")
+        
+        bin_results = await asyncio.gather(*(
+            self._analyze_bin_async([research_list[remaining[i]] for i in indices], [contexts[i] for i in indices])
+            for indices in bins
+        ))
+        for indices, analyses in zip(bins, bin_results):
+            for i, analysis_data in zip(indices, analyses):
+                results[remaining[i]] = analysis_data
+        return results
+    
+    async def _analyze_bin_async(self, research_list: List[ResearchResult], contexts: List[str]) -> List[AnalysisResult]:
+        """Analyze one bin of companies in a single Gemini call"""
+        if len(research_list) == 1:
+            return [await self.execute_async(research_list[0])]
+        
+        company_names = [research_data.company_name for research_data in research_list]
+        log_agent_start(self.name, {'companies': company_names})
+        
+        try:
+            prompt = self._create_batch_analysis_prompt(contexts)
+            response_text = await self._generate_text_async(prompt, self._batch_generation_config(len(contexts)))
             
-            return analysis_data
+            return self._parse_batch_analysis(company_names, response_text)
             
         except Exception as e:
             log_agent_error(self.name, e)
-            return {
-                'company_name': research_data.get('company_name'),
-                'error': str(e),
-                'analysis_status': 'failed'
-            }
+            return [
+                AnalysisResult(company_name, analysis_status='failed', error=str(e))
+                for company_name in company_names
+            ]
+    
+    def _load_industry_templates(self) -> Dict:
+        """Load industry analysis templates keyed by (industry, size)"""
+        if not os.path.exists(INDUSTRY_TEMPLATES_PATH):
+            return {}
+        try:
+            with open(INDUSTRY_TEMPLATES_PATH, 'r') as f:
+                templates = json.load(f).get('templates', [])
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to load industry templates: {e}")
+            return {}
+        
+        return {(template['industry'], template['size']): template for template in templates}
+    
+    def _templated_analysis(self, research_data: ResearchResult) -> Optional[AnalysisResult]:
+        """
+        Return the industry template analysis when it applies, else None
+        
+        A template applies when the company's (industry, size) matches one and
+        there is recent news, every item of which is one of that template's
+        generic headlines. The 'industry' and 'size' fields are the normalized
+        labels ResearchAgent derives from the overview search.
+        """
+        company_info = research_data.company_info
+        template = self._industry_templates.get((company_info.get('industry'), company_info.get('size')))
+        if template is None:
+            return None
+        
+        company_name = research_data.company_name or ''
+        if not self._news_is_generic(company_name, research_data.recent_news, template['generic_news']):
+            return None
+        
+        logger.info(f"📋 Using {template['industry']} industry template for {company_name} (no Gemini call)")
+        sections = {
+            'challenges': template['key_challenges'],
+            'opportunities': template['opportunities'],
+            'approach': template['recommended_approach']
+        }
+        analysis_data = self._build_analysis_data(company_name, sections)
+        analysis_data.analysis_source = 'industry_template'
+        return analysis_data
+    
+    def _news_is_generic(self, company_name: str, recent_news: list, generic_news: list) -> bool:
+        """
+        Whether there is news and every item closely matches a known generic
+        headline (bag-of-words Jaccard). No news says nothing about the company,
+        so it is not treated as generic
+        
+        recent_news is either a news search result (whose result titles are
+        compared) or a plain list of headlines.
+        """
+        if isinstance(recent_news, dict):
+            recent_news = [result.get('title', '') for result in recent_news.get('results', [])]
+        if not recent_news:
+            return False
+        
+        name_words = set(_WORD_RE.findall(company_name.lower()))
+        generic_word_sets = [set(_WORD_RE.findall(headline.lower())) for headline in generic_news]
+        
+        for news in recent_news:
+            words = set(_WORD_RE.findall(str(news).lower())) - name_words
+            if not any(
+                len(words & generic) / len(words | generic) >= GENERIC_NEWS_SIMILARITY
+                for generic in generic_word_sets if words | generic
+            ):
+                return False
+        return True
+    
+    def _batch_bins(self, contexts: List[str]) -> List[List[int]]:
+        """
+        Group company contexts into bins that each fit one batched prompt
+        
+        Contexts are first classified by estimated token count (~4 chars per
+        token) into BATCH_TOKEN_BUCKETS length classes, so each call holds
+        companies of similar size. Within a class, a bin is closed once adding
+        the next company would exceed MAX_BATCH_CONTEXT_CHARS or MAX_BATCH_COMPANIES.
+        """
+        buckets = [[] for _ in range(len(BATCH_TOKEN_BUCKETS) + 1)]
+        for index, context in enumerate(contexts):
+            bucket = bisect.bisect_left(BATCH_TOKEN_BUCKETS, len(context) // 4)
+            buckets[bucket].append(index)
+        
+        bins = []
+        for bucket in buckets:
+            current, current_chars = [], 0
+            for index in bucket:
+                context_chars = len(contexts[index])
+                if current and (current_chars + context_chars > MAX_BATCH_CONTEXT_CHARS or len(current) >= MAX_BATCH_COMPANIES):
+                    bins.append(current)
+                    current, current_chars = [], 0
+                current.append(index)
+                current_chars += context_chars
+            
+            if current:
+                bins.append(current)
+        return bins
+    
+    def _parse_batch_analysis(self, company_names: List[str], response_text: str) -> List[AnalysisResult]:
+        """
+        Map the JSON array returned by Gemini back onto the companies
+        
+        Entries are matched by their 1-based "index", falling back to the
+        normalized company name. A company no entry matches is marked failed
+        rather than given another entry: the model may reorder the array.
+        """
+        generated = json_loads(response_text)
+        by_index, by_key = {}, {}
+        for item in generated:
+            index = item.get('index')
+            if isinstance(index, int) and 1 <= index <= len(company_names):
+                by_index.setdefault(index - 1, item)
+            elif item.get('company_name'):
+                by_key.setdefault(company_key(item['company_name']), item)
+        
+        results = []
+        for position, company_name in enumerate(company_names):
+            sections = by_index.get(position) or by_key.get(company_key(company_name))
+            
+            if sections is None:
+                results.append(AnalysisResult(
+                    company_name, analysis_status='failed', error="No analysis returned for company"
+                ))
+                continue
+            
+            results.append(self._build_analysis_data(company_name, sections))
+        
+        return results
+    
+    def _stream_chunks(self, prompt: str, config: types.GenerateContentConfig) -> Iterator[str]:
+        """Yield the text of each Gemini response chunk as it arrives"""
+        for chunk in self.client.models.generate_content_stream(
+            model=self.model_name,
+            contents=prompt,
+            config=config
+        ):
+            yield chunk.text or ''
+    
+    def _call_model(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Stream the Gemini response so sections are picked up as they are generated"""
+        buffer, seen_sections, tail = io.StringIO(), set(), ''
+        for text in self._stream_chunks(prompt, config):
+            buffer.write(text)
+            _, tail = self._note_sections(tail + text, seen_sections)
+        
+        return buffer.getvalue()
+    
+    async def _call_model_async(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Async variant of _call_model() using the Gemini async client"""
+        buffer, seen_sections, tail = io.StringIO(), set(), ''
+        async for chunk in await self.client.aio.models.generate_content_stream(
+            model=self.model_name,
+            contents=prompt,
+            config=config
+        ):
+            text = chunk.text or ''
+            buffer.write(text)
+            _, tail = self._note_sections(tail + text, seen_sections)
+        
+        return buffer.getvalue()
+    
+    def _note_sections(self, window: str, seen_sections: set) -> Tuple[List[str], str]:
+        """
+        Log each report section the first time its JSON key streams in
+        
+        Args:
+            window: Unscanned tail of the previous chunk plus the new chunk
+            seen_sections: Keys already reported for this response
+            
+        Returns:
+            (headers of newly seen sections, tail to prepend to the next chunk
+            so keys split across chunks are found)
+        """
+        new_sections = []
+        for match in _SECTION_KEY_RE.finditer(window):
+            key = match.group(0).strip('"')
+            if key not in seen_sections:
+                seen_sections.add(key)
+                logger.info(f"📥 Receiving {_SECTIONS[key]} section")
+                new_sections.append(_SECTIONS[key])
+        return new_sections, window[-(_MAX_KEY_LEN - 1):]
+    
+    def _generation_config(self) -> types.GenerateContentConfig:
+        """Generation settings shared by the sync and async analysis calls, forcing a JSON response"""
+        return types.GenerateContentConfig(
+            temperature=0.7,
+            max_output_tokens=1000,  # The three sections rarely exceed ~600 tokens
+            response_mime_type="application/json",
+            response_schema=types.Schema(
+                type=types.Type.OBJECT,
+                properties=_SECTION_SCHEMA_PROPERTIES,
+                required=list(_SECTIONS)
+            )
+        )
+    
+    def _batch_generation_config(self, num_companies: int) -> types.GenerateContentConfig:
+        """Generation settings for a batched analysis call, forcing a JSON array response"""
+        return types.GenerateContentConfig(
+            temperature=0.7,
+            max_output_tokens=1000 * num_companies,
+            response_mime_type="application/json",
+            response_schema=types.Schema(
+                type=types.Type.ARRAY,
+                items=types.Schema(
+                    type=types.Type.OBJECT,
+                    properties={
+                        'index': types.Schema(type=types.Type.INTEGER),
+                        'company_name': types.Schema(type=types.Type.STRING),
+                        **_SECTION_SCHEMA_PROPERTIES
+                    },
+                    required=['index', 'company_name', *_SECTIONS]
+                )
+            )
+        )
+    
+    def _build_analysis_data(self, company_name: str, sections: Dict) -> AnalysisResult:
+        """Structure the parsed Gemini analysis sections into the analysis results"""
+        challenges = sections.get('challenges', [])[:5]
+        opportunities = sections.get('opportunities', [])[:5]
+        approach = sections.get('approach') or DEFAULT_APPROACH
+        
+        analysis_data = AnalysisResult(
+            company_name,
+            analysis=self._format_analysis(challenges, opportunities, approach),
+            key_challenges=challenges,
+            opportunities=opportunities,
+            recommended_approach=approach
+        )
+        
+        log_agent_complete(
+            self.name,
+            f"Completed analysis for {company_name} - found {len(analysis_data.key_challenges)} challenges"
+        )
+        
+        return analysis_data
+    
+    def _format_analysis(self, challenges: list, opportunities: list, approach: str) -> str:
+        """Render the structured sections as readable text for the report"""
+        challenge_lines = "\n".join([f"{i}. {item}" for i, item in enumerate(challenges, 1)])
+        opportunity_lines = "\n".join([f"{i}. {item}" for i, item in enumerate(opportunities, 1)])
+        
+        return (
+            f"{_SECTIONS['challenges']}\n{challenge_lines}\n\n"
+            f"{_SECTIONS['opportunities']}\n{opportunity_lines}\n\n"
+            f"{_SECTIONS['approach']}\n{approach}"
+        )
     
     def _prepare_analysis_context(self, company_name: str, company_info: Dict, recent_news: list) -> str:
         """Prepare context string for analysis"""
+        # Joined up front: backslashes aren't allowed inside f-string expressions
+        news_lines = "\n".join([f"- {news}" for news in recent_news])
+        fact_lines = "\n".join([f"- {fact}" for fact in company_info.get('key_facts', [])])
+        
         context = f"""
 Company: {company_name}
 
@@ -110,61 +528,41 @@ Company Information:
 - Overview: {company_info.get('overview', 'N/A')}
 
 Recent News:
-{chr(10).join(f'- {news}' for news in recent_news)}
+{news_lines}
 
 Key Facts:
-{chr(10).join(f'- {fact}' for fact in company_info.get('key_facts', []))}
+{fact_lines}
 """
         return context
     
     def _create_analysis_prompt(self, context: str) -> str:
         """Create the prompt for Gemini analysis"""
         prompt = f"""
-You are a business intelligence analyst helping a sales team understand a potential client.
-
 Based on the following company information, provide a detailed analysis:
 
 {context}
 
-Please provide:
+Respond with a JSON object containing "challenges", "opportunities" and "approach".
+"""
+        return prompt
+    
+    def _create_batch_analysis_prompt(self, contexts: List[str]) -> str:
+        """Create one prompt that asks Gemini to analyze several companies"""
+        company_blocks = "\n---\n".join(
+            f"[Company {index}]\n{context}" for index, context in enumerate(contexts, start=1)
+        )
+        
+        prompt = f"""
+Based on the following information about {len(contexts)} companies, provide a detailed analysis of each:
 
-1. KEY BUSINESS CHALLENGES (3-5 main challenges this company likely faces)
-2. OPPORTUNITIES (How our solutions could help address these challenges)
-3. RECOMMENDED SALES APPROACH (What angles to emphasize in outreach)
+{company_blocks}
 
-Format your response clearly with these three sections.
-Be specific and actionable. Focus on insights that would help a sales team engage effectively.
+Respond with a JSON array containing one object per company, each with "index" (the
+number in the company's [Company N] header), "company_name" (the company name exactly as
+given above), "challenges", "opportunities" and "approach".
 """
         return prompt
     
-    def _extract_challenges(self, analysis_text: str) -> list:
-        """Extract key challenges from analysis (simple parsing)"""
-        # Simple extraction - in production, use more sophisticated parsing
-        challenges = []
-        if "KEY BUSINESS CHALLENGES" in analysis_text:
-            section = analysis_text.split("KEY BUSINESS CHALLENGES")[1].split("OPPORTUNITIES")[0]
-            lines = [line.strip() for line in section.split('\n') if line.strip() and not line.strip().startswith('#')]
-            challenges = [line.lstrip('123456789.-) ') for line in lines if line.strip()][:5]
-        return challenges
-    
-    def _extract_opportunities(self, analysis_text: str) -> list:
-        """Extract opportunities from analysis"""
-        opportunities = []
-        if "OPPORTUNITIES" in analysis_text:
-            section = analysis_text.split("OPPORTUNITIES")[1].split("RECOMMENDED")[0]
-            lines = [line.strip() for line in section.split('\n') if line.strip() and not line.strip().startswith('#')]
-            opportunities = [line.lstrip('123456789.-) ') for line in lines if line.strip()][:5]
-        return opportunities
-    
-    def _extract_approach(self, analysis_text: str) -> str:
-        """Extract recommended approach from analysis"""
-        if "RECOMMENDED SALES APPROACH" in analysis_text:
-            section = analysis_text.split("RECOMMENDED SALES APPROACH")[1]
-            # Get first substantial paragraph
-            lines = [line.strip() for line in section.split('\n') if line.strip() and not line.strip().startswith('#')]
-            return ' '.join(lines[:3]) if lines else "Approach with value-focused messaging"
-        return "Approach with value-focused messaging"
-    
     def get_agent_description(self) -> str:
         """Return description of what this agent does"""
         return (
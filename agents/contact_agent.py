@@ -3,12 +3,31 @@ Contact Agent - Finds key decision makers at target company
 Third agent in the sequential pipeline
 """
 
-from typing import Dict, List
+import re
+import heapq
+from operator import itemgetter
+from typing import Dict, List, Optional
 from tools.search_tool import GoogleSearchTool
 from utils.logger import setup_logger, log_agent_start, log_agent_complete, log_agent_error
+from utils.types import AnalysisResult, ContactResult
 
 logger = setup_logger('ContactAgent')
 
+# Title keywords per scoring group, and the weight each group adds (at most once per title)
+_TITLE_KEYWORDS = {
+    'seniority': ('CTO', 'VP', 'Chief', 'Director', 'Head'),
+    'department': ('Technology', 'Engineering'),
+}
+_TITLE_GROUP_WEIGHTS = {'seniority': 10, 'department': 5}
+# Only the top contacts are reported and emailed
+MAX_PRIORITY_CONTACTS = 3
+# One named group per scoring group, so a match identifies its group via
+# match.lastgroup without lowercasing the title or the matched text
+_TITLE_KEYWORDS_RE = re.compile(
+    '|'.join(f"(?P<{group}>{'|'.join(map(re.escape, words))})" for group, words in _TITLE_KEYWORDS.items()),
+    re.IGNORECASE
+)
+
 class ContactAgent:
     """
     Agent responsible for finding key decision makers and contacts
@@ -19,18 +38,20 @@ class ContactAgent:
         """Initialize the contact agent with search tool"""
         self.search_tool = GoogleSearchTool()
         self.name = "Contact Agent"
+        self._priority_reasons = {}
         logger.info(f"✅ {self.name} initialized")
     
-    def execute(self, company_name: str, analysis_data: Dict) -> Dict:
+    def execute(self, company_name: str, analysis_data: Optional[AnalysisResult] = None) -> ContactResult:
         """
         Find key contacts at the target company
         
         Args:
             company_name: Name of the company
-            analysis_data: Analysis results from AnalysisAgent (to inform contact selection)
+            analysis_data: Optional analysis results from AnalysisAgent (to inform contact selection).
+                Not required, so the orchestrator can run this alongside the Analysis Agent.
             
         Returns:
-            Dictionary containing contact information
+            Contact search results
         """
         log_agent_start(self.name, {'company': company_name})
         
@@ -39,86 +60,88 @@ class ContactAgent:
             logger.info(f"Step 1: Searching for decision makers at {company_name}")
             contacts = self.search_tool.search_company_contacts(company_name)
             
-            # Step 2: Prioritize contacts based on analysis
-            logger.info(f"Step 2: Prioritizing {len(contacts)} contacts")
-            prioritized_contacts = self._prioritize_contacts(contacts, analysis_data)
-            
-            # Step 3: Compile contact data
-            contact_data = {
-                'company_name': company_name,
-                'total_contacts_found': len(contacts),
-                'prioritized_contacts': prioritized_contacts,
-                'contact_status': 'completed'
-            }
+            return self._compile_contact_data(company_name, contacts, analysis_data)
             
-            log_agent_complete(
-                self.name,
-                f"Found {len(contacts)} contacts for {company_name}"
-            )
+        except Exception as e:
+            log_agent_error(self.name, e)
+            return ContactResult(company_name, contact_status='failed', error=str(e))
+    
+    async def execute_async(self, company_name: str, analysis_data: Optional[AnalysisResult] = None) -> ContactResult:
+        """
+        Async variant of execute() using the search tool's async HTTP client
+        """
+        log_agent_start(self.name, {'company': company_name})
+        
+        try:
+            logger.info(f"Step 1: Searching for decision makers at {company_name}")
+            contacts = await self.search_tool.search_company_contacts_async(company_name)
             
-            return contact_data
+            return self._compile_contact_data(company_name, contacts, analysis_data)
             
         except Exception as e:
             log_agent_error(self.name, e)
-            return {
-                'company_name': company_name,
-                'error': str(e),
-                'contact_status': 'failed'
-            }
+            return ContactResult(company_name, contact_status='failed', error=str(e))
     
-    def _prioritize_contacts(self, contacts: List[Dict], analysis_data: Dict) -> List[Dict]:
+    def _compile_contact_data(self, company_name: str, contacts: List[Dict], analysis_data: Optional[AnalysisResult]) -> ContactResult:
+        """Prioritize the found contacts and compile the contact data"""
+        # Step 2: Prioritize contacts based on analysis
+        logger.info(f"Step 2: Prioritizing {len(contacts)} contacts")
+        prioritized_contacts = self._prioritize_contacts(contacts, analysis_data)
+        
+        # Step 3: Compile contact data
+        contact_data = ContactResult(company_name, len(contacts), prioritized_contacts)
+        
+        log_agent_complete(
+            self.name,
+            f"Found {len(contacts)} contacts for {company_name}"
+        )
+        
+        return contact_data
+    
+    def _prioritize_contacts(self, contacts: List[Dict], analysis_data: Optional[AnalysisResult] = None) -> List[Dict]:
         """
         Prioritize contacts based on their relevance to identified challenges
         
         Args:
             contacts: List of contact dictionaries
-            analysis_data: Analysis results to inform prioritization
+            analysis_data: Optional analysis results to inform prioritization
             
         Returns:
-            Sorted list of contacts with priority scores
+            The MAX_PRIORITY_CONTACTS highest-scoring contacts, best first
         """
-        # Simple prioritization logic
-        # In production, this would be more sophisticated
-        
-        priority_titles = ['CTO', 'VP', 'Chief', 'Director', 'Head']
-        
         for contact in contacts:
             title = contact.get('title', '')
             
-            # Calculate priority score
-            priority_score = 0
-            
-            # Higher priority for senior titles
-            for priority_title in priority_titles:
-                if priority_title.lower() in title.lower():
-                    priority_score += 10
-                    break
-            
-            # Add priority based on department relevance
-            # (This would use analysis_data in production)
-            if 'technology' in title.lower() or 'engineering' in title.lower():
-                priority_score += 5
-            
-            contact['priority_score'] = priority_score
+            # Higher priority for senior titles, plus department relevance
+            # (department relevance would use analysis_data in production)
+            contact['priority_score'] = self._score_title(title)
             contact['priority_reason'] = self._get_priority_reason(contact, analysis_data)
         
-        # Sort by priority score
-        sorted_contacts = sorted(contacts, key=lambda x: x.get('priority_score', 0), reverse=True)
-        
-        return sorted_contacts
+        # Keep only the top contacts (ties keep their search order, as with a stable sort)
+        return heapq.nlargest(MAX_PRIORITY_CONTACTS, contacts, key=itemgetter('priority_score'))
     
-    def _get_priority_reason(self, contact: Dict, analysis_data: Dict) -> str:
-        """Generate reason for contact priority"""
+    def _score_title(self, title: str) -> int:
+        """Score a title with a single scan for seniority and department keywords"""
+        groups = {match.lastgroup for match in _TITLE_KEYWORDS_RE.finditer(title)}
+        return sum(_TITLE_GROUP_WEIGHTS[group] for group in groups)
+    
+    def _get_priority_reason(self, contact: Dict, analysis_data: Optional[AnalysisResult] = None) -> str:
+        """Generate reason for contact priority (memoized per title)"""
         title = contact.get('title', '')
         
-        if 'CTO' in title or 'Chief Technology' in title:
-            return "Senior technology decision maker - high influence on tech purchases"
-        elif 'VP' in title:
-            return "Executive level contact - can champion solutions internally"
-        elif 'Director' in title:
-            return "Department leader - involved in solution evaluation"
-        else:
-            return "Key stakeholder in decision process"
+        reason = self._priority_reasons.get(title)
+        if reason is None:
+            if 'CTO' in title or 'Chief Technology' in title:
+                reason = "Senior technology decision maker - high influence on tech purchases"
+            elif 'VP' in title:
+                reason = "Executive level contact - can champion solutions internally"
+            elif 'Director' in title:
+                reason = "Department leader - involved in solution evaluation"
+            else:
+                reason = "Key stakeholder in decision process"
+            self._priority_reasons[title] = reason
+        
+        return reason
     
     def get_agent_description(self) -> str:
         """Return description of what this agent does"""
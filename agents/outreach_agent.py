@@ -5,36 +5,81 @@ Uses Gemini LLM to create compelling outreach
 """
 
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 from google import genai
 from google.genai import types
 from utils.logger import setup_logger, log_agent_start, log_agent_complete, log_agent_error
+from utils.types import AnalysisResult, ContactResult, OutreachResult
+from agents._gemini_base import GeminiAgentBase, json_loads
 
 logger = setup_logger('OutreachAgent')
 
-class OutreachAgent:
+MODEL_NAME = os.getenv('MODEL_NAME', 'gemini-2.0-flash-exp')
+
+# Static part of every outreach prompt, sent as the system instruction
+SYSTEM_INSTRUCTION = """
+You write personalized sales outreach emails.
+
+For EACH contact, write a professional, personalized sales email that:
+1. Opens with a relevant insight or observation about their company
+2. Mentions 1-2 specific challenges they likely face
+3. Briefly explains how our solution addresses these challenges
+4. Includes a clear, low-pressure call-to-action
+5. Is concise (150-200 words)
+6. Sounds natural and human, not robotic
+7. Is tailored to that contact's title
+
+Do not include [placeholders]. The body is the complete email body only (no signature).
+"""
+
+class OutreachAgent(GeminiAgentBase):
     """
     Agent responsible for generating personalized outreach emails
     Uses Gemini LLM to create compelling, relevant messages
     """
     
-    def __init__(self):
+    system_instruction = SYSTEM_INSTRUCTION
+    
+    def __init__(self, client: Optional[genai.Client] = None):
         """Initialize the outreach agent with Gemini client"""
-        self.name = "Outreach Agent"
-        
-        # Initialize Gemini client
-        api_key = os.getenv('GOOGLE_API_KEY')
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found in environment variables")
+        super().__init__("Outreach Agent", MODEL_NAME, client)
+    
+    def execute(self, company_name: str, analysis_data: AnalysisResult, contact_data: ContactResult) -> OutreachResult:
+        """
+        Generate personalized outreach emails for contacts
         
-        self.client = genai.Client(api_key=api_key)
-        self.model_name = os.getenv('MODEL_NAME', 'gemini-2.0-flash-exp')
+        Args:
+            company_name: Name of the company
+            analysis_data: Analysis results from AnalysisAgent
+            contact_data: Contact information from ContactAgent
+            
+        Returns:
+            Generated outreach emails
+        """
+        log_agent_start(self.name, {'company': company_name})
         
-        logger.info(f"✅ {self.name} initialized with model: {self.model_name}")
+        try:
+            contacts = contact_data.prioritized_contacts
+            
+            # Generate emails for the top 3 priority contacts in one Gemini call
+            emails = self._generate_emails_batch(contacts[:3], analysis_data, company_name)
+            
+            outreach_data = OutreachResult(company_name, len(emails), emails)
+            
+            log_agent_complete(
+                self.name,
+                f"Generated {len(emails)} personalized emails for {company_name}"
+            )
+            
+            return outreach_data
+            
+        except Exception as e:
+            log_agent_error(self.name, e)
+            return OutreachResult(company_name, outreach_status='failed', error=str(e))
     
-    def execute(self, company_name: str, analysis_data: Dict, contact_data: Dict) -> Dict:
+    async def execute_async(self, company_name: str, analysis_data: AnalysisResult, contact_data: ContactResult) -> OutreachResult:
         """
-        Generate personalized outreach emails for contacts
+        Async variant of execute() using the Gemini async client
         
         Args:
             company_name: Name of the company
@@ -42,26 +87,17 @@ class OutreachAgent:
             contact_data: Contact information from ContactAgent
             
         Returns:
-            Dictionary containing generated emails
+            Generated outreach emails
         """
         log_agent_start(self.name, {'company': company_name})
         
         try:
-            contacts = contact_data.get('prioritized_contacts', [])
-            
-            # Generate email for each contact (top 3 priority)
-            emails = []
-            for contact in contacts[:3]:  # Top 3 contacts only
-                logger.info(f"Generating email for {contact.get('name')}")
-                email = self._generate_email(contact, analysis_data, company_name)
-                emails.append(email)
-            
-            outreach_data = {
-                'company_name': company_name,
-                'emails_generated': len(emails),
-                'outreach_emails': emails,
-                'outreach_status': 'completed'
-            }
+            contacts = contact_data.prioritized_contacts
+            
+            # Generate emails for the top 3 priority contacts in one Gemini call
+            emails = await self._generate_emails_batch_async(contacts[:3], analysis_data, company_name)
+            
+            outreach_data = OutreachResult(company_name, len(emails), emails)
             
             log_agent_complete(
                 self.name,
@@ -72,96 +108,152 @@ class OutreachAgent:
             
         except Exception as e:
             log_agent_error(self.name, e)
-            return {
-                'company_name': company_name,
-                'error': str(e),
-                'outreach_status': 'failed'
-            }
+            return OutreachResult(company_name, outreach_status='failed', error=str(e))
     
-    def _generate_email(self, contact: Dict, analysis_data: Dict, company_name: str) -> Dict:
+    def _generate_emails_batch(self, contacts: List[Dict], analysis_data: AnalysisResult, company_name: str) -> List[Dict]:
         """
-        Generate a personalized email for a specific contact
+        Generate personalized emails for several contacts with a single Gemini call
         
         Args:
-            contact: Contact information
+            contacts: Contacts to write to (top priority first)
             analysis_data: Company analysis
             company_name: Name of the company
             
         Returns:
-            Dictionary with email content
+            List of email dictionaries, one per contact
         """
-        # Prepare context for email generation
-        prompt = self._create_email_prompt(contact, analysis_data, company_name)
+        if not contacts:
+            return []
+        
+        prompt = self._create_batch_email_prompt(contacts, analysis_data, company_name)
         
-        # Call Gemini API
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.8,  # Higher temperature for creative writing
-                    max_output_tokens=800,
-                )
-            )
+            logger.info(f"Generating {len(contacts)} emails in one batched request")
+            response_text = self._generate_text(prompt, self._generation_config(len(contacts)))
+            
+            return self._parse_batch_emails(contacts, analysis_data, company_name, response_text)
+            
+        except Exception as e:
+            logger.error(f"Failed to generate emails for {company_name}: {e}")
+            return [{'recipient': contact.get('name'), 'error': str(e)} for contact in contacts]
+    
+    async def _generate_emails_batch_async(self, contacts: List[Dict], analysis_data: AnalysisResult, company_name: str) -> List[Dict]:
+        """Async variant of _generate_emails_batch() using the Gemini async client"""
+        if not contacts:
+            return []
+        
+        prompt = self._create_batch_email_prompt(contacts, analysis_data, company_name)
+        
+        try:
+            logger.info(f"Generating {len(contacts)} emails in one batched request")
+            response_text = await self._generate_text_async(prompt, self._generation_config(len(contacts)))
             
-            email_body = response.text
+            return self._parse_batch_emails(contacts, analysis_data, company_name, response_text)
             
-            return {
+        except Exception as e:
+            logger.error(f"Failed to generate emails for {company_name}: {e}")
+            return [{'recipient': contact.get('name'), 'error': str(e)} for contact in contacts]
+    
+    def _generation_config(self, num_emails: int) -> types.GenerateContentConfig:
+        """Generation settings for a batched email call, forcing a JSON array response"""
+        return types.GenerateContentConfig(
+            temperature=0.8,  # Higher temperature for creative writing
+            max_output_tokens=800 * num_emails,
+            response_mime_type="application/json",
+            response_schema=types.Schema(
+                type=types.Type.ARRAY,
+                items=types.Schema(
+                    type=types.Type.OBJECT,
+                    properties={
+                        'index': types.Schema(type=types.Type.INTEGER),
+                        'recipient': types.Schema(type=types.Type.STRING),
+                        'subject': types.Schema(type=types.Type.STRING),
+                        'body': types.Schema(type=types.Type.STRING),
+                    },
+                    required=['index', 'recipient', 'subject', 'body'],
+                ),
+            ),
+        )
+    
+    def _parse_batch_emails(self, contacts: List[Dict], analysis_data: AnalysisResult, company_name: str, response_text: str) -> List[Dict]:
+        """
+        Map the JSON array returned by Gemini back onto the contact list
+        
+        Emails are matched by their 1-based "index", falling back to the
+        recipient name (ignoring case and surrounding spaces). A contact no
+        email matches gets an error entry rather than another contact's email:
+        the model may reorder the array.
+        """
+        generated = json_loads(response_text)
+        by_index, by_name = {}, {}
+        for item in generated:
+            index = item.get('index')
+            if isinstance(index, int) and 1 <= index <= len(contacts):
+                by_index.setdefault(index - 1, item)
+            elif item.get('recipient'):
+                by_name.setdefault(item['recipient'].strip().casefold(), item)
+        
+        emails = []
+        for position, contact in enumerate(contacts):
+            item = by_index.get(position) or by_name.get((contact.get('name') or '').strip().casefold())
+            
+            if item is None:
+                emails.append({
+                    'recipient': contact.get('name'),
+                    'error': "No email returned for contact"
+                })
+                continue
+            
+            emails.append({
                 'recipient': contact.get('name'),
                 'title': contact.get('title'),
                 'email_address': contact.get('email'),
-                'subject': f"Helping {company_name} with {self._extract_main_challenge(analysis_data)}",
-                'body': email_body,
+                'subject': item.get('subject') or f"Helping {company_name} with {self._extract_main_challenge(analysis_data)}",
+                'body': item.get('body', ''),
                 'priority_score': contact.get('priority_score', 0)
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to generate email for {contact.get('name')}: {e}")
-            return {
-                'recipient': contact.get('name'),
-                'error': str(e)
-            }
+            })
+        
+        return emails
     
-    def _create_email_prompt(self, contact: Dict, analysis_data: Dict, company_name: str) -> str:
-        """Create prompt for email generation"""
+    def _create_batch_email_prompt(self, contacts: List[Dict], analysis_data: AnalysisResult, company_name: str) -> str:
+        """Create a single prompt asking for one email per contact"""
         
-        challenges = analysis_data.get('key_challenges', [])
-        opportunities = analysis_data.get('opportunities', [])
-        approach = analysis_data.get('recommended_approach', '')
+        challenges = analysis_data.key_challenges
+        opportunities = analysis_data.opportunities
+        approach = analysis_data.recommended_approach
+        
+        # Joined up front: backslashes aren't allowed inside f-string expressions
+        contact_lines = "\n".join([
+            f"{i}. Name: {contact.get('name')} | Title: {contact.get('title')}"
+            for i, contact in enumerate(contacts, 1)
+        ])
+        challenge_lines = "\n".join([f"- {challenge}" for challenge in challenges[:3]])
+        opportunity_lines = "\n".join([f"- {opp}" for opp in opportunities[:2]])
         
         prompt = f"""
-You are writing a personalized sales outreach email.
+You are writing personalized sales outreach emails to {len(contacts)} people at {company_name}.
 
-TARGET CONTACT:
-- Name: {contact.get('name')}
-- Title: {contact.get('title')}
-- Company: {company_name}
+TARGET CONTACTS:
+{contact_lines}
 
 COMPANY CHALLENGES IDENTIFIED:
-{chr(10).join(f'- {challenge}' for challenge in challenges[:3])}
+{challenge_lines}
 
 OPPORTUNITIES FOR OUR SOLUTION:
-{chr(10).join(f'- {opp}' for opp in opportunities[:2])}
+{opportunity_lines}
 
 RECOMMENDED APPROACH:
 {approach}
 
-Write a professional, personalized sales email that:
-1. Opens with a relevant insight or observation about their company
-2. Mentions 1-2 specific challenges they likely face
-3. Briefly explains how our solution addresses these challenges
-4. Includes a clear, low-pressure call-to-action
-5. Is concise (150-200 words)
-6. Sounds natural and human, not robotic
-
-Do not include [placeholders]. Write the complete email body only (no subject line, no signature).
-Make it specific to {company_name} and {contact.get('title')}.
+Return a JSON array with one object per contact, each with "index" (the contact's
+number in the list above), "recipient" (the contact's name exactly as given),
+"subject" and "body".
 """
         return prompt
     
-    def _extract_main_challenge(self, analysis_data: Dict) -> str:
+    def _extract_main_challenge(self, analysis_data: AnalysisResult) -> str:
         """Extract the main challenge for subject line"""
-        challenges = analysis_data.get('key_challenges', [])
+        challenges = analysis_data.key_challenges
         if challenges:
             # Get first challenge and make it short
             main = challenges[0]
@@ -3,21 +3,43 @@ Research Agent - Gathers company information
 First agent in the sequential pipeline
 """
 
-from typing import Dict
+import re
 
 # Try relative imports first, fall back to direct imports
 try:
     from tools.search_tool import GoogleSearchTool
     from utils.logger import setup_logger, log_agent_start, log_agent_complete, log_agent_error
+    from utils.types import ResearchResult
 except ImportError:
     import sys
     import os
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from tools.search_tool import GoogleSearchTool
     from utils.logger import setup_logger, log_agent_start, log_agent_complete, log_agent_error
+    from utils.types import ResearchResult
 
 logger = setup_logger('ResearchAgent')
 
+# Normalized industry labels (the ones configs/industry_analysis.json uses) and the
+# words that identify them, checked in order against the search snippets
+_INDUSTRY_KEYWORDS = (
+    ("Enterprise Software/SaaS", ("enterprise software", "saas", "software")),
+    ("Financial Services", ("financial services", "fintech", "banking", "insurance")),
+    ("Healthcare", ("healthcare", "health care", "biotech", "pharmaceutical")),
+    ("Retail/E-commerce", ("e-commerce", "ecommerce", "retail")),
+)
+# A profile's own "Industry: ..." field is trusted over the rest of the text
+_INDUSTRY_FIELD_RE = re.compile(r"industry:\s*([^.|\n]+)", re.IGNORECASE)
+_EMPLOYEES_RE = re.compile(r"(\d[\d,]*)\+?\s+employees", re.IGNORECASE)
+# Normalized size labels by inclusive upper bound on the employee count
+_SIZE_BUCKETS = (
+    (49, "1-49 employees"),
+    (499, "50-499 employees"),
+    (10000, "500-10,000 employees"),
+)
+_LARGEST_SIZE = "Over 10,000 employees"
+
+
 class ResearchAgent:
     """
     Agent responsible for gathering basic company information
@@ -30,7 +52,7 @@ class ResearchAgent:
         self.name = "Research Agent"
         logger.info(f"✅ {self.name} initialized")
     
-    def execute(self, company_name: str) -> Dict:
+    def execute(self, company_name: str) -> ResearchResult:
         """
         Execute research on a company
         
@@ -38,26 +60,57 @@ class ResearchAgent:
             company_name: Name of the company to research
             
         Returns:
-            Dictionary containing company research data
+            Company research results
         """
         log_agent_start(self.name, {'company_name': company_name})
         
         try:
-            # Step 1: Search for company overview
+            # Steps 1 & 2: Overview and news searches are independent,
+            # so issue them concurrently instead of one after the other
             logger.info(f"Step 1: Gathering company overview for {company_name}")
-            company_info = self.search_tool.search_company_info(company_name)
-            
-            # Step 2: Search for recent news
             logger.info(f"Step 2: Gathering recent news for {company_name}")
-            recent_news = self.search_tool.search_company_news(company_name, limit=5)
+            # A failed news search does not discard the overview (and vice versa)
+            searches = self.search_tool.search_all(company_name, kinds=('info', 'news'), news_limit=5)
+            company_info, recent_news = searches['info'], searches['news']
+            company_info.update(self._company_profile(company_info))
             
             # Step 3: Compile research results
-            research_data = {
-                'company_name': company_name,
-                'company_info': company_info,
-                'recent_news': recent_news,
-                'research_status': 'completed'
-            }
+            research_data = ResearchResult(company_name, company_info, recent_news)
+            
+            log_agent_complete(
+                self.name, 
+                f"Completed research for {company_name}"
+            )
+            
+            return research_data
+            
+        except Exception as e:
+            log_agent_error(self.name, e)
+            return ResearchResult(company_name, research_status='failed', error=str(e))
+    
+    async def execute_async(self, company_name: str) -> ResearchResult:
+        """
+        Async variant of execute()
+        
+        Both searches go through the search tool's async HTTP client and
+        are awaited together (search_all_async).
+        
+        Args:
+            company_name: Name of the company to research
+            
+        Returns:
+            Company research results
+        """
+        log_agent_start(self.name, {'company_name': company_name})
+        
+        try:
+            logger.info(f"Gathering company overview and recent news for {company_name}")
+            # A failed news search does not discard the overview (and vice versa)
+            searches = await self.search_tool.search_all_async(company_name, kinds=('info', 'news'), news_limit=5)
+            company_info, recent_news = searches['info'], searches['news']
+            company_info.update(self._company_profile(company_info))
+            
+            research_data = ResearchResult(company_name, company_info, recent_news)
             
             log_agent_complete(
                 self.name, 
@@ -68,11 +121,39 @@ class ResearchAgent:
             
         except Exception as e:
             log_agent_error(self.name, e)
-            return {
-                'company_name': company_name,
-                'error': str(e),
-                'research_status': 'failed'
-            }
+            return ResearchResult(company_name, research_status='failed', error=str(e))
+    
+    def _company_profile(self, company_info: dict) -> dict:
+        """
+        Normalized 'industry' and 'size' read from the overview search snippets
+        
+        Only the fields that could be determined are returned, so AnalysisAgent
+        falls back to 'N/A' (and no industry template) for the rest.
+        """
+        snippets = [
+            f"{result.get('title', '')}. {result.get('snippet', '')}"
+            for result in company_info.get('results', [])
+        ]
+        text = "\n".join(snippets)
+        profile = {}
+        
+        industry_field = _INDUSTRY_FIELD_RE.search(text)
+        for candidate in ([industry_field.group(1)] if industry_field else []) + [text]:
+            candidate = candidate.lower()
+            industry = next(
+                (label for label, keywords in _INDUSTRY_KEYWORDS if any(keyword in candidate for keyword in keywords)),
+                None
+            )
+            if industry:
+                profile['industry'] = industry
+                break
+        
+        employees = _EMPLOYEES_RE.search(text)
+        if employees:
+            count = int(employees.group(1).replace(',', ''))
+            profile['size'] = next((label for bound, label in _SIZE_BUCKETS if count <= bound), _LARGEST_SIZE)
+        
+        return profile
     
     def get_agent_description(self) -> str:
         """Return description of what this agent does"""
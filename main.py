@@ -24,8 +24,20 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import json
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Dict, List, Tuple
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timedelta
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; reports are then written with the stdlib encoder
+    orjson = None
+
+# Load environment variables before the agents import: their settings are read at module import
+load_dotenv()
 
 # Import agents
 from agents.research_agent import ResearchAgent
@@ -34,15 +46,27 @@ from agents.contact_agent import ContactAgent
 from agents.outreach_agent import OutreachAgent
 
 # Import utilities
-from utils.memory import MemoryBank, SessionState
+from utils.memory import MemoryBank, SessionState, company_key
+from utils.types import ResearchResult, AnalysisResult, ContactResult
+from utils.gemini_client import get_client
+from utils.llm_cache import llm_cache_reads
+from tools.search_tool import async_client_scope
+from utils.dag import Node, run_dag
 from utils.logger import setup_logger, log_agent_start, log_agent_complete
 
-# Load environment variables
-load_dotenv()
-
 # Setup logger
 logger = setup_logger('Orchestrator')
 
+# How long each stage's stored output is reused by later runs (use_cache=True).
+# Outreach has no entry, but when analysis and contacts both come from the cache
+# its prompt is unchanged, so the LLM cache returns the same emails while that
+# response is cached (24h). use_cache=False also bypasses the LLM cache
+STAGE_CACHE_TTL = {
+    'research': timedelta(days=7),
+    'analysis': timedelta(days=7),
+    'contact': timedelta(days=7),
+}
+
 class SalesIntelligenceOrchestrator:
     """
     Main orchestrator that coordinates all agents
@@ -55,14 +79,22 @@ class SalesIntelligenceOrchestrator:
         
         # Initialize memory systems
         self.memory_bank = MemoryBank()
-        self.session = None
+        # Pipeline runs in progress, by company key, so duplicate requests share one run
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Report files are written in the background (see save_report / flush)
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='report-io')
+        self._pending_writes: List[Tuple[str, Future]] = []
         
         # Initialize all agents
         try:
+            # One Gemini client (and connection pool) shared by every LLM-backed agent
+            self.gemini_client = get_client()
+            
             self.research_agent = ResearchAgent()
-            self.analysis_agent = AnalysisAgent()
+            self.analysis_agent = AnalysisAgent(client=self.gemini_client)
             self.contact_agent = ContactAgent()
-            self.outreach_agent = OutreachAgent()
+            self.outreach_agent = OutreachAgent(client=self.gemini_client)
             
             logger.info("✅ All agents initialized successfully")
             
@@ -76,102 +108,343 @@ class SalesIntelligenceOrchestrator:
         
         Args:
             company_name: Name of the company to research
-            use_cache: Whether to use cached results if available
+            use_cache: Whether to reuse cached stage results that are still fresh (see STAGE_CACHE_TTL)
+            
+        Returns:
+            Complete intelligence report dictionary
+        """
+        return asyncio.run(self.process_company_async(company_name, use_cache))
+    
+    def process_companies(self, company_names: List[str], max_concurrency: int = 8, use_cache: bool = True) -> List[dict]:
+        """
+        Process several companies concurrently, batching their analyses
+        
+        Args:
+            company_names: Names of the companies to research
+            max_concurrency: Maximum number of company pipelines in flight at once
+            use_cache: Whether to reuse cached stage results that are still fresh (see STAGE_CACHE_TTL)
+            
+        Returns:
+            List of reports, in the same order as company_names
+        """
+        return asyncio.run(self.process_companies_async(company_names, max_concurrency, use_cache))
+    
+    async def process_companies_async(self, company_names: List[str], max_concurrency: int = 8, use_cache: bool = True) -> List[dict]:
+        """
+        Async variant of process_companies()
+        
+        Research, contact search and outreach fan out per company under a
+        semaphore, while the analyses go to Gemini in batched calls (one per
+        bin of companies) instead of one call per company. Contact searches
+        only need the company name, so they start together with the research.
+        A company listed more than once is processed once and its report reused.
+        Stage outputs still fresh in the memory bank are reused instead of recomputed.
+        """
+        with llm_cache_reads(use_cache):
+            async with async_client_scope():
+                return await self._process_companies(company_names, max_concurrency, use_cache)
+    
+    async def _process_companies(self, company_names: List[str], max_concurrency: int, use_cache: bool) -> List[dict]:
+        """Body of process_companies_async(), run with its LLM cache setting"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+        
+        async def finish(company_name, session, research_results, analysis_results, contact_results) -> dict:
+            try:
+                return await bounded(self._finish_pipeline(
+                    company_name, session, research_results, analysis_results, contact_results
+                ))
+            except Exception as e:
+                return self._failed_report(company_name, session, e)
+        
+        reports = [None] * len(company_names)
+        pending = []
+        # Index of the first occurrence of each company, for every repeated entry
+        duplicate_of = {}
+        first_index = {}
+        for index, company_name in enumerate(company_names):
+            key = company_key(company_name)
+            if key in first_index:
+                duplicate_of[index] = first_index[key]
+                continue
+            first_index[key] = index
+            pending.append(index)
+        
+        sessions = {index: self._new_session(company_names[index]) for index in pending}
+        cached_research = {
+            index: self._cached_stage(company_names[index], 'research', ResearchResult, use_cache) for index in pending
+        }
+        contacts = {}
+        for index in pending:
+            cached_contacts = self._cached_stage(company_names[index], 'contact', ContactResult, use_cache)
+            if cached_contacts is not None:
+                contacts[index] = cached_contacts
+        
+        # Step 1: Research every company without fresh cached research,
+        # with the contact searches (step 3) in the background
+        to_search = [index for index in pending if index not in contacts]
+        contact_search = asyncio.gather(*(
+            bounded(self.contact_agent.execute_async(company_names[index])) for index in to_search
+        ))
+        to_research = [index for index in pending if cached_research[index] is None]
+        research = await asyncio.gather(*(
+            bounded(self.research_agent.execute_async(company_names[index])) for index in to_research
+        ))
+        for index, research_results in zip(to_research, research):
+            self._store_stage(company_names[index], 'research', research_results)
+            cached_research[index] = research_results
+        
+        researched = []
+        for index in pending:
+            research_results = cached_research[index]
+            sessions[index].update('research_results', asdict(research_results))
+            if research_results.research_status == 'failed':
+                error = Exception(f"Research failed: {research_results.error}")
+                reports[index] = self._failed_report(company_names[index], sessions[index], error)
+            else:
+                researched.append((index, research_results))
+        
+        # Step 2: batched analysis while the remaining contact searches finish.
+        # A cached analysis is only valid for the research it was made from, so
+        # it is reused only when that research was reused too
+        analyses = {}
+        for index, _ in researched:
+            if index not in to_research:
+                cached_analysis = self._cached_stage(company_names[index], 'analysis', AnalysisResult, use_cache)
+                if cached_analysis is not None:
+                    analyses[index] = cached_analysis
+        to_analyze = [(index, research_results) for index, research_results in researched if index not in analyses]
+        
+        new_analyses, searched = await asyncio.gather(
+            self.analysis_agent.execute_batch_async([research_results for _, research_results in to_analyze]),
+            contact_search
+        )
+        for (index, _), analysis_results in zip(to_analyze, new_analyses):
+            self._store_stage(company_names[index], 'analysis', analysis_results)
+            analyses[index] = analysis_results
+        for index, contact_results in zip(to_search, searched):
+            self._store_stage(company_names[index], 'contact', contact_results)
+            contacts[index] = contact_results
+        
+        # Step 4: Outreach and report compilation per company
+        finished = await asyncio.gather(*(
+            finish(company_names[index], sessions[index], research_results, analyses[index], contacts[index])
+            for index, research_results in researched
+        ))
+        for (index, _), report in zip(researched, finished):
+            reports[index] = report
+        
+        for index, original in duplicate_of.items():
+            reports[index] = reports[original]
+        
+        return reports
+    
+    async def process_company_async(self, company_name: str, use_cache: bool = True) -> dict:
+        """
+        Async pipeline for a single company
+        
+        The steps run as a task graph (see _pipeline_nodes): the contact search
+        only needs the company name, so it runs alongside Research and then
+        Analysis (which depends on the research); Outreach needs both and runs last.
+        
+        Args:
+            company_name: Name of the company to research
+            use_cache: Whether to reuse cached stage results that are still fresh (see STAGE_CACHE_TTL)
             
         Returns:
             Complete intelligence report dictionary
         """
+        # A concurrent request for the same company waits for that run instead of starting another
+        key = company_key(company_name)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info(f"⏳ {company_name} is already being processed, waiting for that run")
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            with llm_cache_reads(use_cache):
+                async with async_client_scope():
+                    report = await self._run_company_pipeline(company_name, use_cache)
+            future.set_result(report)
+            return report
+        except BaseException:
+            # Cancelled: waiting duplicates are cancelled with it
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+    
+    async def _run_company_pipeline(self, company_name: str, use_cache: bool) -> dict:
+        """Pipeline for one company, behind process_company_async()'s duplicate-request check"""
         logger.info(f"\n{'='*60}")
         logger.info(f"🎯 Starting intelligence gathering for: {company_name}")
         logger.info(f"{'='*60}\n")
         
-        # Create new session
-        self.session = SessionState()
-        self.session.update('company_name', company_name)
+        session = self._new_session(company_name)
         
         try:
-            # Check memory bank for cached results
-            if use_cache and self.memory_bank.has_company(company_name):
-                logger.info(f"📚 Found cached research for {company_name}")
-                cached_data = self.memory_bank.get_company_research(company_name)
-                logger.info(f"✅ Using cached results (saves time!)")
-                return cached_data
-            
-            # SEQUENTIAL AGENT EXECUTION
-            
-            # Step 1: Research Agent
-            logger.info("\n" + "="*60)
-            logger.info("STEP 1: Research Agent - Gathering company information")
-            logger.info("="*60)
-            research_results = self.research_agent.execute(company_name)
-            self.session.update('research_results', research_results)
-            
-            if research_results.get('research_status') == 'failed':
-                raise Exception(f"Research failed: {research_results.get('error')}")
-            
-            # Step 2: Analysis Agent
-            logger.info("\n" + "="*60)
-            logger.info("STEP 2: Analysis Agent - Analyzing business challenges")
-            logger.info("="*60)
-            analysis_results = self.analysis_agent.execute(research_results)
-            self.session.update('analysis_results', analysis_results)
-            
-            if analysis_results.get('analysis_status') == 'failed':
-                raise Exception(f"Analysis failed: {analysis_results.get('error')}")
-            
-            # Step 3: Contact Agent
-            logger.info("\n" + "="*60)
-            logger.info("STEP 3: Contact Agent - Finding decision makers")
-            logger.info("="*60)
-            contact_results = self.contact_agent.execute(company_name, analysis_results)
-            self.session.update('contact_results', contact_results)
-            
-            if contact_results.get('contact_status') == 'failed':
-                raise Exception(f"Contact search failed: {contact_results.get('error')}")
-            
-            # Step 4: Outreach Agent
-            logger.info("\n" + "="*60)
-            logger.info("STEP 4: Outreach Agent - Generating personalized emails")
-            logger.info("="*60)
-            outreach_results = self.outreach_agent.execute(
-                company_name, 
-                analysis_results, 
-                contact_results
-            )
-            self.session.update('outreach_results', outreach_results)
-            
-            if outreach_results.get('outreach_status') == 'failed':
-                raise Exception(f"Outreach generation failed: {outreach_results.get('error')}")
-            
-            # Compile final report
-            final_report = self._compile_report(
-                company_name,
-                research_results,
-                analysis_results,
-                contact_results,
-                outreach_results
-            )
-            
-            # Store in memory bank
-            self.memory_bank.store_company_research(company_name, final_report)
-            
-            logger.info("\n" + "="*60)
-            logger.info(f"✅ Intelligence gathering complete for {company_name}!")
-            logger.info("="*60 + "\n")
-            
-            return final_report
+            results = await run_dag(self._pipeline_nodes(company_name, session, use_cache))
+            return results['report']
             
         except Exception as e:
-            logger.error(f"❌ Pipeline failed: {e}")
-            self.session.add_error(str(e))
-            return {
-                'company_name': company_name,
-                'status': 'failed',
-                'error': str(e),
-                'session_state': self.session.get_full_state()
-            }
-    
-    def _compile_report(self, company_name, research, analysis, contacts, outreach) -> dict:
+            return self._failed_report(company_name, session, e)
+    
+    def _pipeline_nodes(self, company_name: str, session: SessionState, use_cache: bool = True) -> List[Node]:
+        """
+        Task graph of the single-company pipeline
+        Each node receives the results of the nodes it depends on, keyed by node id
+        """
+        # Stages served from the memory bank in this run
+        reused = set()
+        return [
+            Node('research', lambda done: self._research_step(company_name, session, use_cache, reused)),
+            Node('contacts', lambda done: self._contact_step(company_name, use_cache)),
+            Node(
+                'analysis',
+                # A cached analysis is only valid for the research it was made from
+                lambda done: self._analysis_step(done['research'], use_cache and 'research' in reused),
+                depends_on=['research']
+            ),
+            Node(
+                'report',
+                lambda done: self._finish_pipeline(
+                    company_name, session, done['research'], done['analysis'], done['contacts']
+                ),
+                depends_on=['research', 'analysis', 'contacts']
+            ),
+        ]
+    
+    async def _research_step(self, company_name: str, session: SessionState, use_cache: bool, reused: set) -> ResearchResult:
+        """
+        Step 1: Research Agent
+        
+        Raises:
+            Exception: If the research failed
+        """
+        logger.info("\n" + "="*60)
+        logger.info("STEP 1: Research Agent - Gathering company information")
+        logger.info("="*60)
+        research_results = self._cached_stage(company_name, 'research', ResearchResult, use_cache)
+        if research_results is not None:
+            reused.add('research')
+        else:
+            research_results = await self.research_agent.execute_async(company_name)
+            self._store_stage(company_name, 'research', research_results)
+        session.update('research_results', asdict(research_results))
+        
+        if research_results.research_status == 'failed':
+            raise Exception(f"Research failed: {research_results.error}")
+        return research_results
+    
+    async def _analysis_step(self, research_results: ResearchResult, use_cache: bool) -> AnalysisResult:
+        """Step 2: Analysis Agent"""
+        logger.info("\n" + "="*60)
+        logger.info("STEP 2: Analysis Agent - Analyzing business challenges")
+        logger.info("="*60)
+        company_name = research_results.company_name
+        analysis_results = self._cached_stage(company_name, 'analysis', AnalysisResult, use_cache)
+        if analysis_results is None:
+            analysis_results = await self.analysis_agent.execute_async(research_results)
+            self._store_stage(company_name, 'analysis', analysis_results)
+        return analysis_results
+    
+    async def _contact_step(self, company_name: str, use_cache: bool) -> ContactResult:
+        """Step 3: Contact Agent - the search is independent of steps 1 and 2"""
+        logger.info("\n" + "="*60)
+        logger.info("STEP 3: Contact Agent - Finding decision makers")
+        logger.info("="*60)
+        contact_results = self._cached_stage(company_name, 'contact', ContactResult, use_cache)
+        if contact_results is None:
+            contact_results = await self.contact_agent.execute_async(company_name)
+            self._store_stage(company_name, 'contact', contact_results)
+        return contact_results
+    
+    def _cached_stage(self, company_name: str, stage: str, result_type: type, use_cache: bool):
+        """A stage's stored output for the company as result_type, or None if absent or stale"""
+        if not use_cache:
+            return None
+        data = self.memory_bank.get_stage(company_name, stage, STAGE_CACHE_TTL[stage])
+        if data is None:
+            return None
+        logger.info(f"📚 Using cached {stage} results for {company_name}")
+        return result_type(**data)
+    
+    def _store_stage(self, company_name: str, stage: str, result):
+        """Keep a stage's output for later runs, unless the stage failed"""
+        if getattr(result, f"{stage}_status") != 'failed':
+            self.memory_bank.store_stage(company_name, stage, asdict(result))
+    
+    def _new_session(self, company_name: str) -> SessionState:
+        """Start the session for one pipeline run"""
+        # Session is per pipeline run so concurrent companies don't share state
+        session = SessionState()
+        session.update('company_name', company_name)
+        return session
+    
+    async def _finish_pipeline(self, company_name, session, research_results, analysis_results, contact_results) -> dict:
+        """
+        Check the Analysis and Contact results, then run Outreach and
+        compile the final report (reports are kept as files, see save_report)
+        
+        Raises:
+            Exception: If a pipeline step failed
+        """
+        session.update('analysis_results', asdict(analysis_results))
+        session.update('contact_results', asdict(contact_results))
+        
+        if analysis_results.analysis_status == 'failed':
+            raise Exception(f"Analysis failed: {analysis_results.error}")
+        
+        if contact_results.contact_status == 'failed':
+            raise Exception(f"Contact search failed: {contact_results.error}")
+        
+        # Step 4: Outreach Agent
+        logger.info("\n" + "="*60)
+        logger.info("STEP 4: Outreach Agent - Generating personalized emails")
+        logger.info("="*60)
+        outreach_results = await self.outreach_agent.execute_async(
+            company_name, 
+            analysis_results, 
+            contact_results
+        )
+        session.update('outreach_results', asdict(outreach_results))
+        
+        if outreach_results.outreach_status == 'failed':
+            raise Exception(f"Outreach generation failed: {outreach_results.error}")
+        
+        # Compile final report
+        final_report = self._compile_report(
+            company_name,
+            research_results,
+            analysis_results,
+            contact_results,
+            outreach_results,
+            session
+        )
+        
+        logger.info("\n" + "="*60)
+        logger.info(f"✅ Intelligence gathering complete for {company_name}!")
+        logger.info("="*60 + "\n")
+        
+        return final_report
+    
+    def _failed_report(self, company_name: str, session: SessionState, error: Exception) -> dict:
+        """Record a pipeline failure and build the failed report"""
+        logger.error(f"❌ Pipeline failed: {error}")
+        session.add_error(str(error))
+        return {
+            'company_name': company_name,
+            'status': 'failed',
+            'error': str(error),
+            'session_state': session.get_full_state()
+        }
+    
+    def _compile_report(self, company_name, research, analysis, contacts, outreach, session) -> dict:
         """Compile all results into a final report"""
         return {
             'company_name': company_name,
@@ -179,24 +452,24 @@ class SalesIntelligenceOrchestrator:
             'status': 'success',
             
             # Research section
-            'company_overview': research.get('company_info', {}),
-            'recent_news': research.get('recent_news', []),
+            'company_overview': research.company_info,
+            'recent_news': research.recent_news,
             
             # Analysis section
-            'key_challenges': analysis.get('key_challenges', []),
-            'opportunities': analysis.get('opportunities', []),
-            'recommended_approach': analysis.get('recommended_approach', ''),
-            'full_analysis': analysis.get('analysis', ''),
+            'key_challenges': analysis.key_challenges,
+            'opportunities': analysis.opportunities,
+            'recommended_approach': analysis.recommended_approach,
+            'full_analysis': analysis.analysis,
             
             # Contacts section
-            'total_contacts_found': contacts.get('total_contacts_found', 0),
-            'priority_contacts': contacts.get('prioritized_contacts', [])[:3],
+            'total_contacts_found': contacts.total_contacts_found,
+            'priority_contacts': contacts.prioritized_contacts[:3],
             
             # Outreach section
-            'outreach_emails': outreach.get('outreach_emails', []),
+            'outreach_emails': outreach.outreach_emails,
             
             # Metadata
-            'session_id': self.session.get('session_id'),
+            'session_id': session.get('session_id'),
             'agents_used': [
                 'Research Agent',
                 'Analysis Agent', 
@@ -205,8 +478,20 @@ class SalesIntelligenceOrchestrator:
             ]
         }
     
-    def save_report(self, report: dict, filename: str = None):
-        """Save report to JSON file"""
+    def save_report(self, report: dict, filename: str = None, indent: bool = True):
+        """
+        Save report to JSON file
+        The write runs on a background thread so the caller can move on;
+        call flush() to wait until every submitted report is on disk
+        
+        Args:
+            report: Report to save (must not be modified until it is written)
+            filename: Target path; defaults to reports/<company>_<timestamp>.json
+            indent: Pretty-print for human readers; pass False for compact output
+            
+        Returns:
+            Path the report is being written to
+        """
         if filename is None:
             company = report.get('company_name', 'unknown').replace(' ', '_')
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -215,39 +500,105 @@ class SalesIntelligenceOrchestrator:
         # Create reports directory if it doesn't exist
         os.makedirs('reports', exist_ok=True)
         
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Finished writes are dropped here unless they failed: flush() reports those
+        self._pending_writes = [
+            (pending, future) for pending, future in self._pending_writes
+            if not future.done() or future.exception() is not None
+        ]
+        self._pending_writes.append((filename, self._io_pool.submit(self._write_report, report, filename, indent)))
+        return filename
+    
+    def flush(self) -> Dict[str, Exception]:
+        """
+        Wait for all reports submitted to save_report() to be written
+        
+        Returns:
+            The error of each report that could not be written, by filename
+        """
+        pending_writes, self._pending_writes = self._pending_writes, []
+        failed = {}
+        for filename, future in pending_writes:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"❌ Failed to save report {filename}: {e}")
+                failed[filename] = e
+        return failed
+    
+    @staticmethod
+    def _write_report(report: dict, filename: str, indent: bool):
+        """Write one report file (runs on the I/O pool; errors surface in flush())"""
+        if orjson is not None:
+            # Serialized straight to bytes, much faster than json.dump for long analysis/email text
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(report, f, indent=2 if indent else None)
         
         logger.info(f"💾 Report saved to: {filename}")
-        return filename
     
     def display_report_summary(self, report: dict):
         """Display a summary of the report"""
-        print("\n" + "="*60)
-        print(f"📊 SALES INTELLIGENCE REPORT: {report.get('company_name')}")
-        print("="*60)
+        # Built up as lines and written to stdout in one call
+        lines = [
+            "\n" + "="*60,
+            f"📊 SALES INTELLIGENCE REPORT: {report.get('company_name')}",
+            "="*60,
+        ]
         
-        print(f"\n🏢 Company Overview:")
         overview = report.get('company_overview', {})
-        print(f"   Industry: {overview.get('industry', 'N/A')}")
-        print(f"   Size: {overview.get('size', 'N/A')}")
-        print(f"   Location: {overview.get('location', 'N/A')}")
+        lines.append(f"\n🏢 Company Overview:")
+        lines.append(f"   Industry: {overview.get('industry', 'N/A')}")
+        lines.append(f"   Size: {overview.get('size', 'N/A')}")
+        lines.append(f"   Location: {overview.get('location', 'N/A')}")
+        
+        challenges = report.get('key_challenges', [])
+        lines.append(f"\n🎯 Key Challenges ({len(challenges)}):")
+        for i, challenge in enumerate(challenges[:3], 1):
+            lines.append(f"   {i}. {challenge}")
         
-        print(f"\n🎯 Key Challenges ({len(report.get('key_challenges', []))}):")
-        for i, challenge in enumerate(report.get('key_challenges', [])[:3], 1):
-            print(f"   {i}. {challenge}")
+        contacts = report.get('priority_contacts', [])
+        lines.append(f"\n👥 Priority Contacts ({len(contacts)}):")
+        for contact in contacts:
+            lines.append(f"   • {contact.get('name')} - {contact.get('title')}")
         
-        print(f"\n👥 Priority Contacts ({len(report.get('priority_contacts', []))}):")
-        for contact in report.get('priority_contacts', []):
-            print(f"   • {contact.get('name')} - {contact.get('title')}")
+        lines.append(f"\n📧 Outreach Emails Generated: {len(report.get('outreach_emails', []))}")
         
-        print(f"\n📧 Outreach Emails Generated: {len(report.get('outreach_emails', []))}")
+        lines.append("\n" + "="*60 + "\n")
         
-        print("\n" + "="*60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def run_batch(orchestrator: SalesIntelligenceOrchestrator, company_names: List[str]):
+    """Research several companies concurrently, then summarize and save each report"""
+    reports = orchestrator.process_companies(company_names)
+    
+    # Each report is written in the background while the next summary prints
+    filenames = []
+    for report in reports:
+        orchestrator.display_report_summary(report)
+        filenames.append(orchestrator.save_report(report))
+    
+    failed = orchestrator.flush()
+    for filename in filenames:
+        if filename in failed:
+            print(f"❌ Could not save report to {filename}: {failed[filename]}")
+        else:
+            print(f"✅ Full report saved to: {filename}")
+    
+    succeeded = sum(report.get('status') != 'failed' for report in reports)
+    print(f"\n📦 Batch complete: {succeeded}/{len(reports)} companies succeeded")
 
 
 def main():
-    """Main entry point for the application"""
+    """
+    Main entry point for the application
+    
+    With company names as arguments (python main.py "Acme Corp" Globex ...)
+    they are processed as one concurrent batch; otherwise prompts for one company.
+    """
     
     # Initialize orchestrator
     orchestrator = SalesIntelligenceOrchestrator()
@@ -256,6 +607,11 @@ def main():
     print("\n🎯 Smart Sales Intelligence Agent")
     print("="*60)
     
+    company_names = [name.strip() for name in sys.argv[1:] if name.strip()]
+    if company_names:
+        run_batch(orchestrator, company_names)
+        return
+    
     # Get company name from user
     company_name = input("\nEnter company name to research: ").strip()
     
@@ -269,9 +625,8 @@ def main():
     # Display summary
     orchestrator.display_report_summary(report)
     
-    # Save full report
+    # Save full report (written in the background, confirmed below)
     filename = orchestrator.save_report(report)
-    print(f"✅ Full report saved to: {filename}")
     
     # Show first email as example
     if report.get('outreach_emails'):
@@ -283,6 +638,13 @@ def main():
         print(f"Subject: {email.get('subject')}\n")
         print(email.get('body', 'No email body'))
         print("="*60 + "\n")
+    
+    # The report file is written in the background; make sure it is on disk before exiting
+    failed = orchestrator.flush()
+    if filename in failed:
+        print(f"❌ Could not save report to {filename}: {failed[filename]}")
+    else:
+        print(f"✅ Full report saved to: {filename}")
 
 
 if __name__ == "__main__":
@@ -6,45 +6,90 @@ All the same features, but uses pre-written analysis instead of calling Gemini.
 """
 
 import os
+import re
+import sys
 import json
+import time
+import atexit
+import asyncio
 import logging
+import heapq
+import functools
 from datetime import datetime
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional - falls back to the stdlib json module
+    orjson = None
+
 load_dotenv()
 
+def json_dumps_bytes(data, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
 # ============================================================================
 # LOGGING
 # ============================================================================
 
-def setup_logger(name: str, level=logging.INFO):
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    
-    if logger.handlers:
-        return logger
+# Resolved once at import: one log file per process run
+_LOG_FILE = f'logs/agent_{datetime.now().strftime("%Y%m%d")}.log'
+
+_DIRS_INIT = False
+
+def _ensure_dirs():
+    # Output directories are created once per process rather than on every log/report write
+    global _DIRS_INIT
+    if _DIRS_INIT:
+        return
+    os.makedirs('reports', exist_ok=True)
+    os.makedirs('logs', exist_ok=True)
+    _DIRS_INIT = True
+
+@functools.lru_cache(maxsize=None)
+def _shared_handlers(level) -> tuple:
+    # One console and one file handler shared by every logger (a single open log file)
+    # Timestamps are UTC to whole seconds: no timezone conversion or millisecond formatting per record
+    formatter = logging.Formatter('{asctime} - {name} - {levelname} - {message}', datefmt='%Y-%m-%d %H:%M:%SZ', style='{')
+    formatter.converter = time.gmtime
     
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     console_handler.setFormatter(formatter)
     
-    os.makedirs('logs', exist_ok=True)
-    log_file = f'logs/agent_{datetime.now().strftime("%Y%m%d")}.log'
-    file_handler = logging.FileHandler(log_file)
+    _ensure_dirs()
+    file_handler = logging.FileHandler(_LOG_FILE)
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
     
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    return console_handler, file_handler
+
+@functools.lru_cache(maxsize=None)
+def setup_logger(name: str, level=logging.INFO):
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    
+    if logger.handlers:
+        return logger
+    
+    for handler in _shared_handlers(level):
+        logger.addHandler(handler)
     
     return logger
 
 main_logger = setup_logger('SalesAgent')
 
+# The dict-formatting helpers skip building their message when INFO is disabled
 def log_agent_start(agent_name: str, input_data: dict):
-    main_logger.info(f"🚀 {agent_name} started with input: {input_data}")
+    if main_logger.isEnabledFor(logging.INFO):
+        main_logger.info(f"🚀 {agent_name} started with input: {input_data}")
 
 def log_agent_complete(agent_name: str, output_summary: str):
     main_logger.info(f"✅ {agent_name} completed: {output_summary}")
@@ -53,50 +98,133 @@ def log_agent_error(agent_name: str, error: Exception):
     main_logger.error(f"❌ {agent_name} failed: {str(error)}", exc_info=True)
 
 def log_tool_call(tool_name: str, parameters: dict):
-    main_logger.info(f"🔧 Tool called: {tool_name} with params: {parameters}")
+    if main_logger.isEnabledFor(logging.INFO):
+        main_logger.info(f"🔧 Tool called: {tool_name} with params: {parameters}")
 
 # ============================================================================
 # MEMORY SYSTEM
 # ============================================================================
 
 class MemoryBank:
-    def __init__(self, memory_file: str = 'memory_bank.json'):
+    """
+    Append-only JSONL log replayed into an in-memory dict (last write wins).
+    Stores append one line; the log is compacted once it holds more than
+    twice as many lines as there are keys. Reads only touch memory: their
+    last_accessed updates are appended in batches every ACCESS_FLUSH_EVERY
+    reads and at exit. A JSON memory bank from earlier versions is imported
+    into a new log once.
+    """
+    ACCESS_FLUSH_EVERY = 100
+    
+    def __init__(self, memory_file: str = 'memory_bank.jsonl', legacy_file: str = 'memory_bank.json'):
         self.memory_file = memory_file
-        self.memory = self._load_memory()
         self.logger = setup_logger('Memory')
+        self.log_lines = 0
+        self.accessed_keys = set()
+        self.pending_accesses = 0
+        self.memory = self._load_memory()
+        if not os.path.exists(self.memory_file):
+            self._import_legacy(legacy_file)
+        atexit.register(self._flush)
+    
+    def _import_legacy(self, legacy_file: str):
+        # Writes the log, so the import only ever runs before there is one
+        if not legacy_file or not os.path.exists(legacy_file):
+            return
+        try:
+            with open(legacy_file, 'r') as f:
+                legacy = json.load(f)
+        except Exception as e:
+            self.logger.error(f"Failed to import memory from {legacy_file}: {e}")
+            return
+        
+        # Only this script's records: main.py's memory bank used the same file name
+        self.memory.update({
+            key: record for key, record in legacy.items()
+            if isinstance(record, dict) and 'research_data' in record
+        })
+        if self.memory:
+            self._compact()
+            self.logger.info(f"📥 Imported {len(self.memory)} records from {legacy_file}")
     
     def _load_memory(self) -> Dict:
+        memory = {}
         if os.path.exists(self.memory_file):
-            try:
-                with open(self.memory_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
-    
-    def _save_memory(self):
+            with open(self.memory_file, 'rb') as f:
+                for line in f:
+                    try:
+                        record = json_loads(line)
+                    except ValueError:
+                        continue  # e.g. a line truncated by a crash mid-write
+                    if record['op'] == 'touch':
+                        if record['key'] in memory:
+                            memory[record['key']]['last_accessed'] = record['last_accessed']
+                    else:
+                        memory[record['key']] = record['val']
+                    self.log_lines += 1
+        return memory
+    
+    def _append_record(self, key: str, value: Dict):
+        record = {'op': 'put', 'key': key, 'val': value, 'ts': datetime.now().isoformat()}
         try:
-            with open(self.memory_file, 'w') as f:
-                json.dump(self.memory, f, indent=2)
+            with open(self.memory_file, 'ab') as f:
+                f.write(json_dumps_bytes(record) + b"\n")
+            self.log_lines += 1
+        except Exception as e:
+            self.logger.error(f"Failed to save memory: {e}")
+        
+        if self.log_lines > 2 * len(self.memory):
+            self._compact()
+    
+    def _compact(self):
+        tmp_file = self.memory_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                for key, value in self.memory.items():
+                    f.write(json_dumps_bytes({'op': 'put', 'key': key, 'val': value}) + b"\n")
+            os.replace(tmp_file, self.memory_file)
+            self.log_lines = len(self.memory)
+            self.accessed_keys.clear()
+            self.pending_accesses = 0
+        except Exception as e:
+            self.logger.error(f"Failed to compact memory: {e}")
+    
+    def _flush(self):
+        # One small 'touch' line per accessed key rather than the whole record
+        if not self.accessed_keys:
+            return
+        try:
+            with open(self.memory_file, 'ab') as f:
+                for key in self.accessed_keys:
+                    record = {'op': 'touch', 'key': key, 'last_accessed': self.memory[key]['last_accessed']}
+                    f.write(json_dumps_bytes(record) + b"\n")
+            self.log_lines += len(self.accessed_keys)
+            self.accessed_keys.clear()
+            self.pending_accesses = 0
         except Exception as e:
             self.logger.error(f"Failed to save memory: {e}")
     
     def store_company_research(self, company_name: str, research_data: Dict):
         key = company_name.lower().strip()
+        now = datetime.now().isoformat()
         self.memory[key] = {
             'company_name': company_name,
             'research_data': research_data,
-            'timestamp': datetime.now().isoformat(),
-            'last_accessed': datetime.now().isoformat()
+            'timestamp': now,
+            'last_accessed': now
         }
-        self._save_memory()
+        self.accessed_keys.discard(key)
+        self._append_record(key, self.memory[key])
         self.logger.info(f"✅ Stored research for {company_name}")
     
     def get_company_research(self, company_name: str) -> Optional[Dict]:
         key = company_name.lower().strip()
         if key in self.memory:
             self.memory[key]['last_accessed'] = datetime.now().isoformat()
-            self._save_memory()
+            self.accessed_keys.add(key)
+            self.pending_accesses += 1
+            if self.pending_accesses >= self.ACCESS_FLUSH_EVERY:
+                self._flush()
             self.logger.info(f"📖 Retrieved cached research for {company_name}")
             return self.memory[key]['research_data']
         return None
@@ -121,7 +249,7 @@ class SessionState:
     
     def update(self, key: str, value):
         self.state[key] = value
-        self.logger.info(f"📝 Updated session state: {key}")
+        self.logger.debug(f"📝 Updated session state: {key}")
     
     def get(self, key: str):
         return self.state.get(key)
@@ -129,13 +257,37 @@ class SessionState:
     def add_error(self, error: str):
         self.state['errors'].append({'error': error, 'timestamp': datetime.now().isoformat()})
     
-    def get_full_state(self) -> Dict:
-        return self.state.copy()
+    def get_full_state(self) -> Mapping:
+        # Read-only live view; callers that need a mutable snapshot use dict(...)
+        return MappingProxyType(self.state)
 
 # ============================================================================
 # SEARCH TOOL
 # ============================================================================
 
+# Simulated result templates, filled with {name} (company name) and {slug} (domain slug)
+_OVERVIEW_TMPL = "{name} is a leading enterprise technology company"
+_WEBSITE_TMPL = "www.{slug}.com"
+_NEWS_TMPLS = (
+    "{name} announces record Q4 earnings",
+    "{name} launches innovative AI-powered platform",
+    "{name} expands global footprint with new offices",
+    "{name} wins major enterprise contracts"
+)
+_FACT_TMPLS = (
+    "{name} serves thousands of enterprise customers",
+    "Leader in digital transformation solutions",
+    "Known for customer-centric innovation"
+)
+_CONTACT_TMPLS = (
+    ('Jennifer Martinez', 'Chief Technology Officer', 'Technology', 'linkedin.com/in/jennifermartinez', 'j.martinez@{slug}.com'),
+    ('David Thompson', 'VP of Engineering', 'Engineering', 'linkedin.com/in/davidthompson', 'd.thompson@{slug}.com'),
+    ('Emily Chen', 'Director of Product Management', 'Product', 'linkedin.com/in/emilychen', 'e.chen@{slug}.com')
+)
+
+def _template_context(company_name: str) -> Dict:
+    return {'name': company_name, 'slug': company_name.lower().replace(' ', '')}
+
 class GoogleSearchTool:
     def __init__(self):
         self.logger = setup_logger('SearchTool')
@@ -144,25 +296,17 @@ class GoogleSearchTool:
         log_tool_call('GoogleSearch', {'query': company_name})
         self.logger.info(f"🔍 Searching for: {company_name}")
         
+        ctx = _template_context(company_name)
         results = {
             'company_name': company_name,
-            'overview': f"{company_name} is a leading enterprise technology company",
+            'overview': _OVERVIEW_TMPL.format_map(ctx),
             'industry': "Enterprise Software/SaaS",
             'size': "500-10,000 employees",
             'founded': "2000s",
             'location': "San Francisco, CA",
-            'website': f"www.{company_name.lower().replace(' ', '')}.com",
-            'recent_news': [
-                f"{company_name} announces record Q4 earnings",
-                f"{company_name} launches innovative AI-powered platform",
-                f"{company_name} expands global footprint with new offices",
-                f"{company_name} wins major enterprise contracts"
-            ],
-            'key_facts': [
-                f"{company_name} serves thousands of enterprise customers",
-                "Leader in digital transformation solutions",
-                "Known for customer-centric innovation"
-            ]
+            'website': _WEBSITE_TMPL.format_map(ctx),
+            'recent_news': [t.format_map(ctx) for t in _NEWS_TMPLS],
+            'key_facts': [t.format_map(ctx) for t in _FACT_TMPLS]
         }
         
         self.logger.info(f"✅ Found results for {company_name}")
@@ -172,28 +316,16 @@ class GoogleSearchTool:
         log_tool_call('ContactSearch', {'company': company_name})
         self.logger.info(f"👥 Searching for contacts at: {company_name}")
         
+        ctx = _template_context(company_name)
         contacts = [
             {
-                'name': 'Jennifer Martinez',
-                'title': 'Chief Technology Officer',
-                'department': 'Technology',
-                'linkedin': 'linkedin.com/in/jennifermartinez',
-                'email': f'j.martinez@{company_name.lower().replace(" ", "")}.com'
-            },
-            {
-                'name': 'David Thompson',
-                'title': 'VP of Engineering',
-                'department': 'Engineering',
-                'linkedin': 'linkedin.com/in/davidthompson',
-                'email': f'd.thompson@{company_name.lower().replace(" ", "")}.com'
-            },
-            {
-                'name': 'Emily Chen',
-                'title': 'Director of Product Management',
-                'department': 'Product',
-                'linkedin': 'linkedin.com/in/emilychen',
-                'email': f'e.chen@{company_name.lower().replace(" ", "")}.com'
+                'name': name,
+                'title': title,
+                'department': department,
+                'linkedin': linkedin,
+                'email': email_tmpl.format_map(ctx)
             }
+            for name, title, department, linkedin, email_tmpl in _CONTACT_TMPLS
         ]
         
         self.logger.info(f"✅ Found {len(contacts)} contacts")
@@ -233,6 +365,9 @@ class ResearchAgent:
         except Exception as e:
             log_agent_error(self.name, e)
             return {'company_name': company_name, 'error': str(e), 'research_status': 'failed'}
+    
+    async def execute_async(self, company_name: str) -> Dict:
+        return await asyncio.to_thread(self.execute, company_name)
 
 class AnalysisAgent:
     """Mock analysis - no API calls!"""
@@ -276,6 +411,15 @@ class AnalysisAgent:
         except Exception as e:
             log_agent_error(self.name, e)
             return {'company_name': research_data.get('company_name'), 'error': str(e), 'analysis_status': 'failed'}
+    
+    async def execute_async(self, research_data: Dict) -> Dict:
+        return await asyncio.to_thread(self.execute, research_data)
+
+# Title scoring: +10 for a senior title, +5 for a technology/engineering title (substring match)
+_PRIORITY_TITLE_RE = re.compile(r"cto|vp|chief|director|head", re.IGNORECASE)
+_TECH_TITLE_RE = re.compile(r"technology|engineering", re.IGNORECASE)
+# Only the top contacts are reported and emailed
+MAX_PRIORITY_CONTACTS = 3
 
 class ContactAgent:
     def __init__(self):
@@ -284,7 +428,7 @@ class ContactAgent:
         self.logger = setup_logger('ContactAgent')
         self.logger.info(f"✅ {self.name} initialized")
     
-    def execute(self, company_name: str, analysis_data: Dict) -> Dict:
+    def execute(self, company_name: str, analysis_data: Optional[Dict] = None) -> Dict:
         log_agent_start(self.name, {'company': company_name})
         
         try:
@@ -308,24 +452,19 @@ class ContactAgent:
             log_agent_error(self.name, e)
             return {'company_name': company_name, 'error': str(e), 'contact_status': 'failed'}
     
+    async def execute_async(self, company_name: str, analysis_data: Optional[Dict] = None) -> Dict:
+        return await asyncio.to_thread(self.execute, company_name, analysis_data)
+    
     def _prioritize_contacts(self, contacts: List[Dict]) -> List[Dict]:
-        priority_titles = ['CTO', 'VP', 'Chief', 'Director', 'Head']
-        
         for contact in contacts:
             title = contact.get('title', '')
-            priority_score = 0
-            
-            for priority_title in priority_titles:
-                if priority_title.lower() in title.lower():
-                    priority_score += 10
-                    break
-            
-            if 'technology' in title.lower() or 'engineering' in title.lower():
+            priority_score = 10 if _PRIORITY_TITLE_RE.search(title) else 0
+            if _TECH_TITLE_RE.search(title):
                 priority_score += 5
             
             contact['priority_score'] = priority_score
         
-        return sorted(contacts, key=lambda x: x.get('priority_score', 0), reverse=True)
+        return heapq.nlargest(MAX_PRIORITY_CONTACTS, contacts, key=lambda x: x.get('priority_score', 0))
 
 class OutreachAgent:
     """Mock outreach - no API calls!"""
@@ -360,6 +499,9 @@ class OutreachAgent:
             log_agent_error(self.name, e)
             return {'company_name': company_name, 'error': str(e), 'outreach_status': 'failed'}
     
+    async def execute_async(self, company_name: str, analysis_data: Dict, contact_data: Dict) -> Dict:
+        return await asyncio.to_thread(self.execute, company_name, analysis_data, contact_data)
+    
     def _generate_mock_email(self, contact: Dict, analysis_data: Dict, company_name: str) -> Dict:
         challenges = analysis_data.get('key_challenges', [])
         
@@ -393,9 +535,9 @@ class SalesIntelligenceOrchestrator:
     def __init__(self):
         self.logger = setup_logger('Orchestrator')
         self.logger.info("🚀 Initializing Sales Intelligence System (MOCK MODE)")
+        _ensure_dirs()
         
         self.memory_bank = MemoryBank()
-        self.session = None
         
         try:
             self.research_agent = ResearchAgent()
@@ -408,12 +550,16 @@ class SalesIntelligenceOrchestrator:
             raise
     
     def process_company(self, company_name: str, use_cache: bool = True) -> dict:
+        return asyncio.run(self.process_company_async(company_name, use_cache))
+    
+    async def process_company_async(self, company_name: str, use_cache: bool = True) -> dict:
         self.logger.info(f"\n{'='*60}")
         self.logger.info(f"🎯 Starting intelligence for: {company_name}")
         self.logger.info(f"{'='*60}\n")
         
-        self.session = SessionState()
-        self.session.update('company_name', company_name)
+        # Local to this run so concurrent companies don't share session state
+        session = SessionState()
+        session.update('company_name', company_name)
         
         try:
             if use_cache and self.memory_bank.has_company(company_name):
@@ -423,42 +569,41 @@ class SalesIntelligenceOrchestrator:
             self.logger.info("\n" + "="*60)
             self.logger.info("STEP 1: Research Agent")
             self.logger.info("="*60)
-            research_results = self.research_agent.execute(company_name)
-            self.session.update('research_results', research_results)
+            research_results = await self.research_agent.execute_async(company_name)
+            session.update('research_results', research_results)
             
             if research_results.get('research_status') == 'failed':
                 raise Exception(f"Research failed: {research_results.get('error')}")
             
+            # Contact search only needs the company name, so it runs alongside the analysis
             self.logger.info("\n" + "="*60)
-            self.logger.info("STEP 2: Analysis Agent (MOCK)")
+            self.logger.info("STEP 2+3: Analysis Agent (MOCK) + Contact Agent (parallel)")
             self.logger.info("="*60)
-            analysis_results = self.analysis_agent.execute(research_results)
-            self.session.update('analysis_results', analysis_results)
+            analysis_results, contact_results = await asyncio.gather(
+                self.analysis_agent.execute_async(research_results),
+                self.contact_agent.execute_async(company_name)
+            )
+            session.update('analysis_results', analysis_results)
+            session.update('contact_results', contact_results)
             
             if analysis_results.get('analysis_status') == 'failed':
                 raise Exception(f"Analysis failed: {analysis_results.get('error')}")
             
-            self.logger.info("\n" + "="*60)
-            self.logger.info("STEP 3: Contact Agent")
-            self.logger.info("="*60)
-            contact_results = self.contact_agent.execute(company_name, analysis_results)
-            self.session.update('contact_results', contact_results)
-            
             if contact_results.get('contact_status') == 'failed':
                 raise Exception(f"Contact failed: {contact_results.get('error')}")
             
             self.logger.info("\n" + "="*60)
             self.logger.info("STEP 4: Outreach Agent (MOCK)")
             self.logger.info("="*60)
-            outreach_results = self.outreach_agent.execute(company_name, analysis_results, contact_results)
-            self.session.update('outreach_results', outreach_results)
+            outreach_results = await self.outreach_agent.execute_async(company_name, analysis_results, contact_results)
+            session.update('outreach_results', outreach_results)
             
             if outreach_results.get('outreach_status') == 'failed':
                 raise Exception(f"Outreach failed: {outreach_results.get('error')}")
             
             final_report = self._compile_report(
                 company_name, research_results, analysis_results, 
-                contact_results, outreach_results
+                contact_results, outreach_results, session
             )
             
             self.memory_bank.store_company_research(company_name, final_report)
@@ -471,10 +616,88 @@ class SalesIntelligenceOrchestrator:
             
         except Exception as e:
             self.logger.error(f"❌ Pipeline failed: {e}")
-            self.session.add_error(str(e))
+            session.add_error(str(e))
             return {'company_name': company_name, 'status': 'failed', 'error': str(e)}
     
-    def _compile_report(self, company_name, research, analysis, contacts, outreach) -> dict:
+    def process_companies_pipelined(self, company_names: List[str], use_cache: bool = True, queue_size: int = 8) -> List[dict]:
+        return asyncio.run(self.process_companies_pipelined_async(company_names, use_cache, queue_size))
+    
+    async def process_companies_pipelined_async(self, company_names: List[str], use_cache: bool = True, queue_size: int = 8) -> List[dict]:
+        # Research -> Analysis -> Contact -> Outreach as one worker per stage linked by bounded
+        # queues: different companies occupy different stages at the same time, and at most one
+        # analysis and one outreach (the LLM stages in real mode) are in flight at once
+        reports = [None] * len(company_names)
+        
+        async def research(job):
+            job['research'] = await self.research_agent.execute_async(job['company_name'])
+            job['session'].update('research_results', job['research'])
+            if job['research'].get('research_status') == 'failed':
+                raise Exception(f"Research failed: {job['research'].get('error')}")
+        
+        async def analysis(job):
+            job['analysis'] = await self.analysis_agent.execute_async(job['research'])
+            job['session'].update('analysis_results', job['analysis'])
+            if job['analysis'].get('analysis_status') == 'failed':
+                raise Exception(f"Analysis failed: {job['analysis'].get('error')}")
+        
+        async def contact(job):
+            job['contacts'] = await self.contact_agent.execute_async(job['company_name'])
+            job['session'].update('contact_results', job['contacts'])
+            if job['contacts'].get('contact_status') == 'failed':
+                raise Exception(f"Contact failed: {job['contacts'].get('error')}")
+        
+        async def outreach(job):
+            company_name = job['company_name']
+            outreach_results = await self.outreach_agent.execute_async(company_name, job['analysis'], job['contacts'])
+            job['session'].update('outreach_results', outreach_results)
+            if outreach_results.get('outreach_status') == 'failed':
+                raise Exception(f"Outreach failed: {outreach_results.get('error')}")
+            
+            final_report = self._compile_report(
+                company_name, job['research'], job['analysis'],
+                job['contacts'], outreach_results, job['session']
+            )
+            self.memory_bank.store_company_research(company_name, final_report)
+            reports[job['index']] = final_report
+        
+        async def run_stage(step, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue]):
+            while True:
+                job = await inbox.get()
+                if job is None:  # end of input: pass the sentinel on and stop
+                    if outbox is not None:
+                        await outbox.put(None)
+                    return
+                try:
+                    await step(job)
+                except Exception as e:
+                    self.logger.error(f"❌ Pipeline failed for {job['company_name']}: {e}")
+                    job['session'].add_error(str(e))
+                    reports[job['index']] = {'company_name': job['company_name'], 'status': 'failed', 'error': str(e)}
+                    continue
+                if outbox is not None:
+                    await outbox.put(job)
+        
+        steps = (research, analysis, contact, outreach)
+        queues = [asyncio.Queue(maxsize=queue_size) for _ in steps]
+        workers = [
+            asyncio.create_task(run_stage(step, queues[i], queues[i + 1] if i + 1 < len(queues) else None))
+            for i, step in enumerate(steps)
+        ]
+        
+        for index, company_name in enumerate(company_names):
+            if use_cache and self.memory_bank.has_company(company_name):
+                self.logger.info(f"📚 Using cached results for {company_name}")
+                reports[index] = self.memory_bank.get_company_research(company_name)
+                continue
+            session = SessionState()
+            session.update('company_name', company_name)
+            await queues[0].put({'index': index, 'company_name': company_name, 'session': session})
+        await queues[0].put(None)
+        
+        await asyncio.gather(*workers)
+        return reports
+    
+    def _compile_report(self, company_name, research, analysis, contacts, outreach, session) -> dict:
         return {
             'company_name': company_name,
             'generated_at': datetime.now().isoformat(),
@@ -488,41 +711,48 @@ class SalesIntelligenceOrchestrator:
             'total_contacts_found': contacts.get('total_contacts_found', 0),
             'priority_contacts': contacts.get('prioritized_contacts', [])[:3],
             'outreach_emails': outreach.get('outreach_emails', []),
-            'session_id': self.session.get('session_id')
+            'session_id': session.get('session_id')
         }
     
     def save_report(self, report: dict):
-        os.makedirs('reports', exist_ok=True)
         company = report.get('company_name', 'unknown').replace(' ', '_')
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"reports/{company}_{timestamp}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(json_dumps_bytes(report, indent=True))
         
         self.logger.info(f"💾 Report saved: {filename}")
         return filename
     
     def display_summary(self, report: dict):
-        print("\n" + "="*60)
-        print(f"📊 SALES INTELLIGENCE: {report.get('company_name')}")
-        print("="*60)
+        # Built up as lines and written to stdout in one call
+        lines = [
+            "\n" + "="*60,
+            f"📊 SALES INTELLIGENCE: {report.get('company_name')}",
+            "="*60,
+        ]
         
-        print(f"\n🏢 Company Overview:")
+        lines.append(f"\n🏢 Company Overview:")
         overview = report.get('company_overview', {})
-        print(f"   Industry: {overview.get('industry', 'N/A')}")
-        print(f"   Size: {overview.get('size', 'N/A')}")
+        lines.append(f"   Industry: {overview.get('industry', 'N/A')}")
+        lines.append(f"   Size: {overview.get('size', 'N/A')}")
+        
+        challenges = report.get('key_challenges', [])
+        lines.append(f"\n🎯 Key Challenges ({len(challenges)}):")
+        for i, c in enumerate(challenges[:3], 1):
+            lines.append(f"   {i}. {c}")
         
-        print(f"\n🎯 Key Challenges ({len(report.get('key_challenges', []))}):")
-        for i, c in enumerate(report.get('key_challenges', [])[:3], 1):
-            print(f"   {i}. {c}")
+        contacts = report.get('priority_contacts', [])
+        lines.append(f"\n👥 Priority Contacts ({len(contacts)}):")
+        for contact in contacts:
+            lines.append(f"   • {contact.get('name')} - {contact.get('title')}")
         
-        print(f"\n👥 Priority Contacts ({len(report.get('priority_contacts', []))}):")
-        for contact in report.get('priority_contacts', []):
-            print(f"   • {contact.get('name')} - {contact.get('title')}")
+        lines.append(f"\n📧 Emails Generated: {len(report.get('outreach_emails', []))}")
+        lines.append("="*60 + "\n")
         
-        print(f"\n📧 Emails Generated: {len(report.get('outreach_emails', []))}")
-        print("="*60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 # ============================================================================
 # MAIN
@@ -14,44 +14,84 @@ Features implemented (6/3 required):
 """
 
 import os
+import re
+import sys
+import copy
 import json
+import heapq
+import hashlib
+import asyncio
+import atexit
+import queue
 import logging
+import logging.handlers
+import functools
+import threading
+import weakref
+import contextvars
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 
+try:
+    import orjson
+except ImportError:  # optional - falls back to the stdlib json module
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+def json_dumps_bytes(data, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
 # ============================================================================
 # LOGGING UTILITY (Observability)
 # ============================================================================
 
+os.makedirs('logs', exist_ok=True)
+_LOG_FILE = f'logs/agent_{datetime.now().strftime("%Y%m%d")}.log'
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Loggers only enqueue records; a single listener thread formats them and
+# writes to the console and log file, so concurrent tasks never wait on
+# handler locks or I/O
+_LOG_QUEUE = queue.SimpleQueue()
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    # Console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(_LOG_FORMATTER)
+    
+    # File handler
+    file_handler = logging.FileHandler(_LOG_FILE)
+    file_handler.setFormatter(_LOG_FORMATTER)
+    
+    listener = logging.handlers.QueueListener(_LOG_QUEUE, console_handler, file_handler)
+    listener.start()
+    # Drain whatever is still queued before the interpreter exits
+    atexit.register(listener.stop)
+    return listener
+
+_LOG_LISTENER = _start_log_listener()
+
+@functools.lru_cache(maxsize=None)
 def setup_logger(name: str, level=logging.INFO):
-    """Setup logger with console and file handlers"""
+    """Setup logger feeding the shared log queue (memoized: later calls are a cache lookup)"""
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
     if logger.handlers:
         return logger
     
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(formatter)
-    
-    # File handler
-    os.makedirs('logs', exist_ok=True)
-    log_file = f'logs/agent_{datetime.now().strftime("%Y%m%d")}.log'
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
-    
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
     
     return logger
 
@@ -70,73 +110,241 @@ def log_tool_call(tool_name: str, parameters: dict):
     main_logger.info(f"🔧 Tool called: {tool_name} with params: {parameters}")
 
 
+# ============================================================================
+# GEMINI CLIENT (shared by the LLM-backed agents)
+# ============================================================================
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> genai.Client:
+    """Return the process-wide Gemini client (one connection pool for every Gemini call)"""
+    api_key = os.getenv('GOOGLE_API_KEY')
+    if not api_key:
+        raise ValueError("GOOGLE_API_KEY not found in .env file")
+    return genai.Client(api_key=api_key)
+
+# Identical prompts within a run are answered from memory; each agent keeps at
+# most this many responses (oldest evicted first)
+LLM_MEMO_MAX_ENTRIES = 512
+
+# Off while a use_cache=False run is in progress: the memo is then neither read
+# nor written, so a forced refresh really calls Gemini again
+_MEMO_ENABLED = contextvars.ContextVar('llm_memo_enabled', default=True)
+
+def prompt_key(prompt: str) -> str:
+    return hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+
+def memo_get(memo: Dict, key: str):
+    return memo.get(key) if _MEMO_ENABLED.get() else None
+
+def memo_put(memo: Dict, key: str, value):
+    if not _MEMO_ENABLED.get():
+        return
+    memo[key] = value
+    if len(memo) > LLM_MEMO_MAX_ENTRIES:
+        del memo[next(iter(memo))]
+
+# Bounds in-flight async Gemini calls per agent to stay under rate limits
+GEMINI_CONCURRENCY = int(os.getenv('GEMINI_CONCURRENCY', 8))
+
+def loop_semaphore(semaphores: weakref.WeakKeyDictionary) -> asyncio.Semaphore:
+    """
+    The agent's Gemini semaphore for the running event loop
+    A semaphore is bound to the loop it was first contended in, and every
+    process_company()/process_companies() call runs its own loop
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = semaphores.get(loop)
+    if semaphore is None:
+        semaphore = semaphores[loop] = asyncio.Semaphore(GEMINI_CONCURRENCY)
+    return semaphore
+
+async def single_flight(inflight: Dict[str, asyncio.Future], key: str, make_call):
+    """Await make_call() once per key: concurrent callers with the same key share its result"""
+    if key in inflight:
+        return await asyncio.shield(inflight[key])
+    
+    future = asyncio.get_running_loop().create_future()
+    inflight[key] = future
+    try:
+        result = await make_call()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved: there may be no other waiter
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del inflight[key]
+
+
 # ============================================================================
 # MEMORY SYSTEM (Memory Bank + Session State)
 # ============================================================================
 
+# Legal-form suffixes ignored when matching company names ("Salesforce Inc." -> "salesforce")
+_COMPANY_SUFFIX_RE = re.compile(r'\b(inc|incorporated|corp|corporation|co|company|llc|ltd|limited|plc|gmbh)\b\.?', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1024)
+def company_key(company_name: str) -> str:
+    """Normalized memory key for a company name (also used as its file name)"""
+    key = re.sub(r'\W+', '', _COMPANY_SUFFIX_RE.sub('', company_name)).lower()
+    return key or re.sub(r'\W+', '', company_name).lower() or '_'
+
+
 class MemoryBank:
-    """Long-term memory for storing company research"""
+    """
+    Long-term memory for storing company research
+    Held in memory and persisted as one JSON file per company. Stores only
+    touch memory and mark the record dirty; dirty records are written in one
+    batch by a background timer FLUSH_DELAY seconds later, as soon as
+    FLUSH_EVERY records are pending, and at exit. Reads are a plain lookup:
+    their access times are noted and folded into the next flush. A JSON
+    memory bank from earlier versions is imported into a new directory once.
+    """
+    FLUSH_DELAY = 2.0
+    FLUSH_EVERY = 20
     
-    def __init__(self, memory_file: str = 'memory_bank.json'):
-        self.memory_file = memory_file
-        self.memory = self._load_memory()
+    def __init__(self, memory_dir: str = 'memory_bank', legacy_file: str = 'memory_bank.json'):
+        self.memory_dir = memory_dir
         self.logger = setup_logger('Memory')
+        self.memory = self._load_memory()
+        self._dirty = set()
+        self._accessed = {}  # key -> last_accessed not yet applied to the record
+        self._flush_timer = None
+        self._lock = threading.Lock()
+        if not os.path.isdir(self.memory_dir):
+            self._import_legacy(legacy_file)
+        atexit.register(self.flush)
+    
+    def _import_legacy(self, legacy_file: str):
+        # Saving the records creates memory_dir, so the import only ever runs before it exists
+        if not legacy_file or not os.path.exists(legacy_file):
+            return
+        try:
+            with open(legacy_file, 'rb') as f:
+                legacy = json_loads(f.read())
+        except Exception as e:
+            self.logger.error(f"Failed to import memory from {legacy_file}: {e}")
+            return
+        
+        # Old records were keyed by the lowercased name; only this script's
+        # format is taken (main.py's memory bank used the same file name)
+        for record in legacy.values():
+            if isinstance(record, dict) and 'research_data' in record:
+                key = company_key(record['company_name'])
+                self.memory[key] = record
+                self._save_record(key)
+        if self.memory:
+            self.logger.info(f"📥 Imported {len(self.memory)} records from {legacy_file}")
+    
+    def _record_path(self, key: str) -> str:
+        return os.path.join(self.memory_dir, f"{key}.json")
     
     def _load_memory(self) -> Dict:
-        if os.path.exists(self.memory_file):
-            try:
-                with open(self.memory_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
-    
-    def _save_memory(self):
+        memory = {}
+        if os.path.isdir(self.memory_dir):
+            for filename in os.listdir(self.memory_dir):
+                if not filename.endswith('.json'):
+                    continue
+                try:
+                    with open(os.path.join(self.memory_dir, filename), 'rb') as f:
+                        memory[filename[:-len('.json')]] = json_loads(f.read())
+                except Exception:
+                    continue  # skip an unreadable record rather than losing the rest
+        return memory
+    
+    def _save_record(self, key: str):
+        path = self._record_path(key)
+        tmp_path = path + '.tmp'
         try:
-            with open(self.memory_file, 'w') as f:
-                json.dump(self.memory, f, indent=2)
+            os.makedirs(self.memory_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps_bytes(self.memory[key], indent=True))
+            os.replace(tmp_path, path)  # atomic: readers never see a half-written record
         except Exception as e:
             self.logger.error(f"Failed to save memory: {e}")
     
-    def store_company_research(self, company_name: str, research_data: Dict):
-        key = company_name.lower().strip()
+    def _mark_dirty(self, key: str):
+        # Writes happen on the timer thread, off the pipeline's event loop
+        with self._lock:
+            self._dirty.add(key)
+            flush_now = len(self._dirty) >= self.FLUSH_EVERY
+            if self._flush_timer is not None:
+                if not flush_now:
+                    return
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(0 if flush_now else self.FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write out every record changed since it was last saved"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            accessed, self._accessed = self._accessed, {}
+            self._flush_timer = None
+        for key, last_accessed in accessed.items():
+            self.memory[key]['last_accessed'] = last_accessed
+        for key in dirty | accessed.keys():
+            self._save_record(key)
+    
+    def store_company_research(self, company_name: str, research_data: Dict, now: Optional[str] = None):
+        # now: ISO timestamp the caller already has for this run (defaults to the current time)
+        key = company_key(company_name)
+        now = now or datetime.now().isoformat()
         self.memory[key] = {
             'company_name': company_name,
             'research_data': research_data,
-            'timestamp': datetime.now().isoformat(),
-            'last_accessed': datetime.now().isoformat()
+            'timestamp': now,
+            'last_accessed': now
         }
-        self._save_memory()
+        with self._lock:  # flush() swaps _accessed under the lock
+            self._accessed.pop(key, None)
+        self._mark_dirty(key)
         self.logger.info(f"✅ Stored research for {company_name}")
     
     def get_company_research(self, company_name: str) -> Optional[Dict]:
-        key = company_name.lower().strip()
-        if key in self.memory:
-            self.memory[key]['last_accessed'] = datetime.now().isoformat()
-            self._save_memory()
-            self.logger.info(f"📖 Retrieved cached research for {company_name}")
-            return self.memory[key]['research_data']
-        return None
+        key = company_key(company_name)
+        record = self.memory.get(key)
+        if record is None:
+            return None
+        
+        with self._lock:  # flush() swaps _accessed under the lock
+            self._accessed[key] = datetime.now().isoformat()
+        self.logger.info(f"📖 Retrieved cached research for {company_name}")
+        # Shallow copy so callers can't replace the cached report's fields
+        return dict(record['research_data'])
     
     def has_company(self, company_name: str) -> bool:
-        key = company_name.lower().strip()
-        return key in self.memory
+        return company_key(company_name) in self.memory
 
 
+session_logger = setup_logger('Session')
+
 class SessionState:
     """Maintains state during a single agent execution"""
     
     def __init__(self):
-        self.state = {
-            'session_id': datetime.now().strftime('%Y%m%d_%H%M%S'),
-            'company_name': None,
-            'research_results': None,
-            'analysis_results': None,
-            'contact_results': None,
-            'outreach_results': None,
-            'errors': []
-        }
-        self.logger = setup_logger('Session')
+        self.state = {}
+        self.logger = session_logger
+        self.reset()
+    
+    def reset(self):
+        """Start a new session, reusing this object's state dict"""
+        self.state.clear()
+        self.state.update(
+            session_id=datetime.now().strftime('%Y%m%d_%H%M%S'),
+            company_name=None,
+            research_results=None,
+            analysis_results=None,
+            contact_results=None,
+            outreach_results=None,
+            errors=[]
+        )
         self.logger.info(f"🆕 Created new session: {self.state['session_id']}")
     
     def update(self, key: str, value):
@@ -146,20 +354,93 @@ class SessionState:
     def get(self, key: str):
         return self.state.get(key)
     
-    def add_error(self, error: str):
+    def add_error(self, error: str, ts: Optional[str] = None):
         self.state['errors'].append({
             'error': error,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts or datetime.now().isoformat()
         })
     
     def get_full_state(self) -> Dict:
         return self.state.copy()
 
 
+class SessionStatePool:
+    """Recycles SessionState objects across pipeline runs instead of allocating one per company"""
+    
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._free: List[SessionState] = []
+    
+    def acquire(self) -> SessionState:
+        if self._free:
+            session = self._free.pop()
+            session.reset()
+            return session
+        return SessionState()
+    
+    def release(self, session: SessionState):
+        # The released session must no longer be referenced by its pipeline run
+        if len(self._free) < self.max_size:
+            self._free.append(session)
+
+_SESSION_POOL = SessionStatePool()
+
+
+# ============================================================================
+# RESULT TYPES - What each agent hands to the next
+# ============================================================================
+
+# Slotted dataclasses: compact per-company results with attribute access;
+# only the final report is a plain dict (it is returned, cached and saved)
+
+@dataclass(slots=True)
+class ResearchResult:
+    company_name: str
+    company_info: Dict[str, Any] = field(default_factory=dict)
+    recent_news: List[str] = field(default_factory=list)
+    research_status: str = 'completed'
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class AnalysisResult:
+    company_name: str
+    analysis: str = ''
+    key_challenges: List[str] = field(default_factory=list)
+    opportunities: List[str] = field(default_factory=list)
+    recommended_approach: List[str] = field(default_factory=list)
+    analysis_status: str = 'completed'
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ContactResult:
+    company_name: str
+    total_contacts_found: int = 0
+    prioritized_contacts: List[Dict] = field(default_factory=list)
+    contact_status: str = 'completed'
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class OutreachResult:
+    company_name: str
+    emails_generated: int = 0
+    outreach_emails: List[Dict] = field(default_factory=list)
+    outreach_status: str = 'completed'
+    error: Optional[str] = None
+
+
 # ============================================================================
 # SEARCH TOOL (Custom Tool)
 # ============================================================================
 
+@functools.lru_cache(maxsize=1024)
+def _slug(company_name: str) -> str:
+    """Company name as used in its (simulated) website and email domain"""
+    return company_name.lower().replace(' ', '')
+
+
 class GoogleSearchTool:
     """Custom search tool for company research"""
     
@@ -178,7 +459,7 @@ class GoogleSearchTool:
             'size': "100-500 employees",
             'founded': "2015",
             'location': "San Francisco, CA",
-            'website': f"www.{company_name.lower().replace(' ', '')}.com",
+            'website': f"www.{_slug(company_name)}.com",
             'recent_news': [
                 f"{company_name} announces new product launch",
                 f"{company_name} raises Series B funding",
@@ -198,27 +479,28 @@ class GoogleSearchTool:
         log_tool_call('ContactSearch', {'company': company_name})
         self.logger.info(f"👥 Searching for contacts at: {company_name}")
         
+        domain = _slug(company_name)
         contacts = [
             {
                 'name': 'John Smith',
                 'title': 'Chief Technology Officer',
                 'department': 'Technology',
                 'linkedin': f'linkedin.com/in/johnsmith',
-                'email': f'john.smith@{company_name.lower().replace(" ", "")}.com'
+                'email': f'john.smith@{domain}.com'
             },
             {
                 'name': 'Sarah Johnson',
                 'title': 'VP of Engineering',
                 'department': 'Engineering',
                 'linkedin': f'linkedin.com/in/sarahjohnson',
-                'email': f'sarah.johnson@{company_name.lower().replace(" ", "")}.com'
+                'email': f'sarah.johnson@{domain}.com'
             },
             {
                 'name': 'Michael Chen',
                 'title': 'Director of Product',
                 'department': 'Product',
                 'linkedin': f'linkedin.com/in/michaelchen',
-                'email': f'michael.chen@{company_name.lower().replace(" ", "")}.com'
+                'email': f'michael.chen@{domain}.com'
             }
         ]
         
@@ -253,7 +535,7 @@ class ResearchAgent:
         self.logger = setup_logger('ResearchAgent')
         self.logger.info(f"✅ {self.name} initialized")
     
-    def execute(self, company_name: str) -> Dict:
+    def execute(self, company_name: str) -> ResearchResult:
         log_agent_start(self.name, {'company_name': company_name})
         
         try:
@@ -263,53 +545,92 @@ class ResearchAgent:
             self.logger.info(f"Step 2: Gathering recent news")
             recent_news = self.search_tool.search_company_news(company_name, limit=5)
             
-            research_data = {
-                'company_name': company_name,
-                'company_info': company_info,
-                'recent_news': recent_news,
-                'research_status': 'completed'
-            }
+            research_data = ResearchResult(company_name, company_info, recent_news)
             
             log_agent_complete(self.name, f"Completed research for {company_name}")
             return research_data
             
         except Exception as e:
             log_agent_error(self.name, e)
-            return {
-                'company_name': company_name,
-                'error': str(e),
-                'research_status': 'failed'
-            }
+            return ResearchResult(company_name, research_status='failed', error=str(e))
+    
+    async def execute_async(self, company_name: str) -> ResearchResult:
+        log_agent_start(self.name, {'company_name': company_name})
+        
+        try:
+            # The two searches are independent; the search tool is synchronous,
+            # so each runs on its own worker thread and they overlap
+            self.logger.info(f"Gathering company overview and recent news")
+            company_info, recent_news = await asyncio.gather(
+                asyncio.to_thread(self.search_tool.search_company_info, company_name),
+                asyncio.to_thread(self.search_tool.search_company_news, company_name, 5)
+            )
+            
+            research_data = ResearchResult(company_name, company_info, recent_news)
+            
+            log_agent_complete(self.name, f"Completed research for {company_name}")
+            return research_data
+            
+        except Exception as e:
+            log_agent_error(self.name, e)
+            return ResearchResult(company_name, research_status='failed', error=str(e))
 
 
 # ============================================================================
 # AGENT 2: ANALYSIS AGENT (Uses Gemini!)
 # ============================================================================
 
+# Body of each report section: from its header up to the next section's header (or the end)
+_SECTION_RES = {
+    'challenges': re.compile(r'KEY BUSINESS CHALLENGES(.*?)(?:OPPORTUNITIES|\Z)', re.DOTALL),
+    'opportunities': re.compile(r'OPPORTUNITIES(.*?)(?:RECOMMENDED|\Z)', re.DOTALL),
+    'approach': re.compile(r'RECOMMENDED SALES APPROACH(.*)', re.DOTALL),
+}
+_ANALYSIS_PROMPT_TMPL = """
+Company: {company_name}
+Industry: {industry}
+Size: {size}
+Location: {location}
+
+Recent News:
+{news}
+
+
+Based on this information, provide:
+
+1. KEY BUSINESS CHALLENGES (3-5 challenges they likely face)
+2. OPPORTUNITIES (How solutions could help)
+3. RECOMMENDED SALES APPROACH (What to emphasize in outreach)
+
+Be specific and actionable."""
+# One item per non-blank, non-heading line, without list numbering/bullets or surrounding whitespace
+_ITEM_LINE_RE = re.compile(r'^[ \t]*(?!#)[1-9.\-) \t]*([^1-9.\-)\s][^\n]*?)[ \t\r]*$', re.MULTILINE)
+
 class AnalysisAgent:
     """Analyzes company data using Gemini LLM"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[genai.Client] = None):
         self.name = "Analysis Agent"
         self.logger = setup_logger('AnalysisAgent')
         
-        api_key = os.getenv('GOOGLE_API_KEY')
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found in .env file")
-        
-        self.client = genai.Client(api_key=api_key)
+        self.client = client or get_client()
         self.model_name = os.getenv('MODEL_NAME', 'gemini-2.0-flash-exp')
+        self._memo: Dict[str, AnalysisResult] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # One Gemini semaphore per event loop (see loop_semaphore)
+        self._sems = weakref.WeakKeyDictionary()
         self.logger.info(f"✅ {self.name} initialized with {self.model_name}")
     
-    def execute(self, research_data: Dict) -> Dict:
-        log_agent_start(self.name, {'company': research_data.get('company_name')})
+    def execute(self, research_data: ResearchResult) -> AnalysisResult:
+        company_name = research_data.company_name
+        log_agent_start(self.name, {'company': company_name})
         
         try:
-            company_name = research_data.get('company_name')
-            company_info = research_data.get('company_info', {})
-            recent_news = research_data.get('recent_news', [])
-            
-            prompt = self._create_prompt(company_name, company_info, recent_news)
+            prompt = self._create_prompt(company_name, research_data.company_info, research_data.recent_news)
+            key = prompt_key(prompt)
+            memoized = memo_get(self._memo, key)
+            if memoized is not None:
+                return self._memoized_analysis(memoized, company_name)
             
             self.logger.info(f"🤖 Calling Gemini API for analysis")
             response = self.client.models.generate_content(
@@ -318,63 +639,106 @@ class AnalysisAgent:
                 config=types.GenerateContentConfig(temperature=0.7, max_output_tokens=2000)
             )
             
-            analysis_text = response.text
+            analysis_data = self._build_analysis_data(company_name, response.text)
+            memo_put(self._memo, key, analysis_data)
+            return copy.deepcopy(analysis_data)
             
-            analysis_data = {
-                'company_name': company_name,
-                'analysis': analysis_text,
-                'key_challenges': self._extract_section(analysis_text, "KEY BUSINESS CHALLENGES", "OPPORTUNITIES"),
-                'opportunities': self._extract_section(analysis_text, "OPPORTUNITIES", "RECOMMENDED"),
-                'recommended_approach': self._extract_section(analysis_text, "RECOMMENDED SALES APPROACH", "END"),
-                'analysis_status': 'completed'
-            }
+        except Exception as e:
+            log_agent_error(self.name, e)
+            return AnalysisResult(company_name, analysis_status='failed', error=str(e))
+    
+    async def execute_async(self, research_data: ResearchResult) -> AnalysisResult:
+        company_name = research_data.company_name
+        log_agent_start(self.name, {'company': company_name})
+        
+        try:
+            prompt = self._create_prompt(company_name, research_data.company_info, research_data.recent_news)
+            key = prompt_key(prompt)
+            memoized = memo_get(self._memo, key)
+            if memoized is not None:
+                return self._memoized_analysis(memoized, company_name)
             
-            log_agent_complete(self.name, f"Analysis complete for {company_name}")
-            return analysis_data
+            # Concurrent runs of the same prompt share one Gemini call
+            analysis_data = await single_flight(self._inflight, key, lambda: self._analyze_async(company_name, prompt))
+            memo_put(self._memo, key, analysis_data)
+            return copy.deepcopy(analysis_data)
             
         except Exception as e:
             log_agent_error(self.name, e)
-            return {
-                'company_name': research_data.get('company_name'),
-                'error': str(e),
-                'analysis_status': 'failed'
-            }
+            return AnalysisResult(company_name, analysis_status='failed', error=str(e))
     
-    def _create_prompt(self, company_name: str, company_info: Dict, recent_news: list) -> str:
-        context = f"""
-Company: {company_name}
-Industry: {company_info.get('industry', 'N/A')}
-Size: {company_info.get('size', 'N/A')}
-Location: {company_info.get('location', 'N/A')}
-
-Recent News:
-{chr(10).join(f'- {news}' for news in recent_news)}
-"""
+    async def _analyze_async(self, company_name: str, prompt: str) -> AnalysisResult:
+        # The response is streamed and each section is parsed as soon as the next
+        # header closes it, so parsing overlaps with the rest of the download
+        async with loop_semaphore(self._sems):
+            self.logger.info(f"🤖 Streaming Gemini API (async) analysis")
+            text, sections = '', {}
+            pending = ['challenges', 'opportunities']  # 'approach' runs to the end of the text
+            async for chunk in await self.client.aio.models.generate_content_stream(
+                model=self.model_name,
+                contents=prompt,
+                config=types.GenerateContentConfig(temperature=0.7, max_output_tokens=2000)
+            ):
+                text += chunk.text or ''
+                while pending:
+                    match = _SECTION_RES[pending[0]].search(text)
+                    if not match or match.end(1) == len(text):  # not started, or not closed yet
+                        break
+                    sections[pending.pop(0)] = _ITEM_LINE_RE.findall(match.group(1))[:5]
+        return self._build_analysis_data(company_name, text, sections)
+    
+    def _memoized_analysis(self, memoized: AnalysisResult, company_name: str) -> AnalysisResult:
+        self.logger.info(f"♻️ Reusing analysis of an identical prompt (no Gemini call)")
+        analysis_data = copy.deepcopy(memoized)
+        analysis_data.company_name = company_name
+        log_agent_complete(self.name, f"Analysis complete for {company_name} (memoized)")
+        return analysis_data
+    
+    def _build_analysis_data(self, company_name: str, analysis_text: str, sections: Optional[Dict[str, list]] = None) -> AnalysisResult:
+        # sections: items already parsed while streaming; the rest are parsed here
+        sections = dict(sections or {})
+        for section in _SECTION_RES:
+            if section not in sections:
+                sections[section] = self._extract_section(analysis_text, section)
         
-        return f"""{context}
-
-Based on this information, provide:
-
-1. KEY BUSINESS CHALLENGES (3-5 challenges they likely face)
-2. OPPORTUNITIES (How solutions could help)
-3. RECOMMENDED SALES APPROACH (What to emphasize in outreach)
-
-Be specific and actionable."""
+        analysis_data = AnalysisResult(
+            company_name,
+            analysis=analysis_text,
+            key_challenges=sections['challenges'],
+            opportunities=sections['opportunities'],
+            recommended_approach=sections['approach']
+        )
+        
+        log_agent_complete(self.name, f"Analysis complete for {company_name}")
+        return analysis_data
     
-    def _extract_section(self, text: str, start: str, end: str) -> list:
-        if start not in text:
+    def _create_prompt(self, company_name: str, company_info: Dict, recent_news: list) -> str:
+        return _ANALYSIS_PROMPT_TMPL.format(
+            company_name=company_name,
+            industry=company_info.get('industry', 'N/A'),
+            size=company_info.get('size', 'N/A'),
+            location=company_info.get('location', 'N/A'),
+            news='\n'.join(map('- {}'.format, recent_news))
+        )
+    
+    def _extract_section(self, text: str, section: str) -> list:
+        match = _SECTION_RES[section].search(text)
+        if not match:
             return []
-        section = text.split(start)[1]
-        if end != "END" and end in section:
-            section = section.split(end)[0]
-        lines = [line.strip() for line in section.split('\n') if line.strip() and not line.strip().startswith('#')]
-        return [line.lstrip('123456789.-) ') for line in lines if line.strip()][:5]
+        return _ITEM_LINE_RE.findall(match.group(1))[:5]
 
 
 # ============================================================================
 # AGENT 3: CONTACT AGENT
 # ============================================================================
 
+# Title scoring: +10 for a senior title, +5 for a technology/engineering title.
+# Substring matches, as in mock mode, so "SVP"/"EVP" count as "vp"
+_TITLE_RE = re.compile(r'cto|vp|chief|director|head', re.IGNORECASE)
+_DOMAIN_RE = re.compile(r'technology|engineering', re.IGNORECASE)
+# Only the top contacts are reported and emailed
+MAX_PRIORITY_CONTACTS = 3
+
 class ContactAgent:
     """Finds and prioritizes decision makers"""
     
@@ -384,7 +748,7 @@ class ContactAgent:
         self.logger = setup_logger('ContactAgent')
         self.logger.info(f"✅ {self.name} initialized")
     
-    def execute(self, company_name: str, analysis_data: Dict) -> Dict:
+    def execute(self, company_name: str, analysis_data: Optional[AnalysisResult] = None) -> ContactResult:
         log_agent_start(self.name, {'company': company_name})
         
         try:
@@ -394,68 +758,69 @@ class ContactAgent:
             self.logger.info(f"Prioritizing {len(contacts)} contacts")
             prioritized = self._prioritize_contacts(contacts)
             
-            contact_data = {
-                'company_name': company_name,
-                'total_contacts_found': len(contacts),
-                'prioritized_contacts': prioritized,
-                'contact_status': 'completed'
-            }
+            contact_data = ContactResult(company_name, len(contacts), prioritized)
             
             log_agent_complete(self.name, f"Found {len(contacts)} contacts")
             return contact_data
             
         except Exception as e:
             log_agent_error(self.name, e)
-            return {
-                'company_name': company_name,
-                'error': str(e),
-                'contact_status': 'failed'
-            }
+            return ContactResult(company_name, contact_status='failed', error=str(e))
+    
+    async def execute_async(self, company_name: str, analysis_data: Optional[AnalysisResult] = None) -> ContactResult:
+        return await asyncio.to_thread(self.execute, company_name, analysis_data)
     
     def _prioritize_contacts(self, contacts: List[Dict]) -> List[Dict]:
-        priority_titles = ['CTO', 'VP', 'Chief', 'Director', 'Head']
-        
         for contact in contacts:
-            title = contact.get('title', '')
-            priority_score = 0
-            
-            for priority_title in priority_titles:
-                if priority_title.lower() in title.lower():
-                    priority_score += 10
-                    break
-            
-            if 'technology' in title.lower() or 'engineering' in title.lower():
-                priority_score += 5
-            
-            contact['priority_score'] = priority_score
+            contact['priority_score'] = self._score_title(contact.get('title', ''))
         
-        return sorted(contacts, key=lambda x: x.get('priority_score', 0), reverse=True)
+        return heapq.nlargest(MAX_PRIORITY_CONTACTS, contacts, key=lambda x: x.get('priority_score', 0))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _score_title(title: str) -> int:
+        # Titles repeat heavily across companies, so scores are memoized per title
+        return (10 if _TITLE_RE.search(title) else 0) + (5 if _DOMAIN_RE.search(title) else 0)
 
 
 # ============================================================================
 # AGENT 4: OUTREACH AGENT (Uses Gemini!)
 # ============================================================================
 
+_EMAIL_PROMPT_TMPL = """Write a professional sales email to:
+Name: {name}
+Title: {title}
+Company: {company_name}
+
+Key challenges they face:
+{challenges}
+
+Opportunities for our solution:
+{opportunities}
+
+Write 150-200 words. Be specific to their company. Include clear call-to-action.
+Only write the email body (no subject line, no signature)."""
+
 class OutreachAgent:
     """Generates personalized emails using Gemini"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[genai.Client] = None):
         self.name = "Outreach Agent"
         self.logger = setup_logger('OutreachAgent')
         
-        api_key = os.getenv('GOOGLE_API_KEY')
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found")
-        
-        self.client = genai.Client(api_key=api_key)
+        self.client = client or get_client()
         self.model_name = os.getenv('MODEL_NAME', 'gemini-2.0-flash-exp')
+        self._memo: Dict[str, str] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # One Gemini semaphore per event loop (see loop_semaphore)
+        self._sems = weakref.WeakKeyDictionary()
         self.logger.info(f"✅ {self.name} initialized")
     
-    def execute(self, company_name: str, analysis_data: Dict, contact_data: Dict) -> Dict:
+    def execute(self, company_name: str, analysis_data: AnalysisResult, contact_data: ContactResult) -> OutreachResult:
         log_agent_start(self.name, {'company': company_name})
         
         try:
-            contacts = contact_data.get('prioritized_contacts', [])
+            contacts = contact_data.prioritized_contacts
             emails = []
             
             for contact in contacts[:3]:
@@ -463,62 +828,100 @@ class OutreachAgent:
                 email = self._generate_email(contact, analysis_data, company_name)
                 emails.append(email)
             
-            outreach_data = {
-                'company_name': company_name,
-                'emails_generated': len(emails),
-                'outreach_emails': emails,
-                'outreach_status': 'completed'
-            }
+            outreach_data = OutreachResult(company_name, len(emails), emails)
             
             log_agent_complete(self.name, f"Generated {len(emails)} emails")
             return outreach_data
             
         except Exception as e:
             log_agent_error(self.name, e)
-            return {
-                'company_name': company_name,
-                'error': str(e),
-                'outreach_status': 'failed'
-            }
+            return OutreachResult(company_name, outreach_status='failed', error=str(e))
     
-    def _generate_email(self, contact: Dict, analysis_data: Dict, company_name: str) -> Dict:
-        challenges = analysis_data.get('key_challenges', [])
-        opportunities = analysis_data.get('opportunities', [])
-        
-        prompt = f"""Write a professional sales email to:
-Name: {contact.get('name')}
-Title: {contact.get('title')}
-Company: {company_name}
-
-Key challenges they face:
-{chr(10).join(f'- {c}' for c in challenges[:3])}
-
-Opportunities for our solution:
-{chr(10).join(f'- {o}' for o in opportunities[:2])}
-
-Write 150-200 words. Be specific to their company. Include clear call-to-action.
-Only write the email body (no subject line, no signature)."""
+    async def execute_async(self, company_name: str, analysis_data: AnalysisResult, contact_data: ContactResult) -> OutreachResult:
+        log_agent_start(self.name, {'company': company_name})
         
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(temperature=0.8, max_output_tokens=800)
+            contacts = contact_data.prioritized_contacts[:3]
+            
+            # Emails are independent, so all Gemini calls are in flight at once
+            self.logger.info(f"Generating {len(contacts)} emails concurrently")
+            results = await asyncio.gather(
+                *(self._generate_email_async(contact, analysis_data, company_name) for contact in contacts),
+                return_exceptions=True
             )
+            emails = [
+                {'recipient': contact.get('name'), 'error': str(result)} if isinstance(result, Exception) else result
+                for contact, result in zip(contacts, results)
+            ]
+            
+            outreach_data = OutreachResult(company_name, len(emails), emails)
+            
+            log_agent_complete(self.name, f"Generated {len(emails)} emails")
+            return outreach_data
             
-            return {
-                'recipient': contact.get('name'),
-                'title': contact.get('title'),
-                'email_address': contact.get('email'),
-                'subject': f"Helping {company_name} with {challenges[0][:30] if challenges else 'growth'}...",
-                'body': response.text,
-                'priority_score': contact.get('priority_score', 0)
-            }
+        except Exception as e:
+            log_agent_error(self.name, e)
+            return OutreachResult(company_name, outreach_status='failed', error=str(e))
+    
+    def _generate_email(self, contact: Dict, analysis_data: AnalysisResult, company_name: str) -> Dict:
+        prompt = self._create_email_prompt(contact, analysis_data, company_name)
+        key = prompt_key(prompt)
+        
+        try:
+            body = memo_get(self._memo, key)
+            if body is None:
+                response = self.client.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(temperature=0.8, max_output_tokens=800)
+                )
+                body = response.text
+                memo_put(self._memo, key, body)
+            return self._build_email(contact, analysis_data, company_name, body)
         except Exception as e:
             return {
                 'recipient': contact.get('name'),
                 'error': str(e)
             }
+    
+    async def _generate_email_async(self, contact: Dict, analysis_data: AnalysisResult, company_name: str) -> Dict:
+        prompt = self._create_email_prompt(contact, analysis_data, company_name)
+        key = prompt_key(prompt)
+        
+        body = memo_get(self._memo, key)
+        if body is None:
+            body = await single_flight(self._inflight, key, lambda: self._write_email_async(prompt))
+            memo_put(self._memo, key, body)
+        return self._build_email(contact, analysis_data, company_name, body)
+    
+    async def _write_email_async(self, prompt: str) -> str:
+        async with loop_semaphore(self._sems):
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config=types.GenerateContentConfig(temperature=0.8, max_output_tokens=800)
+            )
+        return response.text
+    
+    def _create_email_prompt(self, contact: Dict, analysis_data: AnalysisResult, company_name: str) -> str:
+        return _EMAIL_PROMPT_TMPL.format(
+            name=contact.get('name'),
+            title=contact.get('title'),
+            company_name=company_name,
+            challenges='\n'.join(map('- {}'.format, analysis_data.key_challenges[:3])),
+            opportunities='\n'.join(map('- {}'.format, analysis_data.opportunities[:2]))
+        )
+    
+    def _build_email(self, contact: Dict, analysis_data: AnalysisResult, company_name: str, body: str) -> Dict:
+        challenges = analysis_data.key_challenges
+        return {
+            'recipient': contact.get('name'),
+            'title': contact.get('title'),
+            'email_address': contact.get('email'),
+            'subject': f"Helping {company_name} with {challenges[0][:30] if challenges else 'growth'}...",
+            'body': body,
+            'priority_score': contact.get('priority_score', 0)
+        }
 
 
 # ============================================================================
@@ -533,25 +936,46 @@ class SalesIntelligenceOrchestrator:
         self.logger.info("🚀 Initializing Sales Intelligence System")
         
         self.memory_bank = MemoryBank()
-        self.session = None
         
         try:
+            client = get_client()
             self.research_agent = ResearchAgent()
-            self.analysis_agent = AnalysisAgent()
+            self.analysis_agent = AnalysisAgent(client)
             self.contact_agent = ContactAgent()
-            self.outreach_agent = OutreachAgent()
+            self.outreach_agent = OutreachAgent(client)
             self.logger.info("✅ All agents initialized")
         except Exception as e:
             self.logger.error(f"❌ Failed to initialize: {e}")
             raise
     
     def process_company(self, company_name: str, use_cache: bool = True) -> dict:
-        self.logger.info(f"\n{'='*60}")
+        return asyncio.run(self.process_company_async(company_name, use_cache))
+    
+    def process_companies(self, company_names: List[str], max_concurrency: int = 8, use_cache: bool = True) -> List[dict]:
+        return asyncio.run(self.process_companies_async(company_names, max_concurrency, use_cache))
+    
+    async def process_companies_async(self, company_names: List[str], max_concurrency: int = 8, use_cache: bool = True) -> List[dict]:
+        # Each company runs the full pipeline; the semaphore caps how many are in flight
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(company_name: str) -> dict:
+            async with semaphore:
+                return await self.process_company_async(company_name, use_cache)
+        
+        return await asyncio.gather(*(bounded(company_name) for company_name in company_names))
+    
+    async def process_company_async(self, company_name: str, use_cache: bool = True) -> dict:
+        # Banners are DEBUG-only: they add nothing once several companies interleave
+        banners = self.logger.isEnabledFor(logging.DEBUG)
+        if banners:
+            self.logger.debug("=" * 60)
         self.logger.info(f"🎯 Starting intelligence for: {company_name}")
-        self.logger.info(f"{'='*60}\n")
         
-        self.session = SessionState()
-        self.session.update('company_name', company_name)
+        # Session is per pipeline run so concurrent companies don't share state
+        session = _SESSION_POOL.acquire()
+        session.update('company_name', company_name)
+        # Agent memos are skipped for this run (and tasks it starts) unless use_cache
+        memo_token = _MEMO_ENABLED.set(use_cache)
         
         try:
             # Check cache
@@ -559,82 +983,87 @@ class SalesIntelligenceOrchestrator:
                 self.logger.info(f"📚 Using cached results")
                 return self.memory_bank.get_company_research(company_name)
             
-            # SEQUENTIAL EXECUTION
-            self.logger.info("\n" + "="*60)
-            self.logger.info("STEP 1: Research Agent")
-            self.logger.info("="*60)
-            research_results = self.research_agent.execute(company_name)
-            self.session.update('research_results', research_results)
+            if banners:
+                self.logger.debug("=" * 60)
+            self.logger.info(f"STEP 1: Research Agent ({company_name})")
+            research_results = await self.research_agent.execute_async(company_name)
+            session.update('research_results', research_results)
             
-            if research_results.get('research_status') == 'failed':
-                raise Exception(f"Research failed: {research_results.get('error')}")
+            if research_results.research_status == 'failed':
+                raise Exception(f"Research failed: {research_results.error}")
             
-            self.logger.info("\n" + "="*60)
-            self.logger.info("STEP 2: Analysis Agent")
-            self.logger.info("="*60)
-            analysis_results = self.analysis_agent.execute(research_results)
-            self.session.update('analysis_results', analysis_results)
-            
-            if analysis_results.get('analysis_status') == 'failed':
-                raise Exception(f"Analysis failed: {analysis_results.get('error')}")
+            # Contact search only needs the company name, so it runs alongside the analysis
+            if banners:
+                self.logger.debug("=" * 60)
+            self.logger.info(f"STEP 2+3: Analysis Agent + Contact Agent (parallel) ({company_name})")
+            analysis_results, contact_results = await asyncio.gather(
+                self.analysis_agent.execute_async(research_results),
+                self.contact_agent.execute_async(company_name)
+            )
+            session.update('analysis_results', analysis_results)
+            session.update('contact_results', contact_results)
             
-            self.logger.info("\n" + "="*60)
-            self.logger.info("STEP 3: Contact Agent")
-            self.logger.info("="*60)
-            contact_results = self.contact_agent.execute(company_name, analysis_results)
-            self.session.update('contact_results', contact_results)
+            if analysis_results.analysis_status == 'failed':
+                raise Exception(f"Analysis failed: {analysis_results.error}")
             
-            if contact_results.get('contact_status') == 'failed':
-                raise Exception(f"Contact failed: {contact_results.get('error')}")
+            if contact_results.contact_status == 'failed':
+                raise Exception(f"Contact failed: {contact_results.error}")
             
-            self.logger.info("\n" + "="*60)
-            self.logger.info("STEP 4: Outreach Agent")
-            self.logger.info("="*60)
-            outreach_results = self.outreach_agent.execute(company_name, analysis_results, contact_results)
-            self.session.update('outreach_results', outreach_results)
+            if banners:
+                self.logger.debug("=" * 60)
+            self.logger.info(f"STEP 4: Outreach Agent ({company_name})")
+            outreach_results = await self.outreach_agent.execute_async(company_name, analysis_results, contact_results)
+            session.update('outreach_results', outreach_results)
             
-            if outreach_results.get('outreach_status') == 'failed':
-                raise Exception(f"Outreach failed: {outreach_results.get('error')}")
+            if outreach_results.outreach_status == 'failed':
+                raise Exception(f"Outreach failed: {outreach_results.error}")
             
-            # Compile report
+            # Compile report; the report and its memory record share one timestamp
+            now_iso = datetime.now().isoformat()
             final_report = self._compile_report(
                 company_name, research_results, analysis_results, 
-                contact_results, outreach_results
+                contact_results, outreach_results, session, now_iso
             )
             
             # Store in memory
-            self.memory_bank.store_company_research(company_name, final_report)
+            self.memory_bank.store_company_research(company_name, final_report, now_iso)
             
-            self.logger.info("\n" + "="*60)
             self.logger.info(f"✅ Complete for {company_name}!")
-            self.logger.info("="*60 + "\n")
+            if banners:
+                self.logger.debug("=" * 60)
             
             return final_report
             
         except Exception as e:
             self.logger.error(f"❌ Pipeline failed: {e}")
-            self.session.add_error(str(e))
+            session.add_error(str(e))
             return {
                 'company_name': company_name,
                 'status': 'failed',
                 'error': str(e)
             }
+        
+        finally:
+            _MEMO_ENABLED.reset(memo_token)
+            _SESSION_POOL.release(session)
     
-    def _compile_report(self, company_name, research, analysis, contacts, outreach) -> dict:
+    def _compile_report(self, company_name, research: ResearchResult, analysis: AnalysisResult,
+                        contacts: ContactResult, outreach: OutreachResult, session,
+                        now_iso: Optional[str] = None) -> dict:
         return {
             'company_name': company_name,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now_iso or datetime.now().isoformat(),
             'status': 'success',
-            'company_overview': research.get('company_info', {}),
-            'recent_news': research.get('recent_news', []),
-            'key_challenges': analysis.get('key_challenges', []),
-            'opportunities': analysis.get('opportunities', []),
-            'recommended_approach': analysis.get('recommended_approach', ''),
-            'full_analysis': analysis.get('analysis', ''),
-            'total_contacts_found': contacts.get('total_contacts_found', 0),
-            'priority_contacts': contacts.get('prioritized_contacts', [])[:3],
-            'outreach_emails': outreach.get('outreach_emails', []),
-            'session_id': self.session.get('session_id')
+            'company_overview': research.company_info,
+            'recent_news': research.recent_news,
+            'key_challenges': analysis.key_challenges,
+            'opportunities': analysis.opportunities,
+            'recommended_approach': analysis.recommended_approach,
+            'full_analysis': analysis.analysis,
+            'total_contacts_found': contacts.total_contacts_found,
+            'priority_contacts': contacts.prioritized_contacts[:3],
+            'outreach_emails': outreach.outreach_emails,
+            'session_id': session.get('session_id')
         }
     
     def save_report(self, report: dict):
@@ -643,32 +1072,40 @@ class SalesIntelligenceOrchestrator:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"reports/{company}_{timestamp}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(json_dumps_bytes(report, indent=True))
         
         self.logger.info(f"💾 Report saved: {filename}")
         return filename
     
     def display_summary(self, report: dict):
-        print("\n" + "="*60)
-        print(f"📊 SALES INTELLIGENCE: {report.get('company_name')}")
-        print("="*60)
+        # Built up as lines and written to stdout in one call
+        lines = [
+            "\n" + "="*60,
+            f"📊 SALES INTELLIGENCE: {report.get('company_name')}",
+            "="*60,
+        ]
         
-        print(f"\n🏢 Company Overview:")
+        lines.append(f"\n🏢 Company Overview:")
         overview = report.get('company_overview', {})
-        print(f"   Industry: {overview.get('industry', 'N/A')}")
-        print(f"   Size: {overview.get('size', 'N/A')}")
+        lines.append(f"   Industry: {overview.get('industry', 'N/A')}")
+        lines.append(f"   Size: {overview.get('size', 'N/A')}")
         
-        print(f"\n🎯 Key Challenges ({len(report.get('key_challenges', []))}):")
-        for i, c in enumerate(report.get('key_challenges', [])[:3], 1):
-            print(f"   {i}. {c}")
+        challenges = report.get('key_challenges', [])
+        lines.append(f"\n🎯 Key Challenges ({len(challenges)}):")
+        for i, c in enumerate(challenges[:3], 1):
+            lines.append(f"   {i}. {c}")
         
-        print(f"\n👥 Priority Contacts ({len(report.get('priority_contacts', []))}):")
-        for contact in report.get('priority_contacts', []):
-            print(f"   • {contact.get('name')} - {contact.get('title')}")
+        contacts = report.get('priority_contacts', [])
+        lines.append(f"\n👥 Priority Contacts ({len(contacts)}):")
+        for contact in contacts:
+            lines.append(f"   • {contact.get('name')} - {contact.get('title')}")
         
-        print(f"\n📧 Emails Generated: {len(report.get('outreach_emails', []))}")
-        print("="*60 + "\n")
+        lines.append(f"\n📧 Emails Generated: {len(report.get('outreach_emails', []))}")
+        lines.append("="*60 + "\n")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 # ============================================================================
@@ -0,0 +1,55 @@
+"""Tests for serving industry template analyses from ResearchAgent output"""
+
+import unittest
+from unittest import mock
+
+from agents.analysis_agent import AnalysisAgent
+from agents.research_agent import ResearchAgent
+
+
+class NoGeminiClient:
+    """Fails the test if the analysis reaches Gemini"""
+
+    @property
+    def models(self):
+        raise AssertionError("Gemini was called")
+
+
+def news_search(*titles):
+    return {"success": True, "results": [{"title": title, "snippet": "", "link": ""} for title in titles]}
+
+
+class IndustryTemplateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.research_agent = ResearchAgent()
+        self.analysis_agent = AnalysisAgent(client=NoGeminiClient())
+
+    def research(self, company_name, news):
+        search_tool = self.research_agent.search_tool
+        searches = {'info': search_tool._simulated_company_search(company_name), 'news': news}
+        with mock.patch.object(search_tool, 'search_all', return_value=searches):
+            return self.research_agent.execute(company_name)
+
+    def test_research_normalizes_industry_and_size(self):
+        research = self.research('Acme Corp', news_search())
+        self.assertEqual(research.company_info['industry'], "Enterprise Software/SaaS")
+        self.assertEqual(research.company_info['size'], "500-10,000 employees")
+
+    def test_generic_news_is_served_from_template(self):
+        research = self.research('Acme Corp', news_search(
+            "Acme Corp announces record Q4 earnings",
+            "Acme Corp wins major enterprise contracts",
+        ))
+        analysis = self.analysis_agent.execute(research)
+        self.assertEqual(analysis.analysis_status, 'completed')
+        self.assertEqual(analysis.analysis_source, 'industry_template')
+        self.assertTrue(analysis.key_challenges)
+
+    def test_specific_news_is_not_templated(self):
+        research = self.research('Acme Corp', news_search("Acme Corp acquires a robotics startup in Berlin"))
+        self.assertIsNone(self.analysis_agent._templated_analysis(research))
+
+
+if __name__ == '__main__':
+    unittest.main()
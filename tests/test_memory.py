@@ -0,0 +1,98 @@
+"""Tests for the SQLite memory bank"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from utils.memory import MemoryBank
+
+
+class MemoryBankStoragePathTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.json_path = os.path.join(self.tmp.name, "memory_bank.json")
+        with open(self.json_path, 'w') as f:
+            json.dump({
+                "company_acme": {
+                    "company_name": "Acme",
+                    "timestamp": "2024-01-01T00:00:00",
+                    "data": {"status": "success"}
+                }
+            }, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_json_storage_path_is_imported_into_a_database(self):
+        bank = MemoryBank(self.json_path)
+
+        self.assertEqual(bank.storage_path, os.path.join(self.tmp.name, "memory_bank.db"))
+        self.assertEqual(bank.get_company_research("Acme")["data"], {"status": "success"})
+        # The JSON file is left as it was
+        with open(self.json_path) as f:
+            self.assertIn("company_acme", json.load(f))
+
+    def test_non_sqlite_file_without_json_extension(self):
+        legacy_path = os.path.join(self.tmp.name, "memory_bank")
+        os.rename(self.json_path, legacy_path)
+
+        bank = MemoryBank(legacy_path)
+
+        self.assertEqual(bank.storage_path, legacy_path + ".db")
+        self.assertTrue(bank.has_company("Acme"))
+
+    def test_database_path_is_used_as_is(self):
+        db_path = os.path.join(self.tmp.name, "bank.db")
+        MemoryBank(db_path, legacy_json_path=None).store_stage("Acme", "research", {"company_name": "Acme"})
+
+        bank = MemoryBank(db_path, legacy_json_path=None)
+
+        self.assertEqual(bank.storage_path, db_path)
+        with sqlite3.connect(db_path) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM stages").fetchone()[0], 1)
+
+
+class MemoryBankStagesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.bank = MemoryBank(os.path.join(self.tmp.name, "bank.db"), legacy_json_path=None)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_company_lookups_see_pipeline_stages(self):
+        self.assertFalse(self.bank.has_company("Acme Corp"))
+
+        self.bank.store_stage("Acme Corp", "research", {"company_name": "Acme Corp", "company_info": {}})
+        self.bank.store_stage("Acme Corp", "analysis", {"company_name": "Acme Corp", "key_challenges": ["x"]})
+
+        self.assertTrue(self.bank.has_company("Acme Corp"))
+        entry = self.bank.get_company_research("Acme Corp")
+        self.assertEqual(entry["company_name"], "Acme Corp")
+        self.assertEqual(set(entry["data"]), {"research", "analysis"})
+        self.assertEqual(self.bank.get_all_companies(), ["Acme Corp"])
+
+    def test_archived_reports_are_still_listed(self):
+        self.bank.store_company_research("Globex", {"status": "success"})
+        self.bank.store_stage("Acme Corp", "research", {"company_name": "Acme Corp"})
+        self.bank.store_stage("Globex", "research", {"company_name": "Globex"})
+
+        self.assertEqual(sorted(self.bank.get_all_companies()), ["Acme Corp", "Globex"])
+        # Pipeline stages take precedence over the archived report
+        self.assertIn("research", self.bank.get_company_research("Globex")["data"])
+
+    def test_clear_company_removes_stages(self):
+        self.bank.store_stage("Acme Corp", "research", {"company_name": "Acme Corp"})
+        self.bank.clear_company("Acme Corp")
+
+        self.assertFalse(self.bank.has_company("Acme Corp"))
+        self.assertIsNone(self.bank.get_company_research("Acme Corp"))
+        self.assertEqual(self.bank.get_all_companies(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Tests for mapping batched outreach emails back onto contacts"""
+
+import json
+import unittest
+
+from agents.outreach_agent import OutreachAgent
+from utils.types import AnalysisResult
+
+CONTACTS = [
+    {'name': 'Jane Smith', 'title': 'CTO'},
+    {'name': 'Michael Chen', 'title': 'VP Engineering'},
+    {'name': 'Sarah Johnson', 'title': 'Head of IT'},
+]
+
+
+class ParseBatchEmailsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = OutreachAgent(client=object())
+        self.analysis = AnalysisResult('Acme', key_challenges=['Scaling infrastructure'])
+
+    def parse(self, generated):
+        return self.agent._parse_batch_emails(CONTACTS, self.analysis, 'Acme', json.dumps(generated))
+
+    def test_matches_reordered_emails_by_index(self):
+        emails = self.parse([
+            {'index': 3, 'recipient': 'Sarah', 'subject': 's3', 'body': 'for sarah'},
+            {'index': 1, 'recipient': 'Jane', 'subject': 's1', 'body': 'for jane'},
+            {'index': 2, 'recipient': 'Michael', 'subject': 's2', 'body': 'for michael'},
+        ])
+        self.assertEqual([email['body'] for email in emails], ['for jane', 'for michael', 'for sarah'])
+
+    def test_falls_back_to_recipient_name(self):
+        emails = self.parse([{'recipient': ' michael chen ', 'subject': 's', 'body': 'for michael'}])
+        self.assertEqual(emails[1]['body'], 'for michael')
+
+    def test_unmatched_contact_is_not_given_another_email(self):
+        emails = self.parse([
+            {'index': 1, 'recipient': 'Jane Smith', 'subject': 's1', 'body': 'for jane'},
+            {'recipient': 'Somebody Else', 'subject': 's', 'body': 'for somebody else'},
+        ])
+        self.assertEqual(emails[0]['body'], 'for jane')
+        for email in emails[1:]:
+            self.assertIn('error', email)
+            self.assertNotIn('body', email)
+
+
+if __name__ == '__main__':
+    unittest.main()
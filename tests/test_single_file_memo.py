@@ -0,0 +1,79 @@
+"""Tests for the single-file agents' prompt memo and use_cache"""
+
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import sales_agent_single_file as single_file
+
+ANALYSIS_TEXT = (
+    "KEY BUSINESS CHALLENGES\n1. Scale\nOPPORTUNITIES\n1. Automate\n"
+    "RECOMMENDED SALES APPROACH\nLead with ROI\n"
+)
+
+
+class FakeGemini:
+    """Counts Gemini calls; answers analysis prompts with fixed sections"""
+
+    def __init__(self):
+        self.calls = 0
+        self.models = SimpleNamespace(generate_content=self._generate)
+        self.aio = SimpleNamespace(models=SimpleNamespace(
+            generate_content=self._generate_async,
+            generate_content_stream=self._stream_async,
+        ))
+
+    def _generate(self, model, contents, config):
+        self.calls += 1
+        return SimpleNamespace(text=ANALYSIS_TEXT if 'KEY BUSINESS' in contents else "Email body")
+
+    async def _generate_async(self, model, contents, config):
+        return self._generate(model, contents, config)
+
+    async def _stream_async(self, model, contents, config):
+        text = self._generate(model, contents, config).text
+
+        async def chunks():
+            yield SimpleNamespace(text=text)
+        return chunks()
+
+
+class UseCacheMemoTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.gemini = FakeGemini()
+        with mock.patch.object(single_file, 'get_client', return_value=self.gemini):
+            self.orchestrator = single_file.SalesIntelligenceOrchestrator()
+
+    def tearDown(self):
+        self.orchestrator.memory_bank.flush()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_use_cache_false_ignores_memoized_responses(self):
+        self.orchestrator.process_company('Acme')
+        self.assertTrue(self.orchestrator.analysis_agent._memo)
+        self.assertTrue(self.orchestrator.outreach_agent._memo)
+        calls = self.gemini.calls
+        self.assertGreater(calls, 0)
+
+        self.orchestrator.process_company('Acme', use_cache=False)
+        self.assertEqual(self.gemini.calls, 2 * calls)
+
+    def test_use_cache_false_skips_memo_reads_and_writes(self):
+        self.orchestrator.process_company('Acme', use_cache=False)
+        self.assertEqual(self.orchestrator.analysis_agent._memo, {})
+        self.assertEqual(self.orchestrator.outreach_agent._memo, {})
+        calls = self.gemini.calls
+
+        self.orchestrator.process_company('Acme', use_cache=False)
+        self.assertEqual(self.gemini.calls, 2 * calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,10 +4,152 @@ Custom tool for web searching company information
 This satisfies the "Tools" requirement (custom tools)
 """
 
+import asyncio
+import weakref
+import contextlib
+import httpx
 import requests
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import List, Dict, Any, Iterable
 from utils.logger import agent_logger
 
+GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+# Searches search_all() can issue together, by result key
+SEARCH_KINDS = ('info', 'news', 'contacts')
+# Rate limiting (429) and transient server errors are retried with exponential backoff
+SEARCH_RETRIES = 3
+_RETRY_BACKOFF = 0.5
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def _create_session() -> requests.Session:
+    """Create a connection-pooled HTTP session for search API calls, retrying transient failures"""
+    session = requests.Session()
+    retry = Retry(
+        total=SEARCH_RETRIES,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUS_CODES,
+        allowed_methods=["GET"]
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=16, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared by every GoogleSearchTool instance (Research and Contact agents each
+# create one) so concurrent searches reuse kept-alive TLS connections
+_SESSION = _create_session()
+
+# Runs the blocking searches of search_all() side by side; sized to the session's connection pool
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='search')
+
+# Demo-mode results. Only the company name varies, so each call just fills in
+# {name} (and {slug}, the name as used in a domain) with str.format_map
+_SIMULATED_COMPANY_RESULTS = (
+    {
+        "title": "{name} - Official Website",
+        "snippet": "{name} is a leading technology company specializing in enterprise software solutions. Founded in 2010, the company serves Fortune 500 clients across multiple industries including finance, healthcare, and retail.",
+        "link": "https://www.{slug}.com"
+    },
+    {
+        "title": "{name} Company Profile | LinkedIn",
+        "snippet": "{name} | 10,000+ employees on LinkedIn. We provide innovative solutions that help businesses transform digitally. Industry: Technology, Software, Enterprise Solutions.",
+        "link": "https://www.linkedin.com/company/example"
+    },
+    {
+        "title": "About {name} - Company Overview",
+        "snippet": "{name} has raised $150M in Series C funding and serves over 2,000 enterprise clients worldwide. The company is headquartered in San Francisco with offices in New York, London, and Singapore.",
+        "link": "https://www.crunchbase.com/organization/example"
+    }
+)
+_SIMULATED_NEWS_RESULTS = (
+    {
+        "title": "{name} Announces Q3 Growth",
+        "snippet": "{name} reported 45% year-over-year revenue growth in Q3 2024, driven by strong enterprise adoption of their AI-powered platform.",
+        "link": "https://techcrunch.com/example",
+        "date": "2024-10-15"
+    },
+    {
+        "title": "{name} Expands to APAC Region",
+        "snippet": "{name} opens new offices in Singapore and Tokyo to support growing demand in Asia-Pacific markets.",
+        "link": "https://venturebeat.com/example",
+        "date": "2024-09-28"
+    }
+)
+_SIMULATED_CONTACT_RESULTS = (
+    {
+        "name": "Jane Smith",
+        "title": "CEO & Co-Founder",
+        "linkedin": "https://linkedin.com/in/janesmith",
+        "bio": "Former VP at Salesforce, 15+ years in enterprise software"
+    },
+    {
+        "name": "Michael Chen",
+        "title": "CTO",
+        "linkedin": "https://linkedin.com/in/michaelchen",
+        "bio": "Ex-Google engineer, AI/ML expert"
+    },
+    {
+        "name": "Sarah Johnson",
+        "title": "VP of Sales",
+        "linkedin": "https://linkedin.com/in/sarahjohnson",
+        "bio": "20+ years in enterprise sales, former Oracle executive"
+    }
+)
+
+
+def _render_results(templates: tuple, company_name: str) -> List[Dict[str, Any]]:
+    """Fresh result dicts from templates (callers may annotate them, so they are never shared)"""
+    fields = {"name": company_name, "slug": company_name.lower().replace(' ', '')}
+    return [{key: value.format_map(fields) for key, value in template.items()} for template in templates]
+
+# Async clients are bound to the event loop they first run on, so there is one
+# pooled client per loop. It is created on the loop's first search and closed
+# (and dropped from here) when the loop's last async_client_scope() exits
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+# Open async_client_scope() blocks per loop
+_ASYNC_CLIENT_SCOPES = weakref.WeakKeyDictionary()
+
+
+@contextlib.asynccontextmanager
+async def async_client_scope():
+    """
+    Scope of a run of async searches in the running event loop
+    The loop's pooled client is closed when the last open scope exits, so each
+    orchestrator run (which wraps itself in one) releases its connections
+    """
+    loop = asyncio.get_running_loop()
+    _ASYNC_CLIENT_SCOPES[loop] = _ASYNC_CLIENT_SCOPES.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _ASYNC_CLIENT_SCOPES[loop] -= 1
+        if not _ASYNC_CLIENT_SCOPES[loop]:
+            del _ASYNC_CLIENT_SCOPES[loop]
+            client = _ASYNC_CLIENTS.pop(loop, None)
+            if client is not None:
+                await client.aclose()
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the connection-pooled async HTTP client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=10,
+            # Connection failures only; status retries are in _google_search_async()
+            transport=httpx.AsyncHTTPTransport(
+                retries=SEARCH_RETRIES,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            )
+        )
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
 
 class GoogleSearchTool:
     """
@@ -67,33 +209,138 @@ class GoogleSearchTool:
         else:
             return self._simulated_contact_search(company_name)
     
+    def search_all(self, company_name: str, kinds: Iterable[str] = SEARCH_KINDS, news_limit: int = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several searches for a company concurrently over the pooled session
+        
+        Args:
+            company_name: Name of the company
+            kinds: Which searches to run (see SEARCH_KINDS)
+            news_limit: Limit passed to the news search
+            
+        Returns:
+            Search results keyed by kind; a search that raised is reported as
+            {"success": False, "error": ...} without failing the others
+        """
+        futures = {kind: _SEARCH_EXECUTOR.submit(*self._search_call(kind, company_name, news_limit)) for kind in kinds}
+        results = {}
+        for kind, future in futures.items():
+            try:
+                results[kind] = future.result()
+            except Exception as e:
+                agent_logger.log_error(f"search_all:{kind}", e)
+                results[kind] = {"success": False, "error": str(e)}
+        return results
+    
+    async def search_all_async(self, company_name: str, kinds: Iterable[str] = SEARCH_KINDS, news_limit: int = None) -> Dict[str, Dict[str, Any]]:
+        """Async variant of search_all() using the pooled async HTTP client"""
+        kinds = tuple(kinds)
+        outcomes = await asyncio.gather(
+            *(self._search_call_async(kind, company_name, news_limit) for kind in kinds),
+            return_exceptions=True
+        )
+        results = {}
+        for kind, outcome in zip(kinds, outcomes):
+            if isinstance(outcome, Exception):
+                agent_logger.log_error(f"search_all:{kind}", outcome)
+                outcome = {"success": False, "error": str(outcome)}
+            results[kind] = outcome
+        return results
+    
+    def _search_call(self, kind: str, company_name: str, news_limit: int = None) -> tuple:
+        """Function and arguments of the search for one kind, ready to submit to an executor"""
+        if kind == 'info':
+            return self.search_company_info, company_name
+        if kind == 'news':
+            return self.search_company_news, company_name, news_limit
+        if kind == 'contacts':
+            return self.search_company_contacts, company_name
+        raise ValueError(f"Unknown search kind: {kind}")
+    
+    def _search_call_async(self, kind: str, company_name: str, news_limit: int = None):
+        """Coroutine running the async search for one kind"""
+        if kind == 'info':
+            return self.search_company_info_async(company_name)
+        if kind == 'news':
+            return self.search_company_news_async(company_name, news_limit)
+        if kind == 'contacts':
+            return self.search_company_contacts_async(company_name)
+        raise ValueError(f"Unknown search kind: {kind}")
+    
+    async def search_company_info_async(self, company_name: str) -> Dict[str, Any]:
+        """Async variant of search_company_info() using the pooled async HTTP client"""
+        agent_logger.log_tool_call("search_company_info", {"company_name": company_name})
+        
+        if self.use_google_api:
+            return await self._google_search_async(f"{company_name} company overview")
+        else:
+            return self._simulated_company_search(company_name)
+    
+    async def search_company_news_async(self, company_name: str, limit: int = None) -> Dict[str, Any]:
+        """Async variant of search_company_news() using the pooled async HTTP client"""
+        agent_logger.log_tool_call("search_company_news", {"company_name": company_name, "limit": limit})
+        
+        if self.use_google_api:
+            return await self._google_search_async(f"{company_name} news recent")
+        else:
+            return self._simulated_news_search(company_name)
+    
+    async def search_company_contacts_async(self, company_name: str) -> Dict[str, Any]:
+        """Async variant of search_company_contacts() using the pooled async HTTP client"""
+        agent_logger.log_tool_call("search_company_contacts", {"company_name": company_name})
+        
+        if self.use_google_api:
+            return await self._google_search_async(f"{company_name} CEO executives leadership team")
+        else:
+            return self._simulated_contact_search(company_name)
+    
+    def _search_params(self, query: str) -> Dict[str, Any]:
+        """Query parameters for a Google Custom Search API call"""
+        return {
+            "key": self.api_key,
+            "cx": self.search_engine_id,
+            "q": query,
+            "num": 5  # Get top 5 results
+        }
+    
+    def _parse_search_results(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract title/snippet/link from a Google Custom Search API response"""
+        results = []
+        for item in data.get("items", []):
+            results.append({
+                "title": item.get("title", ""),
+                "snippet": item.get("snippet", ""),
+                "link": item.get("link", "")
+            })
+        
+        agent_logger.log_tool_result("google_search", f"Found {len(results)} results")
+        return {"success": True, "results": results}
+    
     def _google_search(self, query: str) -> Dict[str, Any]:
         """
         Perform actual Google Custom Search API call
         """
         try:
-            url = "https://www.googleapis.com/customsearch/v1"
-            params = {
-                "key": self.api_key,
-                "cx": self.search_engine_id,
-                "q": query,
-                "num": 5  # Get top 5 results
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            response = _SESSION.get(GOOGLE_SEARCH_URL, params=self._search_params(query), timeout=10)
             response.raise_for_status()
-            data = response.json()
-            
-            results = []
-            for item in data.get("items", []):
-                results.append({
-                    "title": item.get("title", ""),
-                    "snippet": item.get("snippet", ""),
-                    "link": item.get("link", "")
-                })
+            return self._parse_search_results(response.json())
             
-            agent_logger.log_tool_result("google_search", f"Found {len(results)} results")
-            return {"success": True, "results": results}
+        except Exception as e:
+            agent_logger.log_error("google_search", e)
+            return {"success": False, "error": str(e)}
+    
+    async def _google_search_async(self, query: str) -> Dict[str, Any]:
+        """Async variant of _google_search(), with the same retries as the sync session"""
+        try:
+            client = _get_async_client()
+            params = self._search_params(query)
+            for attempt in range(SEARCH_RETRIES + 1):
+                response = await client.get(GOOGLE_SEARCH_URL, params=params)
+                if response.status_code not in _RETRY_STATUS_CODES or attempt == SEARCH_RETRIES:
+                    break
+                await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+            response.raise_for_status()
+            return self._parse_search_results(response.json())
             
         except Exception as e:
             agent_logger.log_error("google_search", e)
@@ -104,68 +351,21 @@ class GoogleSearchTool:
         Simulated search results for demo purposes
         In production, this would be real API calls
         """
-        results = [
-            {
-                "title": f"{company_name} - Official Website",
-                "snippet": f"{company_name} is a leading technology company specializing in enterprise software solutions. Founded in 2010, the company serves Fortune 500 clients across multiple industries including finance, healthcare, and retail.",
-                "link": f"https://www.{company_name.lower().replace(' ', '')}.com"
-            },
-            {
-                "title": f"{company_name} Company Profile | LinkedIn",
-                "snippet": f"{company_name} | 10,000+ employees on LinkedIn. We provide innovative solutions that help businesses transform digitally. Industry: Technology, Software, Enterprise Solutions.",
-                "link": "https://www.linkedin.com/company/example"
-            },
-            {
-                "title": f"About {company_name} - Company Overview",
-                "snippet": f"{company_name} has raised $150M in Series C funding and serves over 2,000 enterprise clients worldwide. The company is headquartered in San Francisco with offices in New York, London, and Singapore.",
-                "link": "https://www.crunchbase.com/organization/example"
-            }
-        ]
+        results = _render_results(_SIMULATED_COMPANY_RESULTS, company_name)
         
         agent_logger.log_tool_result("simulated_search", f"Generated {len(results)} demo results")
         return {"success": True, "results": results, "demo_mode": True}
     
     def _simulated_news_search(self, company_name: str) -> Dict[str, Any]:
         """Simulated news search"""
-        results = [
-            {
-                "title": f"{company_name} Announces Q3 Growth",
-                "snippet": f"{company_name} reported 45% year-over-year revenue growth in Q3 2024, driven by strong enterprise adoption of their AI-powered platform.",
-                "link": "https://techcrunch.com/example",
-                "date": "2024-10-15"
-            },
-            {
-                "title": f"{company_name} Expands to APAC Region",
-                "snippet": f"{company_name} opens new offices in Singapore and Tokyo to support growing demand in Asia-Pacific markets.",
-                "link": "https://venturebeat.com/example",
-                "date": "2024-09-28"
-            }
-        ]
+        results = _render_results(_SIMULATED_NEWS_RESULTS, company_name)
         
         return {"success": True, "results": results, "demo_mode": True}
     
     def _simulated_contact_search(self, company_name: str) -> Dict[str, Any]:
         """Simulated contact search"""
-        results = [
-            {
-                "name": "Jane Smith",
-                "title": "CEO & Co-Founder",
-                "linkedin": "https://linkedin.com/in/janesmith",
-                "bio": "Former VP at Salesforce, 15+ years in enterprise software"
-            },
-            {
-                "name": "Michael Chen",
-                "title": "CTO",
-                "linkedin": "https://linkedin.com/in/michaelchen",
-                "bio": "Ex-Google engineer, AI/ML expert"
-            },
-            {
-                "name": "Sarah Johnson",
-                "title": "VP of Sales",
-                "linkedin": "https://linkedin.com/in/sarahjohnson",
-                "bio": "20+ years in enterprise sales, former Oracle executive"
-            }
-        ]
+        # No company-specific fields, but ContactAgent annotates each contact, so copy
+        results = [dict(template) for template in _SIMULATED_CONTACT_RESULTS]
         
         return {"success": True, "results": results, "demo_mode": True}
 
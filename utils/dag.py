@@ -0,0 +1,77 @@
+"""
+Task DAG Module
+Runs the pipeline as a graph of steps and their dependencies instead of a
+hardcoded sequence: each step starts as soon as the steps it depends on have
+finished, so wall-clock time follows the longest dependency chain
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+@dataclass(slots=True)
+class Node:
+    """
+    One step of a task graph
+    fn is called with the results of the depends_on nodes, keyed by node id,
+    and returns an awaitable producing this node's result
+    """
+    id: str
+    fn: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: List[str] = field(default_factory=list)
+
+
+async def run_dag(nodes: List[Node]) -> Dict[str, Any]:
+    """
+    Run every node once its dependencies are done, independent nodes concurrently
+    
+    Args:
+        nodes: Steps of the graph, in any order
+        
+    Returns:
+        Result of every node, keyed by node id
+        
+    Raises:
+        ValueError: If a node depends on an unknown node or the graph has a cycle
+        Exception: Whatever the first failing node raised; nodes still running are cancelled
+    """
+    by_id = {node.id: node for node in nodes}
+    dependents = {node.id: [] for node in nodes}
+    for node in nodes:
+        for dependency in node.depends_on:
+            if dependency not in by_id:
+                raise ValueError(f"Node '{node.id}' depends on unknown node '{dependency}'")
+            dependents[dependency].append(node.id)
+    
+    # Number of unfinished dependencies per node; a node starts when it reaches 0
+    waiting_on = {node.id: len(node.depends_on) for node in nodes}
+    results: Dict[str, Any] = {}
+    running: Dict[asyncio.Future, str] = {}
+    
+    def start(node_id: str):
+        node = by_id[node_id]
+        task = asyncio.ensure_future(node.fn({dependency: results[dependency] for dependency in node.depends_on}))
+        running[task] = node_id
+    
+    for node_id, count in waiting_on.items():
+        if count == 0:
+            start(node_id)
+    
+    try:
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node_id = running.pop(task)
+                results[node_id] = task.result()
+                for dependent in dependents[node_id]:
+                    waiting_on[dependent] -= 1
+                    if waiting_on[dependent] == 0:
+                        start(dependent)
+    finally:
+        for task in running:
+            task.cancel()
+    
+    if len(results) < len(nodes):
+        raise ValueError("Task graph has a dependency cycle")
+    return results
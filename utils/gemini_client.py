@@ -0,0 +1,29 @@
+"""
+Gemini Client Module
+Provides a single shared Gemini client for all LLM-backed agents
+Reusing one client keeps one HTTP connection pool across every Gemini call
+"""
+
+import os
+import functools
+from google import genai
+from google.genai import types
+
+# Per-request deadline so one slow Gemini call can't stall the whole pipeline
+TIMEOUT_SECONDS = float(os.getenv('TIMEOUT_SECONDS', 15))
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> genai.Client:
+    """
+    Return the process-wide Gemini client, creating it on first use
+    Raises ValueError if GOOGLE_API_KEY is not configured
+    """
+    api_key = os.getenv('GOOGLE_API_KEY')
+    if not api_key:
+        raise ValueError("GOOGLE_API_KEY not found in environment variables")
+    
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(timeout=int(TIMEOUT_SECONDS * 1000))  # milliseconds
+    )
@@ -0,0 +1,202 @@
+"""
+LLM Response Cache Module
+Exact-match cache for Gemini responses, persisted to a SQLite database
+Avoids paying for identical prompts across pipeline runs and retries
+"""
+
+import json
+import os
+import time
+import atexit
+import sqlite3
+import hashlib
+import functools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+from utils.logger import agent_logger
+
+# Whether LLMCache.get() may serve cached responses in the current context (see llm_cache_reads)
+_cache_reads: ContextVar[bool] = ContextVar('llm_cache_reads', default=True)
+
+
+@contextmanager
+def llm_cache_reads(enabled: bool = True):
+    """
+    Serve cached responses inside the block only if enabled
+    Responses are still stored when reads are off. Tasks and threads started
+    inside the block inherit the setting; a nested block cannot turn reads back on
+    """
+    token = _cache_reads.set(enabled and _cache_reads.get())
+    try:
+        yield
+    finally:
+        _cache_reads.reset(token)
+
+
+class LLMCache:
+    """
+    Exact-match cache for LLM responses
+    Keys are a SHA-256 of everything that affects the output
+    (model, system instruction, prompt, temperature, max tokens); entries
+    expire after a TTL and the least recently used are evicted past max_entries.
+    One row per response, so a store writes only that entry
+    """
+
+    def __init__(self, storage_path: str = "llm_cache.db", default_ttl: int = 86400, max_entries: int = 1000,
+                 legacy_json_path: str = "llm_cache.json"):
+        """
+        Initialize cache with SQLite storage
+
+        Args:
+            storage_path: SQLite database file
+            default_ttl: Lifetime of an entry in seconds
+            max_entries: Entries kept before the least recently used are evicted
+            legacy_json_path: JSON cache written by earlier versions, imported once if present
+        """
+        self.storage_path = storage_path
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        # Agents look up responses from worker threads as well as the event loop
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(storage_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+        self._import_legacy_json(legacy_json_path)
+        with self._lock:
+            # Kept in memory so a store doesn't have to count the table
+            self._size = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        self.stats = {'hits': 0, 'misses': 0}
+        atexit.register(self._log_stats)
+        agent_logger.info(f"🧠 LLM Cache loaded from {storage_path} ({self._size} entries)")
+
+    def _import_legacy_json(self, json_path: str):
+        """Copy entries from a JSON cache file into a new database (only ever once per database)"""
+        with self._lock:
+            # user_version marks the import as done, so a cleared cache is not refilled from the old file
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] >= 1:
+                return
+            try:
+                rows = []
+                if json_path and os.path.exists(json_path):
+                    with open(json_path, 'r') as f:
+                        entries = json.load(f)
+                    # The file kept entries in recency order, oldest first
+                    rows = [
+                        (key, entry['value'], entry['expires_at'], position)
+                        for position, (key, entry) in enumerate(entries.items())
+                    ]
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO entries (key, value, expires_at, last_used) VALUES (?, ?, ?, ?)", rows
+                    )
+                    self._conn.execute("PRAGMA user_version = 1")
+                if rows:
+                    agent_logger.info(f"🧠 Imported {len(rows)} LLM cache entries from {json_path}")
+            except Exception as e:
+                agent_logger.error(f"Failed to import LLM cache from {json_path}: {str(e)}")
+
+    def _log_stats(self):
+        """Log hit/miss counts (registered to run at interpreter exit)"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        if lookups:
+            agent_logger.info(
+                f"🧠 LLM Cache: {self.stats['hits']} hits, {self.stats['misses']} misses "
+                f"({self.stats['hits'] / lookups:.0%} hit rate)"
+            )
+
+    @staticmethod
+    def make_key(model: str, prompt: str, temperature: float, max_tokens: int, system_instruction: str = None) -> str:
+        """Build the cache key for a generation request from its canonical JSON form"""
+        payload = {
+            'model': model,
+            'system_instruction': system_instruction,
+            'prompt': prompt,
+            'temperature': temperature,
+            'max_tokens': max_tokens
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Retrieve a cached response
+        Returns None on a miss, if the entry has expired or if reads are off (see llm_cache_reads)
+        """
+        if not _cache_reads.get():
+            return None
+
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[1] < now:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._size -= 1
+                    row = None
+                if row is None:
+                    self.stats['misses'] += 1
+                    return None
+                # Recency for LRU eviction
+                self._conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+                self.stats['hits'] += 1
+        except Exception as e:
+            agent_logger.error(f"Failed to read LLM cache: {str(e)}")
+            return None
+
+        agent_logger.log_memory_access("LLM CACHE HIT", key[:12])
+        return row[0]
+
+    def set(self, key: str, value: str, ttl: int = None):
+        """Store a response in the cache"""
+        now = time.time()
+        expires_at = now + (ttl if ttl is not None else self.default_ttl)
+        try:
+            with self._lock, self._conn:
+                exists = self._conn.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                    (key, value, expires_at, now)
+                )
+                if exists is None:
+                    self._size += 1
+
+                # Evict least recently used entries
+                if self._size > self.max_entries:
+                    self._conn.execute(
+                        "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_used LIMIT ?)",
+                        (self._size - self.max_entries,)
+                    )
+                    self._size = self.max_entries
+        except Exception as e:
+            agent_logger.error(f"Failed to save LLM cache: {str(e)}")
+            return
+
+        agent_logger.log_memory_access("LLM CACHE STORE", key[:12])
+
+    def clear(self):
+        """Clear all cached responses"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+            self._size = 0
+        agent_logger.warning("🗑️ LLM Cache cleared")
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_cache() -> LLMCache:
+    """Return the cache shared by the LLM-backed agents, opening it on first use"""
+    return LLMCache()
+
+
+def __getattr__(name: str) -> Any:
+    """utils.llm_cache.llm_cache: the shared cache, for older callers of the former global"""
+    if name == 'llm_cache':
+        return get_llm_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,29 +4,51 @@ Provides structured logging for all agent activities
 This satisfies the "Observability" requirement
 """
 
+import os
+import queue
+import atexit
 import logging
+import logging.handlers
 import json
 from datetime import datetime
 from typing import Dict, Any
 
+try:
+    import orjson
+
+    def _dumps(data: Any) -> str:
+        """Compact JSON for log lines"""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:  # orjson is optional; the stdlib encoder produces the same compact text
+    def _dumps(data: Any) -> str:
+        """Compact JSON for log lines"""
+        return json.dumps(data)
+
+# Log level, e.g. LOG_LEVEL=DEBUG to include per-call tool and memory traces
+LOG_LEVEL = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO)
+
 class AgentLogger:
     """
     Custom logger for tracking agent activities
     Logs all agent actions, tool calls, and results
+    Agent phases are logged at INFO; per-call tool and memory traces are
+    DEBUG and are not even formatted unless DEBUG is enabled.
+    Log calls only enqueue the record: a background listener thread does the
+    formatting and the file/console writes, keeping I/O off the agents' path
     """
     
-    def __init__(self, log_file: str = "agent_execution.log"):
+    def __init__(self, log_file: str = "agent_execution.log", level: int = LOG_LEVEL):
         """Initialize logger with file and console output"""
         self.logger = logging.getLogger("SalesIntelligenceAgent")
-        self.logger.setLevel(logging.INFO)
+        self.logger.setLevel(level)
         
         # File handler - logs everything to file
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.INFO)
+        file_handler.setLevel(level)
         
         # Console handler - logs to terminal
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
+        console_handler.setLevel(level)
         
         # Format: timestamp - level - message
         formatter = logging.Formatter(
@@ -36,36 +58,47 @@ class AgentLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # The logger only enqueues; the listener writes to the real handlers
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self.listener.start()
+        # Flush whatever is still queued before the interpreter exits
+        atexit.register(self.listener.stop)
     
     def log_agent_start(self, agent_name: str, input_data: Dict[str, Any]):
         """Log when an agent starts execution"""
         self.logger.info(f"🚀 {agent_name} STARTED")
-        self.logger.info(f"Input: {json.dumps(input_data, indent=2)}")
+        self.logger.info(f"Input: {_dumps(input_data)}")
     
     def log_agent_end(self, agent_name: str, output_data: Dict[str, Any], duration: float):
         """Log when an agent completes execution"""
         self.logger.info(f"✅ {agent_name} COMPLETED in {duration:.2f}s")
-        self.logger.info(f"Output: {json.dumps(output_data, indent=2)}")
+        self.logger.info(f"Output: {_dumps(output_data)}")
     
     def log_tool_call(self, tool_name: str, parameters: Dict[str, Any]):
-        """Log when a tool is called"""
-        self.logger.info(f"🔧 Tool Call: {tool_name}")
-        self.logger.info(f"Parameters: {json.dumps(parameters, indent=2)}")
+        """Log when a tool is called (DEBUG)"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug("🔧 Tool Call: %s", tool_name)
+        self.logger.debug("Parameters: %s", _dumps(parameters))
     
     def log_tool_result(self, tool_name: str, result: Any):
-        """Log tool execution result"""
-        self.logger.info(f"📊 Tool Result: {tool_name}")
-        self.logger.info(f"Result: {str(result)[:200]}...")  # First 200 chars
+        """Log tool execution result (DEBUG)"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug("📊 Tool Result: %s", tool_name)
+        self.logger.debug("Result: %s...", str(result)[:200])  # First 200 chars
     
     def log_error(self, agent_name: str, error: Exception):
         """Log errors during agent execution"""
         self.logger.error(f"❌ ERROR in {agent_name}: {str(error)}")
     
     def log_memory_access(self, operation: str, key: str):
-        """Log memory operations"""
-        self.logger.info(f"💾 Memory {operation}: {key}")
+        """Log memory operations (DEBUG)"""
+        self.logger.debug("💾 Memory %s: %s", operation, key)
     
     def info(self, message: str):
         """General info logging"""
@@ -6,10 +6,23 @@ This satisfies "Sessions & Memory" and "Memory Bank" requirements
 
 import json
 import os
+import sqlite3
+import functools
+import threading
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from utils.logger import agent_logger
 
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:  # orjson is optional; the stdlib module reads and writes the same documents
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 
 class SessionMemory:
     """
@@ -69,105 +82,256 @@ class SessionMemory:
         agent_logger.info("🗑️ Session cleared")
 
 
+# First bytes of every SQLite database file
+_SQLITE_HEADER = b"SQLite format 3\x00"
+
+
+def _is_json_memory_file(path: str) -> bool:
+    """Whether path names a JSON memory bank (the pre-SQLite format) rather than a database"""
+    if path.endswith('.json'):
+        return True
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(len(_SQLITE_HEADER))
+    except OSError:
+        return False  # no file yet: a new database
+    return bool(header) and header != _SQLITE_HEADER
+
+
+@functools.lru_cache(maxsize=1024)
+def company_key(company_name: str) -> str:
+    """Canonical key for a company name (memoized: batch runs repeat names)"""
+    return f"company_{company_name.lower().replace(' ', '_')}"
+
+
 class MemoryBank:
     """
-    Long-term memory storage using JSON files
-    Stores historical data across sessions
+    Long-term memory storage in a SQLite database
+    Stores historical data across sessions, one row per company, so a store
+    writes only that company's entry instead of rewriting the whole bank.
+    Entries are paged in on demand through a bounded in-memory LRU cache.
+    The pipeline keeps each stage's output per (company, stage) so a later run
+    can reuse the stages that are still fresh; the company lookups below read
+    those stages, falling back to reports archived with store_company_research.
     This is the "Memory Bank" requirement
     """
     
-    def __init__(self, storage_path: str = "memory_bank.json"):
-        """Initialize memory bank with file storage"""
+    # Companies whose entries (or absence) are kept in memory
+    CACHE_SIZE = 256
+    
+    def __init__(self, storage_path: str = "memory_bank.db", legacy_json_path: str = "memory_bank.json"):
+        """
+        Initialize memory bank with SQLite storage
+        
+        Args:
+            storage_path: SQLite database file. A JSON memory bank path (what this
+                argument used to take) is imported into the .db file beside it
+            legacy_json_path: JSON memory bank written by earlier versions, imported once if present
+        """
+        if _is_json_memory_file(storage_path):
+            legacy_json_path = storage_path
+            storage_path = os.path.splitext(storage_path)[0] + ".db"
+            agent_logger.warning(f"⚠️ {legacy_json_path} is a JSON memory bank; using {storage_path} and importing it")
         self.storage_path = storage_path
-        self.memory = self._load_memory()
+        # The orchestrator may store from worker threads; the lock serializes use of the connection
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(storage_path, check_same_thread=False)
+        # Per instance, so clearing one bank's cache leaves other banks alone
+        self._get_by_key = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._load_by_key)
+        with self._lock, self._conn:
+            # WAL + NORMAL: durable commits without an fsync of the whole file per write
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS companies ("
+                "key TEXT PRIMARY KEY, company_name TEXT NOT NULL, data TEXT NOT NULL, ts TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS stages ("
+                "key TEXT NOT NULL, stage TEXT NOT NULL, data TEXT NOT NULL, ts TEXT NOT NULL, "
+                "PRIMARY KEY (key, stage))"
+            )
+        self._import_legacy_json(legacy_json_path)
         agent_logger.info(f"💾 Memory Bank loaded from {storage_path}")
     
-    def _load_memory(self) -> Dict[str, Any]:
-        """Load memory from JSON file"""
-        if os.path.exists(self.storage_path):
+    # Storage key for a company name
+    _key = staticmethod(company_key)
+    
+    def _load_by_key(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read one entry from the database (cached as _get_by_key)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT company_name, ts, data FROM companies WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"company_name": row[0], "timestamp": row[1], "data": json_loads(row[2])}
+    
+    def _import_legacy_json(self, json_path: str):
+        """Copy entries from a JSON memory bank file into a new database (only ever once per database)"""
+        with self._lock:
+            # user_version marks the import as done, so a cleared bank is not refilled from the old file
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] >= 1:
+                return
             try:
-                with open(self.storage_path, 'r') as f:
-                    return json.load(f)
+                rows = []
+                if json_path and os.path.exists(json_path):
+                    with open(json_path, 'r') as f:
+                        memory = json.load(f)
+                    rows = [
+                        (key, entry["company_name"], json_dumps(entry["data"]), entry["timestamp"])
+                        for key, entry in memory.items() if key.startswith("company_")
+                    ]
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO companies (key, company_name, data, ts) VALUES (?, ?, ?, ?)", rows
+                    )
+                    self._conn.execute("PRAGMA user_version = 1")
+                if rows:
+                    agent_logger.info(f"💾 Imported {len(rows)} entries from {json_path}")
             except Exception as e:
-                agent_logger.error(f"Failed to load memory: {str(e)}")
-                return {}
-        return {}
-    
-    def _save_memory(self):
-        """Save memory to JSON file"""
-        try:
-            with open(self.storage_path, 'w') as f:
-                json.dump(self.memory, f, indent=2)
-            agent_logger.info("💾 Memory Bank saved")
-        except Exception as e:
-            agent_logger.error(f"Failed to save memory: {str(e)}")
+                agent_logger.error(f"Failed to import memory from {json_path}: {str(e)}")
     
     def store_company_research(self, company_name: str, research_data: Dict[str, Any]):
         """
         Store research results for a company
         Prevents re-researching the same company
         """
-        key = f"company_{company_name.lower().replace(' ', '_')}"
-        self.memory[key] = {
-            "company_name": company_name,
-            "timestamp": datetime.now().isoformat(),
-            "data": research_data
-        }
-        self._save_memory()
+        key = self._key(company_name)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO companies (key, company_name, data, ts) VALUES (?, ?, ?, ?)",
+                    (key, company_name, json_dumps(research_data), datetime.now().isoformat())
+                )
+        except Exception as e:
+            agent_logger.error(f"Failed to save memory: {str(e)}")
+            return
+        finally:
+            self._get_by_key.cache_clear()
         agent_logger.log_memory_access("STORE", key)
     
     def get_company_research(self, company_name: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve stored research for a company
+        Pipeline runs yield {"company_name", "timestamp", "data": {stage: output}}
+        from the stored stages; otherwise the archived report entry is returned.
         Returns None if not found
         """
-        key = f"company_{company_name.lower().replace(' ', '_')}"
-        data = self.memory.get(key)
+        key = self._key(company_name)
+        data = self._stages_entry(key) or self._get_by_key(key)
         
         if data:
             agent_logger.info(f"✅ Found cached research for {company_name}")
             agent_logger.log_memory_access("RETRIEVE", key)
         else:
             agent_logger.info(f"❌ No cached research for {company_name}")
+            return None
         
-        return data
+        # Shallow copy so callers can't replace fields of the cached entry
+        return dict(data)
+    
+    def store_stage(self, company_name: str, stage: str, data: Dict[str, Any]):
+        """Store one pipeline stage's output for a company (e.g. stage='research')"""
+        key = self._key(company_name)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO stages (key, stage, data, ts) VALUES (?, ?, ?, ?)",
+                    (key, stage, json_dumps(data), datetime.now().isoformat())
+                )
+        except Exception as e:
+            agent_logger.error(f"Failed to save {stage} stage: {str(e)}")
+            return
+        agent_logger.log_memory_access(f"STORE {stage}", key)
+    
+    def get_stage(self, company_name: str, stage: str, max_age: Optional[timedelta] = None) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve one pipeline stage's stored output for a company
+        Returns None if not found or older than max_age
+        """
+        key = self._key(company_name)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, ts FROM stages WHERE key = ? AND stage = ?", (key, stage)
+            ).fetchone()
+        if row is None:
+            return None
+        if max_age is not None and datetime.now() - datetime.fromisoformat(row[1]) > max_age:
+            return None
+        
+        agent_logger.log_memory_access(f"RETRIEVE {stage}", key)
+        return json_loads(row[0])
+    
+    def _stages_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """A company's stored stage outputs as one entry, or None if it has none"""
+        with self._lock:
+            rows = self._conn.execute("SELECT stage, data, ts FROM stages WHERE key = ?", (key,)).fetchall()
+        if not rows:
+            return None
+        stages = {stage: json_loads(data) for stage, data, _ in rows}
+        company_name = next(iter(stages.values())).get("company_name")
+        return {"company_name": company_name, "timestamp": max(ts for _, _, ts in rows), "data": stages}
     
     def has_company_research(self, company_name: str) -> bool:
-        """Check if we have research for a company"""
-        key = f"company_{company_name.lower().replace(' ', '_')}"
-        return key in self.memory
+        """Check if we have research for a company (stored stages or an archived report)"""
+        key = self._key(company_name)
+        with self._lock:
+            has_stages = self._conn.execute("SELECT 1 FROM stages WHERE key = ? LIMIT 1", (key,)).fetchone()
+        return has_stages is not None or self._get_by_key(key) is not None
     
     def has_company(self, company_name: str) -> bool:
         """Check if we have research for a company (alias)"""
         return self.has_company_research(company_name)
     
     def get_all_companies(self) -> list:
-        """Get list of all researched companies"""
-        companies = [
-            v["company_name"] 
-            for k, v in self.memory.items() 
-            if k.startswith("company_")
-        ]
-        return companies
+        """Get list of all researched companies (with stored stages or an archived report)"""
+        with self._lock:
+            # Every stage output carries the company_name it was produced for
+            rows = self._conn.execute(
+                "SELECT company_name FROM companies "
+                "UNION "
+                "SELECT json_extract(data, '$.company_name') FROM stages "
+                "WHERE key NOT IN (SELECT key FROM companies) GROUP BY key"
+            ).fetchall()
+        return [company_name for (company_name,) in rows]
     
     def clear_company(self, company_name: str):
         """Remove a company from memory"""
-        key = f"company_{company_name.lower().replace(' ', '_')}"
-        if key in self.memory:
-            del self.memory[key]
-            self._save_memory()
+        key = self._key(company_name)
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM companies WHERE key = ?", (key,)).rowcount
+            deleted += self._conn.execute("DELETE FROM stages WHERE key = ?", (key,)).rowcount
+        self._get_by_key.cache_clear()
+        if deleted:
             agent_logger.log_memory_access("DELETE", key)
     
     def clear_all(self):
         """Clear all memory"""
-        self.memory = {}
-        self._save_memory()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM companies")
+            self._conn.execute("DELETE FROM stages")
+        self._get_by_key.cache_clear()
         agent_logger.warning("🗑️ Memory Bank cleared completely")
 
 
-# Global instances
-session_memory = SessionMemory()
-memory_bank = MemoryBank()
-
 # Aliases for backward compatibility
-SessionState = SessionMemory
\ No newline at end of file
+SessionState = SessionMemory
+
+# Global instances, created on first access (utils.memory.memory_bank) rather
+# than at import, so importing the module opens no database and logs nothing
+_global_instances: Dict[str, Any] = {}
+_global_factories = {
+    'session_memory': SessionMemory,
+    'memory_bank': MemoryBank,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Create the session_memory / memory_bank globals on first access"""
+    factory = _global_factories.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name not in _global_instances:
+        _global_instances[name] = factory()
+    return _global_instances[name]
\ No newline at end of file
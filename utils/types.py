@@ -0,0 +1,55 @@
+"""
+Result Types Module
+Typed results handed from one pipeline agent to the next
+Slotted dataclasses keep per-company results compact while many companies are
+in flight; they are converted to plain dicts (dataclasses.asdict) only where
+they leave the pipeline, i.e. in session state and the final report
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True)
+class ResearchResult:
+    """Output of ResearchAgent"""
+    company_name: str
+    company_info: Dict[str, Any] = field(default_factory=dict)
+    # Raw news search results as returned by the search tool
+    recent_news: Any = field(default_factory=list)
+    research_status: str = 'completed'
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class AnalysisResult:
+    """Output of AnalysisAgent"""
+    company_name: str
+    analysis: str = ''
+    key_challenges: List[str] = field(default_factory=list)
+    opportunities: List[str] = field(default_factory=list)
+    recommended_approach: str = ''
+    analysis_status: str = 'completed'
+    # 'industry_template' when served from configs/industry_analysis.json
+    analysis_source: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ContactResult:
+    """Output of ContactAgent"""
+    company_name: str
+    total_contacts_found: int = 0
+    prioritized_contacts: List[Dict[str, Any]] = field(default_factory=list)
+    contact_status: str = 'completed'
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class OutreachResult:
+    """Output of OutreachAgent"""
+    company_name: str
+    emails_generated: int = 0
+    outreach_emails: List[Dict[str, Any]] = field(default_factory=list)
+    outreach_status: str = 'completed'
+    error: Optional[str] = None